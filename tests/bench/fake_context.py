@@ -0,0 +1,115 @@
+"""
+In-process stand-ins for Playwright's APIRequestContext, for benchmarks.
+
+Responses are built from pre-serialized bytes without sockets, threads or a
+server, so a benchmark through FakeRequestContext measures the framework's own
+cost: the client, hooks, parsing and helpers. The contact list holds `contacts`
+synthetic contacts and serves them page by page like GET /contacts?page=&limit=.
+"""
+import itertools
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+_JSON = {"content-type": "application/json; charset=utf-8"}
+
+
+class FakeAPIResponse:
+    """Quacks like playwright.sync_api.APIResponse."""
+
+    __slots__ = ("status", "status_text", "url", "headers", "_body")
+
+    def __init__(self, status: int, url: str, body: bytes = b"", headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.status_text = "OK" if status < 400 else "Error"
+        self.url = url
+        self.headers = headers if headers is not None else {**_JSON, "content-length": str(len(body))}
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self._body)
+
+    def dispose(self) -> None:
+        self._body = b""
+
+
+def synthetic_contacts(n: int) -> List[Dict[str, Any]]:
+    return [
+        {"_id": f"{i:024x}", "firstName": f"Test{i}", "lastName": "User", "email": f"c{i}@example.com", "owner": "0" * 24, "__v": 0}
+        for i in range(n)
+    ]
+
+
+class FakeRequestContext:
+    """
+    Answers /users/login, /contacts (list and create) and /contacts/{id}
+    (get, put, patch, delete) from canned bytes.
+    """
+
+    def __init__(self, contacts: int = 0, base_url: str = "http://fake.local"):
+        self.base_url = base_url
+        self.contacts = synthetic_contacts(contacts)
+        self._pages: Dict[Tuple[int, int], bytes] = {}
+        self._contact = json.dumps(synthetic_contacts(1)[0]).encode()
+        self._ids = itertools.count(10 ** 6)
+        self.requests = 0
+
+    def _page(self, page: int, limit: int) -> bytes:
+        key = (page, limit)
+        if key not in self._pages:
+            self._pages[key] = json.dumps(self.contacts[(page - 1) * limit:page * limit]).encode()
+        return self._pages[key]
+
+    def fetch(self, url: str, method: str = "GET", headers=None, params=None, data=None, **kwargs) -> FakeAPIResponse:
+        self.requests += 1
+        full = self.base_url + url
+        path = url.split("?", 1)[0]
+        if path == "/users/login":
+            return FakeAPIResponse(200, full, b'{"user": {"_id": "0"}, "token": "fake-token"}')
+        if path == "/contacts":
+            if method == "POST":
+                return FakeAPIResponse(201, full, b'{"_id": "%024x", "__v": 0}' % next(self._ids))
+            params = params or {}
+            return FakeAPIResponse(200, full, self._page(int(params.get("page", 1)), int(params.get("limit", 100))))
+        if method == "DELETE":
+            return FakeAPIResponse(200, full, b"Contact deleted", {"content-type": "text/html; charset=utf-8"})
+        return FakeAPIResponse(200, full, self._contact)
+
+    def dispose(self) -> None:
+        pass
+
+
+class AsyncFakeAPIResponse(FakeAPIResponse):
+    """Async flavour: body()/text()/json()/dispose() are coroutines, as in playwright.async_api."""
+
+    __slots__ = ()
+
+    async def body(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode("utf-8")
+
+    async def json(self) -> Any:
+        return json.loads(self._body)
+
+    async def dispose(self) -> None:
+        self._body = b""
+
+
+class AsyncFakeRequestContext(FakeRequestContext):
+    async def fetch(self, url: str, method: str = "GET", **kwargs) -> AsyncFakeAPIResponse:
+        resp = super().fetch(url, method=method, **kwargs)
+        return AsyncFakeAPIResponse(resp.status, resp.url, resp._body, resp.headers)
+
+    async def dispose(self) -> None:
+        pass
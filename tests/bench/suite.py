@@ -0,0 +1,244 @@
+"""
+Microbenchmarks for the framework's own hot paths (no network, no server).
+
+    python -m tests.bench                       # run everything, compare with the baseline
+    python -m tests.bench --save                # ... and store the results as the new baseline
+    python -m tests.bench -k client --max-regression 10
+
+Every benchmark runs against FakeRequestContext (tests/bench/fake_context.py), so
+the numbers are framework overhead only: client verbs (header merging, JSON
+encoding, hooks), response helpers, factories, list searching and the work
+contact_resource does around each test. Timing follows timeit: the loop count is
+calibrated to about 0.2 s, the best of --repeat runs is kept, and results are
+microseconds per call.
+
+Baselines are machine-specific; keep them out of version control. The command
+exits with status 1 when a benchmark is more than --max-regression percent
+slower than its baseline.
+"""
+import argparse
+import itertools
+import json
+import platform
+import sys
+import tempfile
+import timeit
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tests.bench.fake_context import AsyncFakeRequestContext, FakeAPIResponse, FakeRequestContext
+from tests.factories import generate_contact_payload, generate_contact_payloads
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.async_api_client import AsyncApiClient
+from tests.tests_api.clients.response import ApiResponse
+from tests.tests_api.helpers.async_loop import LoopThread
+from tests.tests_api.helpers.cleanup import CleanupQueue, PendingStore
+from tests.tests_api.helpers.contact_pool import ContactPool
+from tests.tests_api.helpers.list_search import find_in_contacts_list
+from tests.utils import safe_json, text_or_json
+
+DEFAULT_BASELINE = "reports/bench_baseline.json"
+TOKEN = "fake-token"
+DRAIN_EVERY = 50  # contact_resource[exclusive]: calls between cleanup drains
+
+# name -> setup(stack) returning the zero-argument function to time
+Setup = Callable[[ExitStack], Callable[[], Any]]
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str):
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+# ---- ApiClient verbs ----
+@benchmark("client.get")
+def _client_get(stack):
+    client = ApiClient(FakeRequestContext())
+    return lambda: client.get("/contacts/000000000000000000000001", token=TOKEN)
+
+
+@benchmark("client.get+hook")
+def _client_get_hooked(stack):
+    client = ApiClient(FakeRequestContext(), hooks=[lambda record: None])
+    return lambda: client.get("/contacts/000000000000000000000001", token=TOKEN)
+
+
+@benchmark("client.get+json")
+def _client_get_json(stack):
+    client = ApiClient(FakeRequestContext())
+    return lambda: client.get("/contacts/000000000000000000000001", token=TOKEN).json()
+
+
+@benchmark("client.post.json")
+def _client_post_json(stack):
+    client = ApiClient(FakeRequestContext())
+    payload = generate_contact_payload()
+    return lambda: client.post("/contacts", token=TOKEN, json=payload, headers={"X-Trace": "1"})
+
+
+@benchmark("client.post.bytes")
+def _client_post_bytes(stack):
+    client = ApiClient(FakeRequestContext())
+    body = generate_contact_payloads(1, as_bytes=True)[0]
+    return lambda: client.post("/contacts", token=TOKEN, json=body)
+
+
+# ---- response helpers ----
+def _contact_response() -> FakeAPIResponse:
+    return FakeRequestContext().fetch("/contacts/000000000000000000000001")
+
+
+@benchmark("utils.safe_json")
+def _safe_json(stack):
+    raw = _contact_response()
+    return lambda: safe_json(ApiResponse(raw))
+
+
+@benchmark("utils.text_or_json")
+def _text_or_json(stack):
+    raw = _contact_response()
+    return lambda: text_or_json(ApiResponse(raw))
+
+
+# ---- factories ----
+@benchmark("factories.generate_contact_payload")
+def _payload(stack):
+    return generate_contact_payload
+
+
+@benchmark("factories.generate_contact_payloads[100]")
+def _payloads(stack):
+    return lambda: generate_contact_payloads(100)
+
+
+# ---- list search: last of 10,000 contacts, 100 pages ----
+@benchmark("list_search.find_in_contacts_list[10k]")
+def _find(stack):
+    ctx = FakeRequestContext(contacts=10_000)
+    client = ApiClient(ctx)
+    target = ctx.contacts[-1]["_id"]
+    return lambda: find_in_contacts_list(client, TOKEN, created_id=target, page_size=100, max_pages=100)
+
+
+# ---- contact_resource: the fixture's work around a test ----
+def _cleanup_queue(stack) -> Tuple[LoopThread, AsyncApiClient, CleanupQueue]:
+    """The session objects behind contact_resource: async loop and client, and a cleanup queue persisting to a temp dir."""
+    loop = LoopThread(name="bench-loop")
+    stack.callback(loop.stop)
+    client = AsyncApiClient(AsyncFakeRequestContext())
+    directory = stack.enter_context(tempfile.TemporaryDirectory())
+    queue = CleanupQueue(loop, client, TOKEN, store=PendingStore(directory, account="bench"))
+    stack.callback(queue.drain)
+    return loop, client, queue
+
+
+@benchmark("fixture.contact_resource[shared]")
+def _resource_shared(stack):
+    loop, client, queue = _cleanup_queue(stack)
+    pool = ContactPool(loop, client, TOKEN, size=4, cleanup=queue)
+    pool.fill()
+
+    def lease():
+        resource = pool.lease()
+        return {"id": resource["id"], "payload": dict(resource["payload"])}
+
+    return lease
+
+
+@benchmark("fixture.contact_resource[exclusive]")
+def _resource_exclusive(stack):
+    _, _, queue = _cleanup_queue(stack)
+    client = ApiClient(FakeRequestContext())
+    calls = itertools.count(1)
+
+    def create_and_release():
+        payload = generate_contact_payload()
+        cid = client.post("/contacts", token=TOKEN, json=payload).json()["_id"]
+        queue.register(cid)
+        queue.release(cid)
+        if next(calls) % DRAIN_EVERY == 0:
+            # settle the background deletes so every loop starts from an empty queue
+            # and pays for its own deletes instead of inheriting a backlog
+            queue.drain()
+
+    return create_and_release
+
+
+# ---- running ----
+def measure(fn: Callable[[], Any], repeat: int = 5, quick: bool = False) -> float:
+    """Best time per call in microseconds."""
+    timer = timeit.Timer(fn)
+    if quick:
+        return timer.timeit(1) * 1e6
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat, loops)) / loops * 1e6
+
+
+def run(names: Optional[List[str]] = None, repeat: int = 5, quick: bool = False) -> Dict[str, float]:
+    results = {}
+    for name in names or list(BENCHMARKS):
+        with ExitStack() as stack:
+            results[name] = round(measure(BENCHMARKS[name](stack), repeat=repeat, quick=quick), 3)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], max_regression: float) -> List[str]:
+    """Names of benchmarks more than `max_regression` percent slower than their baseline."""
+    return [
+        name for name, us in results.items()
+        if baseline.get(name) and us > baseline[name] * (1 + max_regression / 100.0)
+    ]
+
+
+def load_baseline(path: Path) -> Dict[str, float]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("results", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(path: Path, results: Dict[str, float]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"python": platform.python_version(), "machine": platform.machine(), "node": platform.node()}
+    path.write_text(json.dumps({**meta, "results": results}, indent=2), encoding="utf-8")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.bench", description="Benchmark the framework's hot paths.")
+    parser.add_argument("-k", dest="keyword", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per benchmark; the best is kept (default: 5)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help=f"baseline JSON file (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    parser.add_argument(
+        "--max-regression", type=float, default=20.0, help="fail when slower than baseline by this many percent (default: 20)"
+    )
+    parser.add_argument("--quick", action="store_true", help="one call per benchmark (smoke test, numbers are meaningless)")
+    args = parser.parse_args(argv)
+
+    names = [n for n in BENCHMARKS if args.keyword is None or args.keyword in n]
+    if not names:
+        parser.error(f"no benchmark matches {args.keyword!r}")
+    results = run(names, repeat=args.repeat, quick=args.quick)
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    regressions = compare(results, baseline, args.max_regression)
+
+    print(f"{'benchmark':<44}{'us/call':>12}{'baseline':>12}{'change':>9}")
+    for name, us in results.items():
+        base = baseline.get(name)
+        change = f"{100 * (us / base - 1):+.1f}%" if base else "-"
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<44}{us:>12.3f}{f'{base:.3f}' if base else '-':>12}{change:>9}{flag}")
+
+    if args.save and not args.quick:
+        save_baseline(baseline_path, {**baseline, **results})
+        print(f"baseline saved to {baseline_path}")
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.max_regression:g}%", file=sys.stderr)
+        return 1
+    return 0
@@ -1,10 +1,105 @@
+"""
+Single source of configuration for the test framework.
+
+Settings come from the environment, with the repo-root .env loaded once, on first
+access. Use `get_settings()` or the module attributes, which are resolved lazily
+(`from tests.config import API_BASE_URL` works as before):
+
+    from tests.config import get_settings
+    settings = get_settings()
+    settings.API_BASE_URL
+"""
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 import os
 
 ROOT = Path(__file__).resolve().parents[1]
-load_dotenv(ROOT / ".env")
 
-API_BASE_URL = os.getenv("API_BASE_URL", "https://thinking-tester-contact-list.herokuapp.com")
-TEST_USER_EMAIL = os.getenv("TEST_USER_EMAIL")
-TEST_USER_PASS = os.getenv("TEST_USER_PASS")
+LOCAL_USER_EMAIL = "local_user@example.com"
+LOCAL_USER_PASS = "LocalPass123!"
+
+
+def _flag(name: str, default: str = "0") -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+class Settings:
+    """Snapshot of the framework settings, read once from the environment / .env."""
+
+    def __init__(self):
+        self.API_BASE_URL = os.getenv("API_BASE_URL", "https://thinking-tester-contact-list.herokuapp.com")
+        self.TEST_USER_EMAIL = os.getenv("TEST_USER_EMAIL")
+        self.TEST_USER_PASS = os.getenv("TEST_USER_PASS")
+
+        # Upper bound on in-flight requests for AsyncApiClient batch helpers
+        self.API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "8"))
+        # Number of request contexts (one thread + driver each) behind pooled_api_client
+        self.API_CONTEXT_POOL_SIZE = int(os.getenv("API_CONTEXT_POOL_SIZE", "4"))
+        # AIMD limiter in front of the clients (see clients/concurrency.py); enable with
+        # API_ADAPTIVE_CONCURRENCY=1 or --adaptive-concurrency. Throttled idempotent calls are retried up to API_MAX_RETRIES times.
+        self.API_ADAPTIVE_CONCURRENCY = _flag("API_ADAPTIVE_CONCURRENCY")
+        self.API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+        # JSON codec for request/response bodies: auto (orjson if installed), orjson or json
+        self.API_JSON_CODEC = os.getenv("API_JSON_CODEC", "auto")
+        # Conditional-GET response cache in ApiClient (see clients/http_cache.py); enable with
+        # API_HTTP_CACHE=1 or --http-cache. API_HTTP_CACHE_MB bounds the cached bodies.
+        self.API_HTTP_CACHE = _flag("API_HTTP_CACHE")
+        self.API_HTTP_CACHE_MB = float(os.getenv("API_HTTP_CACHE_MB", "8"))
+        # Buffer response bodies and dispose the Playwright responses as soon as a call returns,
+        # so the driver does not keep every body of the session. API_RELEASE_BODIES=0 keeps them.
+        self.API_RELEASE_BODIES = _flag("API_RELEASE_BODIES", "1")
+        # Shared contacts pre-created for read-only contact tests
+        self.CONTACT_POOL_SIZE = int(os.getenv("CONTACT_POOL_SIZE", "4"))
+
+        # Start-up sweep of contacts left behind by crashed runs (see helpers/cleanup.py). Tagged contacts
+        # of other runs are only deleted once that run is ORPHAN_MIN_AGE_MIN minutes old.
+        self.ORPHAN_SWEEP = _flag("ORPHAN_SWEEP", "1")
+        self.ORPHAN_MIN_AGE_MIN = float(os.getenv("ORPHAN_MIN_AGE_MIN", "120"))
+        self.ORPHAN_SWEEP_MAX_PAGES = int(os.getenv("ORPHAN_SWEEP_MAX_PAGES", "10"))
+
+        # Local stand-in for the Contact List API (see tests/tests_api/stub/local_api.py).
+        # Enable with LOCAL_API=1 in .env or `pytest --local-api`.
+        self.LOCAL_API = _flag("LOCAL_API")
+        self.LOCAL_API_LATENCY_MS = float(os.getenv("LOCAL_API_LATENCY_MS", "0"))
+        self.LOCAL_API_JITTER_MS = float(os.getenv("LOCAL_API_JITTER_MS", "0"))
+        self.LOCAL_API_ERROR_RATE = float(os.getenv("LOCAL_API_ERROR_RATE", "0"))
+        self.LOCAL_API_SEED = int(os.getenv("LOCAL_API_SEED", "1234"))
+        self.LOCAL_USER_EMAIL = LOCAL_USER_EMAIL
+        self.LOCAL_USER_PASS = LOCAL_USER_PASS
+
+        # Parallel runs (pytest-xdist): give every worker its own test user, derived from
+        # TEST_USER_EMAIL as <local>+<worker>@<domain>. Enable with PER_WORKER_USERS=1 or --per-worker-users.
+        self.PER_WORKER_USERS = _flag("PER_WORKER_USERS")
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.TEST_USER_EMAIL and self.TEST_USER_PASS)
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load .env (once) and return the cached Settings."""
+    from dotenv import load_dotenv
+
+    load_dotenv(ROOT / ".env")
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Lazy module attributes: tests.config.API_BASE_URL -> get_settings().API_BASE_URL
+    if name.isupper():
+        settings = get_settings()
+        if hasattr(settings, name):
+            return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def worker_id() -> str:
+    """pytest-xdist worker name ("gw0", "gw1", ...) or "master" when not running under xdist."""
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def worker_user_email(email: str, worker: str) -> str:
+    """Derive a per-worker email address: "qa@example.com" -> "qa+gw0@example.com"."""
+    local, _, domain = email.partition("@")
+    return f"{local}+{worker}@{domain}"
@@ -4,6 +4,72 @@
 import logging
 import pytest
 
+from tests.config import get_settings
+from tests.factories import current_run_id
+from tests.tests_api.clients.codec import use_codec
+
+pytest_plugins = [
+    "tests.plugins.request_timing",
+    "tests.plugins.cassette",
+    "tests.plugins.startup_timing",
+    "tests.plugins.results_stream",
+    "tests.plugins.request_capture",
+    "tests.plugins.latency",
+    "tests.plugins.scheduling",
+    "tests.plugins.soak",
+]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api", "API test framework")
+    group.addoption(
+        "--local-api",
+        action="store_true",
+        default=False,
+        help="Run API tests against the bundled in-process Contact List API stand-in instead of API_BASE_URL.",
+    )
+    group.addoption(
+        "--no-token-cache",
+        action="store_true",
+        default=False,
+        help="Always log in instead of reusing auth tokens cached in the pytest cache dir.",
+    )
+    group.addoption(
+        "--per-worker-users",
+        action="store_true",
+        default=False,
+        help="Under pytest-xdist, run each worker as its own test user (registered on first use).",
+    )
+    group.addoption(
+        "--no-orphan-sweep",
+        action="store_true",
+        default=False,
+        help="Do not delete contacts left behind by earlier (crashed) runs at start-up.",
+    )
+    group.addoption(
+        "--http-cache",
+        action="store_true",
+        default=False,
+        help="Cache GET responses in api_client and revalidate them with ETag/If-None-Match.",
+    )
+    group.addoption(
+        "--adaptive-concurrency",
+        action="store_true",
+        default=False,
+        help="Adapt in-flight API requests to server pushback (AIMD) and retry throttled idempotent calls.",
+    )
+
+
+def pytest_configure(config):
+    # Created before xdist starts its workers, which inherit it through TAF_RUN_ID
+    current_run_id()
+    use_codec(get_settings().API_JSON_CODEC)
+
+
+def pytest_report_header(config):
+    return f"run id: {current_run_id()}"
+
+
 @pytest.fixture(scope="session", autouse=True)
 def configure_logging():
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -3,51 +3,221 @@ Test data factories for API tests.
 Provides generate_contact_payload() which returns a dict matching the
 contact POST body used by the Contact List API.
 
+Generated names/emails carry the pytest-xdist worker name (e.g. "testgw1a1b2c3d4")
+so data created by parallel workers can be told apart.
+
+generate_contact_payloads() builds many payloads in one batch (seedable, with
+counter-based unique ids and optional pre-serialized JSON bytes) for bulk seeding
+and load runs.
+
+Every generated contact carries the run tag in `street2` ("TAF run <run id>"), so
+contacts leaked by a crashed run can be recognised and swept later (see
+tests/tests_api/helpers/cleanup.py). The run id is shared with xdist workers and
+subprocesses through the TAF_RUN_ID environment variable.
+
 Usage:
     payload = generate_contact_payload()
     payload = generate_contact_payload(overrides={"firstName": "Alice"})
+    payloads = generate_contact_payloads(1000, seed=42)
+    bodies = generate_contact_payloads(1000, as_bytes=True)
 """
-from datetime import date, timedelta
+from datetime import date, datetime, timezone
+from functools import lru_cache
+import json
+import os
 import random
+import threading
+import time
 import uuid
+from typing import List, Optional, Union
+
+# Fields that are the same for every generated contact (unless overridden)
+_STATIC_FIELDS = {
+    "lastName": "User",
+    "phone": "8005555555",
+    "street1": "1 Main St.",
+    "street2": None,  # replaced by run_tag()
+    "city": "Anytown",
+    "stateProvince": "KS",
+    "postalCode": "12345",
+    "country": "USA",
+}
+
+RUN_TAG_PREFIX = "TAF run "
+RUN_ID_ENV = "TAF_RUN_ID"
+_RUN_ID_TIME_FORMAT = "%Y%m%dT%H%M%S"
+
+# Set by seed_factories() to make generate_contact_payload() deterministic
+_seeded_rng: Optional[random.Random] = None
+_seeded_tag: Optional[str] = None
+
+# Process-wide counter for unseeded generate_contact_payloads() ids
+_batch_counter = 0
+_batch_lock = threading.Lock()
+
+
+def _reserve_ids(n: int) -> int:
+    """Reserve `n` consecutive counter values and return the first one."""
+    global _batch_counter
+    with _batch_lock:
+        start = _batch_counter
+        _batch_counter += n
+    return start
+
+
+@lru_cache(maxsize=8)
+def _birthdate_table(start_year: int, end_year: int) -> tuple:
+    """All YYYY-MM-DD strings between Jan 1 of start_year and Dec 31 of end_year (computed once)."""
+    first = date(start_year, 1, 1).toordinal()
+    last = date(end_year, 12, 31).toordinal()
+    return tuple(date.fromordinal(o).isoformat() for o in range(first, last + 1))
+
+
+def seed_factories(seed: Optional[int]) -> None:
+    """
+    Make generate_contact_payload() deterministic (same seed -> same sequence of payloads),
+    e.g. for recording and replaying traffic. Pass None to go back to random data.
+    While seeded, the run tag is derived from the seed instead of the run id.
+    """
+    global _seeded_rng, _seeded_tag
+    _seeded_rng = random.Random(seed) if seed is not None else None
+    _seeded_tag = f"{RUN_TAG_PREFIX}seed-{seed}" if seed is not None else None
+
+
+def current_run_id() -> str:
+    """Id of this test run ("20261018T120000-1a2b3c", UTC start time + random suffix), created on first use."""
+    run_id = os.environ.get(RUN_ID_ENV)
+    if not run_id:
+        run_id = f"{time.strftime(_RUN_ID_TIME_FORMAT, time.gmtime())}-{uuid.uuid4().hex[:6]}"
+        os.environ[RUN_ID_ENV] = run_id
+    return run_id
+
+
+def run_tag() -> str:
+    """Value stored in `street2` of generated contacts."""
+    return _seeded_tag or RUN_TAG_PREFIX + current_run_id()
+
+
+def parse_run_tag(value) -> Optional[str]:
+    """Run id from a run tag, or None if `value` is not one."""
+    if isinstance(value, str) and value.startswith(RUN_TAG_PREFIX):
+        return value[len(RUN_TAG_PREFIX):] or None
+    return None
+
+
+def run_started_at(run_id: str) -> Optional[float]:
+    """Epoch seconds a run id was created at, or None for ids without a timestamp (e.g. seeded runs)."""
+    try:
+        started = datetime.strptime(run_id.split("-", 1)[0], _RUN_ID_TIME_FORMAT)
+    except ValueError:
+        return None
+    return started.replace(tzinfo=timezone.utc).timestamp()
 
 
 def _random_birthdate(start_year=1950, end_year=2000):
     """Return a birthdate string YYYY-MM-DD between start_year and end_year."""
-    start = date(start_year, 1, 1)
-    end = date(end_year, 12, 31)
-    delta_days = (end - start).days
-    chosen = start + timedelta(days=random.randint(0, delta_days))
-    return chosen.isoformat()
+    return (_seeded_rng or random).choice(_birthdate_table(start_year, end_year))
 
 
-def _unique_local_part():
+def _worker_namespace() -> str:
+    """Current pytest-xdist worker name ("gw0", ...) or "" outside xdist."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    return "" if worker == "master" else worker
+
+
+def _unique_local_part(namespace: str = ""):
     """Generate a short unique local-part for an email address."""
-    return f"test{uuid.uuid4().hex[:8]}"
+    if _seeded_rng is not None:
+        return f"test{namespace}{_seeded_rng.getrandbits(32):08x}"
+    return f"test{namespace}{uuid.uuid4().hex[:8]}"
 
 
-def generate_contact_payload(overrides: dict = None) -> dict:
+def generate_contact_payload(overrides: dict = None, namespace: str = None) -> dict:
     """
     Generate a contact payload matching the API expected schema.
     Pass `overrides` to replace any default values.
+    `namespace` is embedded in the name/email; it defaults to the xdist worker name.
     """
     overrides = overrides or {}
 
-    uid = _unique_local_part()
+    uid = _unique_local_part(_worker_namespace() if namespace is None else namespace)
     payload = {
         "firstName": f"Test{uid}",
-        "lastName": "User",
         "birthdate": _random_birthdate(1950, 2000),
         "email": f"{uid}@example.com",
-        "phone": "8005555555",
-        "street1": "1 Main St.",
-        "street2": "Apartment A",
-        "city": "Anytown",
-        "stateProvince": "KS",
-        "postalCode": "12345",
-        "country": "USA",
+        **_STATIC_FIELDS,
+        "street2": run_tag(),
     }
 
     # Apply overrides (simple shallow merge)
     payload.update(overrides)
     return payload
+
+
+def generate_contact_payloads(
+    n: int,
+    seed: Optional[int] = None,
+    overrides: dict = None,
+    namespace: str = None,
+    as_bytes: bool = False,
+) -> List[Union[dict, bytes]]:
+    """
+    Generate `n` contact payloads in one batch.
+
+    - seed: makes birthdates and ids reproducible (ids are only unique per seed, so
+      reuse a seed only against a clean account or the local API)
+    - overrides: applied to every payload (shallow merge)
+    - namespace: embedded in ids; defaults to the xdist worker name, which keeps
+      ids unique across parallel workers
+    - as_bytes: return UTF-8 JSON bodies ready to send instead of dicts
+
+    Ids look like "test<namespace><run><counter>". Unseeded, <run> is random per call
+    and <counter> is a process-wide sequence; seeded, <run> comes from the seed and
+    <counter> starts at 0, so the same seed yields the same payloads.
+    """
+    if n <= 0:
+        return []
+    overrides = overrides or {}
+    if seed is None and _seeded_rng is not None:
+        seed = _seeded_rng.getrandbits(32)
+    rng = random.Random(seed)
+    namespace = _worker_namespace() if namespace is None else namespace
+    run = f"{rng.getrandbits(24):06x}" if seed is not None else uuid.uuid4().hex[:6]
+    prefix = f"test{namespace}{run}"
+
+    table = _birthdate_table(1950, 2000)
+    birthdates = [table[i] for i in (rng.randrange(len(table)) for _ in range(n))]
+    start = 0 if seed is not None else _reserve_ids(n)
+    uids = [f"{prefix}{i:x}" for i in range(start, start + n)]
+
+    if not as_bytes:
+        static = {**_STATIC_FIELDS, "street2": run_tag(), **overrides}
+        payloads = []
+        for uid, birthdate in zip(uids, birthdates):
+            payload = {"firstName": f"Test{uid}", "birthdate": birthdate, "email": f"{uid}@example.com", **static}
+            payload.update(overrides)
+            payloads.append(payload)
+        return payloads
+
+    # Serialize the fields shared by every payload once and splice the per-contact
+    # values in; ids and ISO dates never need JSON escaping.
+    static = {**_STATIC_FIELDS, "street2": run_tag(), **overrides}
+    static = {k: v for k, v in static.items() if k not in ("firstName", "birthdate", "email")}
+    tail = json.dumps(static, ensure_ascii=False)[1:-1]
+    tail = f", {tail}}}" if tail else "}"
+    fixed = {k: json.dumps(overrides[k], ensure_ascii=False) for k in ("firstName", "birthdate", "email") if k in overrides}
+    first_name = fixed.get("firstName")
+    birthdate_json = fixed.get("birthdate")
+    email = fixed.get("email")
+
+    bodies = []
+    for uid, birthdate in zip(uids, birthdates):
+        bodies.append(
+            (
+                '{"firstName": ' + (first_name or f'"Test{uid}"')
+                + ', "birthdate": ' + (birthdate_json or f'"{birthdate}"')
+                + ', "email": ' + (email or f'"{uid}@example.com"')
+                + tail
+            ).encode("utf-8")
+        )
+    return bodies
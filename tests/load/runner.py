@@ -0,0 +1,294 @@
+"""
+Load-generation runner for the Contact List API.
+
+Drives weighted CRUD scenarios with the framework's own client and payload
+factory, either closed-loop (N virtual users looping back-to-back) or
+open-loop (a target request rate), for a fixed duration.
+
+Usage:
+    python -m tests.load --duration 30 --concurrency 16
+    python -m tests.load --duration 60 --rate 50 --mix create=2,get=5,list=1,update=1,delete=1
+    python -m tests.load --local-api --latency-ms 20 --json reports/load.json
+    python -m tests.load --concurrency 64 --max-in-flight 64 --adaptive
+    python -m tests.load --duration 600 --soak-every 1000     # endurance run with memory sampling
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from playwright.async_api import async_playwright
+
+from tests import config
+from tests.factories import generate_contact_payload
+from tests.load.stats import LoadStats
+from tests.tests_api.clients.async_api_client import AsyncApiClient
+from tests.tests_api.clients.codec import use_codec
+from tests.tests_api.clients.concurrency import AdaptiveConcurrency
+from tests.tests_api.helpers.memory import MemorySampler
+from tests.tests_api.stub.local_api import LocalContactListApi
+
+DEFAULT_MIX = {"create": 2, "get": 5, "list": 1, "update": 1, "delete": 1}
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """Parse "create=2,get=5" into {"create": 2, "get": 5}."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown scenario {name!r}; expected one of {sorted(DEFAULT_MIX)}")
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("Scenario mix must have at least one positive weight")
+    return mix
+
+
+class LoadRunner:
+    """
+    Runs weighted scenarios against an AsyncApiClient and records results in LoadStats.
+    Contacts created during the run are deleted (unrecorded) at the end.
+    """
+
+    def __init__(
+        self,
+        client: AsyncApiClient,
+        token: str,
+        mix: Optional[Dict[str, int]] = None,
+        stats: Optional[LoadStats] = None,
+        payload_factory: Callable[[], Union[Dict, bytes]] = generate_contact_payload,
+        seed: Optional[int] = None,
+    ):
+        self.client = client
+        self.token = token
+        self.stats = stats or LoadStats()
+        self.payload_factory = payload_factory
+        self._random = random.Random(seed)
+        self._ids: List[str] = []
+
+        mix = mix or DEFAULT_MIX
+        self._names = [name for name, weight in mix.items() if weight > 0]
+        self._weights = [mix[name] for name in self._names]
+        self._scenarios = {
+            "create": self._create,
+            "get": self._get,
+            "list": self._list,
+            "update": self._update,
+            "delete": self._delete,
+        }
+
+    async def _timed(self, endpoint: str, call):
+        t0 = time.perf_counter()
+        try:
+            resp = await call
+        except Exception as e:
+            self.stats.record(endpoint, (time.perf_counter() - t0) * 1000.0, type(e).__name__)
+            return None
+        duration_ms = (time.perf_counter() - t0) * 1000.0
+        self.stats.record(endpoint, duration_ms, f"HTTP {resp.status}" if resp.status >= 400 else None)
+        return resp
+
+    # ---- scenarios ----
+    async def _create(self):
+        resp = await self._timed("POST /contacts", self.client.post("/contacts", token=self.token, json=self.payload_factory()))
+        if resp is not None and resp.status in (200, 201):
+            try:
+                body = await resp.json()
+            except Exception:
+                return
+            if body.get("_id"):
+                self._ids.append(body["_id"])
+
+    async def _get(self):
+        if not self._ids:
+            return await self._create()
+        cid = self._random.choice(self._ids)
+        await self._timed("GET /contacts/{id}", self.client.get(f"/contacts/{cid}", token=self.token))
+
+    async def _list(self):
+        await self._timed("GET /contacts", self.client.get("/contacts", token=self.token, params={"page": 1, "limit": 100}))
+
+    async def _update(self):
+        if not self._ids:
+            return await self._create()
+        cid = self._random.choice(self._ids)
+        phone = f"800{self._random.randint(0, 9999999):07d}"
+        await self._timed("PATCH /contacts/{id}", self.client.patch(f"/contacts/{cid}", token=self.token, json={"phone": phone}))
+
+    async def _delete(self):
+        if not self._ids:
+            return await self._create()
+        cid = self._ids.pop(self._random.randrange(len(self._ids)))
+        await self._timed("DELETE /contacts/{id}", self.client.delete(f"/contacts/{cid}", token=self.token))
+
+    def _pick(self):
+        return self._scenarios[self._random.choices(self._names, self._weights)[0]]
+
+    # ---- drivers ----
+    async def run(
+        self, duration: float, concurrency: int = 8, rate: Optional[float] = None, max_outstanding: Optional[int] = None
+    ) -> LoadStats:
+        """
+        Run for `duration` seconds.
+        - rate=None: closed loop with `concurrency` virtual users
+        - rate=R: open loop, starting R scenarios per second. At most `max_outstanding`
+          scenarios (default: the client's max_concurrency) run at once; a start due while
+          that many are outstanding is skipped and counted in stats.dropped. Scenarios still
+          running at the deadline are cancelled, unrecorded, and counted in stats.cancelled.
+        """
+        self.stats.started = time.perf_counter()
+        deadline = self.stats.started + duration
+        try:
+            if rate:
+                await self._run_open_loop(deadline, rate, max_outstanding or self.client.max_concurrency)
+            else:
+                await asyncio.gather(*(self._virtual_user(deadline) for _ in range(concurrency)))
+        finally:
+            self.stats.finished = time.perf_counter()
+            await self.cleanup()
+        return self.stats
+
+    async def _virtual_user(self, deadline: float):
+        while time.perf_counter() < deadline:
+            await self._pick()()
+
+    async def _run_open_loop(self, deadline: float, rate: float, max_outstanding: int):
+        interval = 1.0 / rate
+        tasks = set()
+        next_start = time.perf_counter()
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(tasks) >= max_outstanding:
+                # the server is not keeping up: skip this start rather than queue without bound
+                self.stats.dropped += 1
+            else:
+                task = asyncio.ensure_future(self._pick()())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_start += interval
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.stats.cancelled += len(tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def cleanup(self):
+        """Delete every contact created during the run (not recorded in stats)."""
+        ids, self._ids = self._ids, []
+        if ids:
+            await self.client.delete_contacts(self.token, ids)
+
+
+async def _main_async(args) -> Dict:
+    server = None
+    base_url = config.API_BASE_URL
+    email, password = config.TEST_USER_EMAIL, config.TEST_USER_PASS
+    if args.local_api:
+        server = LocalContactListApi(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        ).start()
+        base_url = server.url
+        email = email or config.LOCAL_USER_EMAIL
+        password = password or config.LOCAL_USER_PASS
+        server.add_user(email, password)
+
+    if not email or not password:
+        raise SystemExit("TEST_USER_EMAIL and TEST_USER_PASS must be set in .env (or use --local-api)")
+
+    pw = await async_playwright().start()
+    try:
+        ctx = await pw.request.new_context(base_url=base_url, extra_http_headers={"Accept": "application/json"})
+        max_in_flight = args.max_in_flight or args.concurrency
+        limiter = AdaptiveConcurrency(initial=min(4, max_in_flight), max_limit=max_in_flight) if args.adaptive else None
+        sampler = MemorySampler(every=args.soak_every).start() if args.soak_every else None
+        client = AsyncApiClient(
+            ctx,
+            max_concurrency=max_in_flight,
+            hooks=[sampler] if sampler is not None else None,
+            concurrency=limiter,
+            release_bodies=args.release_bodies,
+        )
+        token = await client.login_user(email, password)
+        if not token:
+            raise SystemExit("Login did not return a token; check credentials and API availability")
+
+        runner = LoadRunner(client, token, mix=parse_mix(args.mix), seed=args.seed)
+        stats = await runner.run(
+            args.duration, concurrency=args.concurrency, rate=args.rate, max_outstanding=args.max_outstanding
+        )
+        if sampler is not None:
+            sampler.stop()  # before the driver goes away
+        await ctx.dispose()
+    finally:
+        await pw.stop()
+        if server is not None:
+            server.stop()
+
+    print(stats.format_table())
+    summary = stats.summary()
+    if limiter is not None:
+        print("adaptive concurrency: " + ", ".join(f"{k}={v}" for k, v in limiter.metrics().items()))
+        summary["adaptive_concurrency"] = limiter.metrics()
+    if sampler is not None:
+        print(sampler.format_table())
+        summary["memory"] = sampler.to_json()
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.load", description="Load-test the Contact List API.")
+    parser.add_argument("--duration", type=float, default=30.0, help="run time in seconds (default: 30)")
+    parser.add_argument("--concurrency", type=int, default=8, help="virtual users in closed-loop mode (default: 8)")
+    parser.add_argument("--rate", type=float, default=None, help="target scenarios/second (open loop); overrides --concurrency")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="cap on concurrent requests (default: --concurrency)")
+    parser.add_argument(
+        "--max-outstanding",
+        type=int,
+        default=None,
+        help="open loop: scenarios running at once before further starts are dropped (default: --max-in-flight)",
+    )
+    parser.add_argument(
+        "--adaptive", action="store_true", help="adapt in-flight requests to 429/5xx pushback (AIMD) up to --max-in-flight"
+    )
+    parser.add_argument("--mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()), help="scenario weights")
+    parser.add_argument("--seed", type=int, default=None, help="seed for scenario selection and the local API")
+    parser.add_argument(
+        "--soak-every", type=int, default=0, help="sample RSS and tracemalloc every N requests; report growth per endpoint"
+    )
+    parser.add_argument(
+        "--keep-bodies",
+        dest="release_bodies",
+        action="store_false",
+        default=config.API_RELEASE_BODIES,
+        help="do not dispose responses in the Playwright driver as they arrive (to compare memory growth)",
+    )
+    parser.add_argument("--json", dest="json_path", default=None, help="write the summary as JSON to this path")
+    parser.add_argument("--local-api", action="store_true", default=config.LOCAL_API, help="run against the in-process API")
+    parser.add_argument("--latency-ms", type=float, default=config.LOCAL_API_LATENCY_MS, help="local API injected latency")
+    parser.add_argument("--jitter-ms", type=float, default=config.LOCAL_API_JITTER_MS, help="local API injected jitter")
+    parser.add_argument("--error-rate", type=float, default=config.LOCAL_API_ERROR_RATE, help="local API injected error rate")
+    args = parser.parse_args(argv)
+    use_codec(config.API_JSON_CODEC)
+
+    summary = asyncio.run(_main_async(args))
+    if args.json_path:
+        path = Path(args.json_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
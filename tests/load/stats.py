@@ -0,0 +1,98 @@
+"""
+Latency / error aggregation for load runs.
+"""
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from tests.stats import percentile
+
+
+class LoadStats:
+    """
+    Collects per-endpoint samples. An endpoint is "<METHOD> <templated path>",
+    e.g. "GET /contacts/{id}". Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, Counter] = defaultdict(Counter)
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.dropped = 0  # open loop: starts skipped because too many scenarios were outstanding
+        self.cancelled = 0  # open loop: scenarios still running at the deadline
+
+    def record(self, endpoint: str, duration_ms: float, error: Optional[str] = None) -> None:
+        """Record one request. `error` is e.g. "HTTP 503" or an exception class name."""
+        with self._lock:
+            self._latencies[endpoint].append(duration_ms)
+            if error:
+                self._errors[endpoint][error] += 1
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def summary(self) -> Dict[str, Dict]:
+        """Return {"total": {...}, "endpoints": {endpoint: {...}}} with throughput and percentiles."""
+        with self._lock:
+            latencies = {k: sorted(v) for k, v in self._latencies.items()}
+            errors = {k: dict(v) for k, v in self._errors.items()}
+
+        elapsed = self.elapsed or 1e-9
+        endpoints = {}
+        for endpoint, values in sorted(latencies.items()):
+            err = errors.get(endpoint, {})
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": sum(err.values()),
+                "error_breakdown": err,
+                "rps": len(values) / elapsed,
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99),
+                "max_ms": values[-1] if values else None,
+            }
+
+        all_values = sorted(v for values in latencies.values() for v in values)
+        total_errors = Counter()
+        for err in errors.values():
+            total_errors.update(err)
+        return {
+            "total": {
+                "duration_s": self.elapsed,
+                "requests": len(all_values),
+                "errors": sum(total_errors.values()),
+                "error_breakdown": dict(total_errors),
+                "rps": len(all_values) / elapsed,
+                "p50_ms": percentile(all_values, 50),
+                "p95_ms": percentile(all_values, 95),
+                "p99_ms": percentile(all_values, 99),
+                "dropped": self.dropped,
+                "cancelled": self.cancelled,
+            },
+            "endpoints": endpoints,
+        }
+
+    def format_table(self) -> str:
+        """Human-readable summary table."""
+        summary = self.summary()
+
+        def ms(value):
+            return "-" if value is None else f"{value:.1f}"
+
+        rows = [f"{'endpoint':<28}{'reqs':>8}{'errs':>7}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"]
+        for endpoint, s in list(summary["endpoints"].items()) + [("TOTAL", summary["total"])]:
+            rows.append(
+                f"{endpoint:<28}{s['requests']:>8}{s['errors']:>7}{s['rps']:>9.1f}"
+                f"{ms(s['p50_ms']):>9}{ms(s['p95_ms']):>9}{ms(s['p99_ms']):>9}"
+            )
+        breakdown = summary["total"]["error_breakdown"]
+        if breakdown:
+            rows.append("errors: " + ", ".join(f"{k}={v}" for k, v in sorted(breakdown.items())))
+        if self.dropped or self.cancelled:
+            rows.append(f"open loop: {self.dropped} scheduled starts dropped, {self.cancelled} cancelled at the deadline")
+        return "\n".join(rows)
@@ -0,0 +1,77 @@
+"""
+Pytest plugin: record API traffic into a cassette, or replay it without network.
+
+    pytest --cassette=reports/api.cassette --cassette-mode=record
+    pytest --cassette=reports/api.cassette --cassette-mode=replay
+
+Contact payloads are generated from a fixed seed in both modes so request bodies
+match between recording and replay. Replay mismatches (requests without a recorded
+response, recorded responses never requested) are listed in the terminal summary.
+"""
+from pathlib import Path
+
+import pytest
+
+from tests.factories import seed_factories
+from tests.tests_api.clients.cassette import Cassette
+
+CASSETTE_SEED = 20240101
+
+_cassette_key = pytest.StashKey["Cassette"]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption("--cassette", default=None, help="Cassette file used by --cassette-mode.")
+    group.addoption(
+        "--cassette-mode",
+        choices=("off", "record", "replay"),
+        default="off",
+        help="record: capture every API request/response into --cassette; replay: answer requests from it.",
+    )
+
+
+def pytest_configure(config):
+    mode = config.getoption("--cassette-mode")
+    if mode == "off":
+        return
+    target = config.getoption("--cassette")
+    if not target:
+        raise pytest.UsageError("--cassette-mode requires --cassette=<path>")
+
+    path = Path(target)
+    if not path.is_absolute():
+        path = Path(config.rootpath) / path
+    worker = getattr(config, "workerinput", {}).get("workerid")
+    if worker:
+        # one cassette per xdist worker
+        path = path.with_name(f"{path.stem}.{worker}{path.suffix}")
+
+    seed_factories(CASSETTE_SEED)
+    config.stash[_cassette_key] = Cassette(path, mode)
+
+
+def pytest_unconfigure(config):
+    cassette = config.stash.get(_cassette_key, None)
+    if cassette is not None:
+        cassette.close()
+        seed_factories(None)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    cassette = config.stash.get(_cassette_key, None)
+    if cassette is None:
+        return
+    if cassette.recording:
+        terminalreporter.write_line(f"cassette: recorded to {cassette.path}")
+        return
+    report = cassette.mismatch_report()
+    if report:
+        terminalreporter.write_sep("-", "cassette mismatches")
+        terminalreporter.write_line(report)
+
+
+@pytest.fixture(scope="session")
+def cassette(pytestconfig):
+    """The active Cassette, or None when not recording/replaying."""
+    return pytestconfig.stash.get(_cassette_key, None)
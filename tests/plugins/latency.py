@@ -0,0 +1,219 @@
+"""
+Pytest plugin: per-endpoint latency budgets.
+
+    @pytest.mark.latency(endpoint="/contacts/{id}", p95_ms=300, samples=50, warmup=5)
+    def test_get_contact_latency(api_client, contact_resource, auth_token, latency_probe):
+        cid = contact_resource["id"]
+        latency_probe(lambda: api_client.get(f"/contacts/{cid}", token=auth_token))
+
+latency_probe calls the function `warmup` times unmeasured, then `samples` times
+back to back. It fails the test if any sample is not a 2xx, or if a measured
+percentile is over its budget (p50_ms / p95_ms / p99_ms). Returned responses are
+checked against `endpoint`, so a probe cannot silently measure the wrong call.
+
+Every run's percentiles are kept per endpoint in the pytest cache
+("latency/history", last HISTORY_RUNS runs) and printed in the terminal summary
+next to the previous run. With --latency-max-regression=PCT a p95 more than PCT
+percent above the median of earlier runs also fails. Nothing is measured when
+replaying a cassette.
+
+Latency tests send dozens of requests each, so they are deselected unless the run
+asks for them with --latency (or a -m expression naming the marker, e.g. -m latency).
+"""
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import pytest
+
+from tests.factories import current_run_id
+from tests.plugins.cassette import _cassette_key
+from tests.stats import percentile
+from tests.tests_api.clients.instrumentation import template_path
+
+HISTORY_KEY = "latency/history"
+HISTORY_RUNS = 20
+BUDGETS = ("p50_ms", "p95_ms", "p99_ms")
+
+_result_key = pytest.StashKey[Dict[str, Any]]()
+
+
+def summarize(durations_ms: List[float]) -> Dict[str, float]:
+    values = sorted(durations_ms)
+    return {
+        "samples": len(values),
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3),
+        "mean_ms": round(statistics.fmean(values), 3),
+    }
+
+
+def over_budget(summary: Dict[str, float], budgets: Dict[str, float]) -> List[str]:
+    """Human-readable violations, e.g. ["p95 412.0 ms > 300 ms"]."""
+    return [
+        f"{name[:-3]} {summary[name]:.1f} ms > {limit:g} ms"
+        for name, limit in budgets.items()
+        if limit is not None and summary[name] > limit
+    ]
+
+
+def _marker_args(item) -> Dict[str, Any]:
+    marker = item.get_closest_marker("latency")
+    if marker is None:
+        pytest.fail("latency_probe needs @pytest.mark.latency(endpoint=..., p95_ms=...)", pytrace=False)
+    args = {"method": "GET", "samples": 50, "warmup": 5, **marker.kwargs}
+    if marker.args:
+        args["endpoint"] = marker.args[0]
+    if not args.get("endpoint"):
+        pytest.fail("@pytest.mark.latency needs endpoint=, e.g. endpoint='/contacts/{id}'", pytrace=False)
+    if all(args.get(b) is None for b in BUDGETS):
+        pytest.fail(f"@pytest.mark.latency needs at least one of {', '.join(BUDGETS)}", pytrace=False)
+    if args["samples"] < 1:
+        pytest.fail("@pytest.mark.latency samples must be >= 1", pytrace=False)
+    return args
+
+
+class LatencyProbe:
+    """The latency_probe fixture: measures one endpoint as configured by the test's latency marker."""
+
+    def __init__(self, item):
+        self.item = item
+        self.args = _marker_args(item)
+        self.label = f"{self.args['method'].upper()} {self.args['endpoint']}"
+
+    def _check(self, resp, n: int) -> None:
+        status = getattr(resp, "status", None)
+        if status is not None and not 200 <= status <= 299:
+            pytest.fail(f"{self.label}: sample {n} returned HTTP {status}", pytrace=False)
+        url = getattr(resp, "url", None)
+        if url and template_path(urlparse(url).path) != template_path(self.args["endpoint"]):
+            pytest.fail(f"latency probe for {self.label} called {urlparse(url).path}", pytrace=False)
+
+    def __call__(self, call: Callable[[], Any]) -> Dict[str, Any]:
+        for n in range(self.args["warmup"]):
+            self._check(call(), -n - 1)
+        durations = []
+        for n in range(self.args["samples"]):
+            t0 = time.perf_counter()
+            resp = call()
+            durations.append((time.perf_counter() - t0) * 1000.0)
+            self._check(resp, n)
+
+        summary = summarize(durations)
+        budgets = {b: self.args.get(b) for b in BUDGETS}
+        result = {"endpoint": self.label, **summary, "budgets": {k: v for k, v in budgets.items() if v is not None}}
+        self.item.stash[_result_key] = result
+
+        problems = over_budget(summary, budgets)
+        regression = self._regression(summary["p95_ms"])
+        if regression:
+            problems.append(regression)
+        if problems:
+            pytest.fail(f"{self.label} over latency budget: {'; '.join(problems)} ({summary['samples']} samples)", pytrace=False)
+        return result
+
+    def _regression(self, p95: float) -> Optional[str]:
+        limit = self.item.config.getoption("--latency-max-regression")
+        cache = getattr(self.item.config, "cache", None)  # None under -p no:cacheprovider
+        if not limit or cache is None:
+            return None
+        earlier = [run["p95_ms"] for run in cache.get(HISTORY_KEY, {}).get(self.label, [])]
+        if not earlier:
+            return None
+        baseline = statistics.median(earlier)
+        if p95 > baseline * (1 + limit / 100.0):
+            return f"p95 {p95:.1f} ms is {100 * (p95 / baseline - 1):.0f}% above the median of the last {len(earlier)} runs ({baseline:.1f} ms)"
+        return None
+
+
+class LatencyCollector:
+    """Collects probe results from the call reports (also those of xdist workers) and keeps the history."""
+
+    def __init__(self, config):
+        self.config = config
+        self.results: List[Dict[str, Any]] = []
+
+    def pytest_runtest_logreport(self, report):
+        result = getattr(report, "latency", None)
+        if report.when == "call" and result:
+            self.results.append({**result, "nodeid": report.nodeid, "passed": report.passed})
+
+    def pytest_sessionfinish(self, session):
+        cache = getattr(self.config, "cache", None)
+        if hasattr(self.config, "workerinput") or cache is None or not self.results:
+            return
+        history = cache.get(HISTORY_KEY, {})
+        run = current_run_id()
+        for result in self.results:
+            runs = history.get(result["endpoint"], [])
+            result["previous_p95_ms"] = runs[-1]["p95_ms"] if runs else None
+            runs.append({"run": run, "at": round(time.time()), **{k: result[k] for k in ("samples", "p50_ms", "p95_ms", "p99_ms")}})
+            history[result["endpoint"]] = runs[-HISTORY_RUNS:]
+        cache.set(HISTORY_KEY, history)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results or hasattr(self.config, "workerinput"):
+            return
+        tr = terminalreporter
+        tr.section("latency")
+        tr.write_line(f"{'endpoint':<32}{'n':>5}{'p50':>9}{'p95':>9}{'p99':>9}{'budget':>16}{'prev p95':>10}{'change':>8}")
+        for r in sorted(self.results, key=lambda r: r["endpoint"]):
+            budget = ", ".join(f"{k[:-3]}<{v:g}" for k, v in r["budgets"].items())
+            prev = r.get("previous_p95_ms")
+            change = f"{100 * (r['p95_ms'] / prev - 1):+.0f}%" if prev else "-"
+            prev = f"{prev:.1f}" if prev is not None else "-"
+            tr.write_line(
+                f"{r['endpoint']:<32}{r['samples']:>5}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+                f"{budget:>16}{prev:>10}{change:>8}"
+                + ("" if r["passed"] else "  FAILED")
+            )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--latency",
+        action="store_true",
+        default=False,
+        help="Run the tests marked latency (deselected by default).",
+    )
+    group.addoption(
+        "--latency-max-regression",
+        type=float,
+        default=0.0,
+        help="Fail latency tests whose p95 is more than this many percent above the median of earlier runs (0 = off).",
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(LatencyCollector(config), "latency_collector")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--latency") or "latency" in (config.getoption("-m") or ""):
+        return
+    deselected = [item for item in items if item.get_closest_marker("latency") is not None]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.get_closest_marker("latency") is None]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call" and _result_key in item.stash:
+        # carried on the report so it reaches the xdist controller
+        report.latency = item.stash[_result_key]
+
+
+@pytest.fixture
+def latency_probe(request) -> LatencyProbe:
+    """Measures the endpoint named by the test's @pytest.mark.latency; call it with a zero-argument request function."""
+    cassette = request.config.stash.get(_cassette_key, None)
+    if cassette is not None and cassette.replaying:
+        pytest.skip("latency is not measured when replaying a cassette")
+    return LatencyProbe(request.node)
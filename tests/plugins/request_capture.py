@@ -0,0 +1,84 @@
+"""
+Pytest plugin: show the HTTP request history of failing tests.
+
+API clients built with the `request_capture` fixture keep the last exchanges of
+the running test in a ring buffer (tests/tests_api/clients/capture.py); the buffer
+is cleared when a test starts. Only when a phase fails is it formatted and added
+to that phase's report as an "HTTP requests" section, so it shows in the terminal
+failure output, in the results stream and in pytest-html. Passing tests pay for a
+deque append per request and nothing else.
+
+    pytest --capture-requests=50        # keep more history (0 disables)
+    pytest --capture-sample=0.01        # also attach the history of ~1% of passing tests
+"""
+import random
+from typing import Optional
+
+import pytest
+
+from tests.tests_api.clients.capture import RequestCapture
+
+SECTION = "HTTP requests"
+
+_capture_key = pytest.StashKey[RequestCapture]()
+_failed_key = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--capture-requests",
+        type=int,
+        default=20,
+        help="Request/response exchanges kept per test and shown when it fails (0 disables). Default: 20",
+    )
+    group.addoption(
+        "--capture-sample",
+        type=float,
+        default=0.0,
+        help="Fraction of passing tests whose request history is attached as well (0-1). Default: 0",
+    )
+
+
+class _CaptureHooks:
+    def __init__(self, capture: RequestCapture, sample_rate: float):
+        self.capture = capture
+        self.sample_rate = sample_rate
+        self._random = random.Random()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.capture.clear()
+        item.stash[_failed_key] = False
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed:
+            item.stash[_failed_key] = True
+            title = f"{SECTION} ({report.when})"
+        elif report.when == "teardown" and not item.stash.get(_failed_key, False) and self._sampled():
+            title = f"{SECTION} (sampled)"
+        else:
+            return
+        if len(self.capture):
+            report.sections.append((title, self.capture.format()))
+
+    def _sampled(self) -> bool:
+        return self.sample_rate > 0 and self._random.random() < self.sample_rate
+
+
+def pytest_configure(config):
+    size = config.getoption("--capture-requests")
+    if size <= 0:
+        return
+    capture = RequestCapture(size=size)
+    config.stash[_capture_key] = capture
+    config.pluginmanager.register(_CaptureHooks(capture, config.getoption("--capture-sample")), "request_capture_hooks")
+
+
+@pytest.fixture(scope="session")
+def request_capture(pytestconfig) -> Optional[RequestCapture]:
+    """The session's request ring buffer (None with --capture-requests=0); pass it to API clients as `capture=`."""
+    return pytestconfig.stash.get(_capture_key, None)
@@ -0,0 +1,217 @@
+"""
+Pytest plugin: per-request timing for ApiClient / AsyncApiClient.
+
+Every request made through a client built with the `request_timing` hook is
+recorded with the test and phase (setup/call/teardown) it ran in. Results are:
+  - embedded in the HTML report (per-test latency table + session histogram), by
+    tests/report/render.py and, when it is active, pytest-html
+  - exported as JSON (--request-timings-json, default reports/request_timings.json)
+
+Memory stays flat on long and soak runs: endpoints are kept as constant-size
+aggregates (tests/stats.py), per-test records only until the next test starts,
+and the JSON export holds the last MAX_EXPORTED_REQUESTS records.
+"""
+import html
+import json
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from tests.stats import HISTOGRAM_BUCKETS_MS, LatencySummary
+
+MAX_EXPORTED_REQUESTS = 10_000
+
+_recorder_key = pytest.StashKey["RequestTimingRecorder"]()
+
+
+class RequestTimingRecorder:
+    """Request hook that tags each record with the running test and aggregates it."""
+
+    def __init__(self, max_exported: int = MAX_EXPORTED_REQUESTS):
+        self._lock = threading.Lock()
+        self.seen = 0
+        self._recent: deque = deque(maxlen=max_exported)
+        self._endpoints: Dict[str, LatencySummary] = {}
+        self._tests: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._by_test: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        self.test: Optional[str] = None
+        self.phase: str = "session"
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        record["test"] = self.test
+        record["phase"] = self.phase
+        endpoint = f"{record['method']} {record['path']}"
+        with self._lock:
+            self.seen += 1
+            self._recent.append(record)
+            summary = self._endpoints.get(endpoint)
+            if summary is None:
+                summary = self._endpoints[endpoint] = LatencySummary()
+            summary.add(record["duration_ms"])
+            self._tests[record["test"] or "<session>"][record["phase"]] += record["duration_ms"]
+            if record["test"] is not None:
+                self._by_test[record["test"]].append(record)
+
+    def start_test(self, nodeid: str) -> None:
+        """Tag later records with `nodeid`; records of earlier tests are dropped (they were reported at their teardown)."""
+        with self._lock:
+            if self.test != nodeid:
+                self._by_test.clear()
+            self.test, self.phase = nodeid, "setup"
+
+    def for_test(self, nodeid: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._by_test.get(nodeid, ()))
+
+    def endpoint_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per "<METHOD> <templated path>" count, total and percentile latencies plus a histogram."""
+        with self._lock:
+            return {endpoint: s.to_dict() for endpoint, s in sorted(self._endpoints.items())}
+
+    def test_summary(self) -> Dict[str, Dict[str, float]]:
+        """Total request time per test, split by phase."""
+        with self._lock:
+            return {test: dict(phases) for test, phases in self._tests.items()}
+
+    def to_json(self) -> Dict[str, Any]:
+        with self._lock:
+            records = list(self._recent)
+            dropped = self.seen - len(records)
+        return {
+            "histogram_buckets_ms": list(HISTOGRAM_BUCKETS_MS),
+            "endpoints": self.endpoint_summary(),
+            "tests": self.test_summary(),
+            "requests": records,
+            "requests_dropped": dropped,
+        }
+
+
+def _fmt(value) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def requests_table(records: List[Dict[str, Any]]) -> str:
+    """HTML table of one test's requests (also used by tests/report/render.py)."""
+    rows = "".join(
+        "<tr>"
+        f"<td>{html.escape(r['phase'])}</td><td>{html.escape(r['method'])}</td><td>{html.escape(r['path'])}</td>"
+        f"<td>{r['status'] if r['status'] is not None else html.escape(r['error'] or '')}</td>"
+        f"<td>{_fmt(r['duration_ms'])}</td><td>{r.get('request_bytes', '-')}</td>"
+        f"<td>{'-' if r.get('response_bytes') is None else r['response_bytes']}</td>"
+        "</tr>"
+        for r in records
+    )
+    total = sum(r["duration_ms"] for r in records)
+    return (
+        f"<div><b>HTTP requests ({len(records)}, {total:.1f} ms)</b>"
+        "<table><tr><th>phase</th><th>method</th><th>path</th><th>status</th>"
+        "<th>ms</th><th>req bytes</th><th>resp bytes</th></tr>"
+        f"{rows}</table></div>"
+    )
+
+
+def timings_summary(summary: Dict[str, Dict[str, Any]]) -> str:
+    """HTML "HTTP request timings" section: per-endpoint percentiles and histogram (endpoint -> LatencySummary.to_dict())."""
+    labels = [f"&lt;{b}" for b in HISTOGRAM_BUCKETS_MS] + [f"&ge;{HISTOGRAM_BUCKETS_MS[-1]}"]
+    head = "".join(f"<th>{label} ms</th>" for label in labels)
+    rows = []
+    for endpoint, s in summary.items():
+        peak = max(s["histogram"]) or 1
+        cells = "".join(
+            f"<td>{n} <span style='display:inline-block;background:#4a90d9;height:8px;width:{int(40 * n / peak)}px'></span></td>"
+            for n in s["histogram"]
+        )
+        rows.append(
+            f"<tr><td>{html.escape(endpoint)}</td><td>{s['count']}</td><td>{_fmt(s['total_ms'])}</td>"
+            f"<td>{_fmt(s['p50_ms'])}</td><td>{_fmt(s['p95_ms'])}</td><td>{_fmt(s['max_ms'])}</td>{cells}</tr>"
+        )
+    return (
+        "<h2>HTTP request timings</h2><table><tr><th>endpoint</th><th>count</th><th>total ms</th>"
+        f"<th>p50</th><th>p95</th><th>max</th>{head}</tr>{''.join(rows)}</table>"
+    )
+
+
+class _HtmlReportHooks:
+    """pytest-html specific hooks, registered only when pytest-html is active."""
+
+    def __init__(self, recorder: RequestTimingRecorder):
+        self.recorder = recorder
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "teardown":
+            return
+        records = self.recorder.for_test(item.nodeid)
+        if records:
+            from pytest_html import extras
+
+            report.extras = getattr(report, "extras", []) + [extras.html(requests_table(records))]
+
+    def pytest_html_results_summary(self, prefix, summary, postfix):
+        endpoints = self.recorder.endpoint_summary()
+        if endpoints:
+            prefix.append(timings_summary(endpoints))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--request-timings-json",
+        default="reports/request_timings.json",
+        help="Where to write per-request timings as JSON (empty string disables). Default: reports/request_timings.json",
+    )
+
+
+def pytest_configure(config):
+    recorder = RequestTimingRecorder()
+    config.stash[_recorder_key] = recorder
+    if config.pluginmanager.hasplugin("html"):
+        config.pluginmanager.register(_HtmlReportHooks(recorder), "request_timing_html")
+
+
+def _set_phase(item, phase):
+    recorder = item.config.stash[_recorder_key]
+    recorder.test, recorder.phase = item.nodeid, phase
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.config.stash[_recorder_key].start_test(item.nodeid)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    _set_phase(item, "call")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item):
+    _set_phase(item, "teardown")
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    recorder = config.stash.get(_recorder_key, None)
+    target = config.getoption("--request-timings-json")
+    if recorder is None or not target or not recorder.seen:
+        return
+    path = Path(target)
+    worker = getattr(config, "workerinput", {}).get("workerid")
+    if worker:
+        # every xdist worker writes its own file next to the configured one
+        path = path.with_name(f"{path.stem}.{worker}{path.suffix}")
+    if not path.is_absolute():
+        path = Path(config.rootpath) / path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(recorder.to_json(), indent=2), encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def request_timing(pytestconfig) -> RequestTimingRecorder:
+    """The session's request timing recorder; pass it as a hook to API clients."""
+    return pytestconfig.stash[_recorder_key]
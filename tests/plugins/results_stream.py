@@ -0,0 +1,193 @@
+"""
+Pytest plugin: stream one JSON line per test to reports/results.jsonl as tests finish.
+
+    pytest --results-jsonl=reports/results.jsonl --results-html=reports/report.html
+    python -m tests.report reports/results.jsonl -o reports/report.html
+
+Each line holds the test's outcome, phase durations and the HTTP requests it made
+(from the request_timing recorder). Failure text and captured output (e.g. the HTTP
+request history from request_capture.py) are kept for failing tests only, capped at --results-capture-kb.
+Nothing accumulates in memory: a test's line is written and flushed at the end of
+its teardown. The HTML report is rendered from the file afterwards, one line at a
+time (see tests/report/render.py), so report time and memory stay flat however
+many tests run. Under xdist the controller writes the file from the workers' reports.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from tests.plugins.request_timing import _recorder_key
+
+# Request fields copied into the results line
+REQUEST_FIELDS = ("phase", "method", "path", "status", "error", "duration_ms", "request_bytes", "response_bytes")
+MAX_REQUESTS_PER_TEST = 200
+
+_writer_key = pytest.StashKey["ResultsWriter"]()
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + f"\n...({len(text) - limit} more characters truncated)"
+
+
+class ResultsWriter:
+    """Appends one JSON line per finished test; the file is flushed after every line."""
+
+    def __init__(self, path: Path, capture_limit: int = 16 * 1024):
+        self.path = path
+        self.capture_limit = capture_limit
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._open: Dict[str, Dict[str, Any]] = {}  # nodeid -> line being built (tests still running)
+        self.written = 0
+
+    def _line(self, nodeid: str) -> Dict[str, Any]:
+        line = self._open.get(nodeid)
+        if line is None:
+            line = self._open[nodeid] = {"nodeid": nodeid, "outcome": "passed", "duration_s": 0.0, "phases": {}}
+        return line
+
+    def add(self, report) -> None:
+        """Fold one phase report into the test's line; write the line at teardown."""
+        with self._lock:
+            line = self._line(report.nodeid)
+        line["phases"][report.when] = round(report.duration, 6)
+        line["duration_s"] = round(line["duration_s"] + report.duration, 6)
+
+        if hasattr(report, "wasxfail"):
+            line["outcome"] = "xfailed" if report.skipped else "xpassed"
+        elif report.failed:
+            line["outcome"] = "failed" if report.when == "call" else "error"
+            line["failed_in"] = report.when
+            line["longrepr"] = _truncate(report.longreprtext, self.capture_limit)
+            captured = "".join(f"----- {name} -----\n{content}\n" for name, content in report.sections)
+            if captured:
+                line["captured"] = _truncate(captured, self.capture_limit)
+        else:
+            if report.skipped and line["outcome"] == "passed":
+                line["outcome"] = "skipped"
+                if isinstance(report.longrepr, tuple):
+                    line["skip_reason"] = report.longrepr[2]
+            # sampled request history of passing tests (see request_capture.py)
+            sampled = "".join(f"----- {name} -----\n{content}\n" for name, content in report.sections if name.startswith("HTTP requests"))
+            if sampled:
+                line["captured"] = _truncate(sampled, self.capture_limit)
+
+        for attr in ("worker", "requests", "requests_dropped"):
+            if hasattr(report, f"results_{attr}"):
+                line[attr] = getattr(report, f"results_{attr}")
+
+        if report.when == "teardown":
+            line["stop"] = round(time.time(), 3)
+            with self._lock:
+                del self._open[report.nodeid]
+                self._file.write(json.dumps(line, ensure_ascii=False) + "\n")
+                self._file.flush()
+                self.written += 1
+
+    def close(self) -> None:
+        with self._lock:
+            # tests interrupted mid-run still get their line
+            for line in self._open.values():
+                line["outcome"] = "interrupted"
+                self._file.write(json.dumps(line, ensure_ascii=False) + "\n")
+            self._open.clear()
+            self._file.close()
+
+
+class _LogReportHook:
+    """Feeds phase reports to the writer; registered only when the stream is enabled."""
+
+    def __init__(self, writer: ResultsWriter):
+        self.writer = writer
+
+    def pytest_runtest_logreport(self, report):
+        self.writer.add(report)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--results-jsonl",
+        default="reports/results.jsonl",
+        help="Stream one JSON line per test to this file (empty string disables). Default: reports/results.jsonl",
+    )
+    group.addoption(
+        "--results-html",
+        default="",
+        help="Render an HTML report from the results stream at the end of the run (e.g. reports/report.html).",
+    )
+    group.addoption(
+        "--results-capture-kb",
+        type=int,
+        default=16,
+        help="Per-test cap (KiB) on failure text and captured output kept in the results stream. Default: 16",
+    )
+
+
+def _path(config, option: str) -> Optional[Path]:
+    target = config.getoption(option)
+    if not target:
+        return None
+    path = Path(target)
+    return path if path.is_absolute() else Path(config.rootpath) / path
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        return  # the xdist controller writes the stream
+    path = _path(config, "--results-jsonl")
+    if path is not None:
+        writer = ResultsWriter(path, capture_limit=config.getoption("--results-capture-kb") * 1024)
+        config.stash[_writer_key] = writer
+        config.pluginmanager.register(_LogReportHook(writer), "results_stream_writer")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "teardown":
+        return
+    # attached to the report so it reaches the xdist controller with it
+    worker = getattr(item.config, "workerinput", {}).get("workerid")
+    if worker:
+        report.results_worker = worker
+    recorder = item.config.stash.get(_recorder_key, None)
+    records = recorder.for_test(item.nodeid) if recorder is not None else []
+    if records:
+        report.results_requests = [
+            {**{k: r[k] for k in REQUEST_FIELDS}, "duration_ms": round(r["duration_ms"], 3)}
+            for r in records[:MAX_REQUESTS_PER_TEST]
+        ]
+        if len(records) > MAX_REQUESTS_PER_TEST:
+            report.results_requests_dropped = len(records) - MAX_REQUESTS_PER_TEST
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    writer = config.stash.get(_writer_key, None)
+    if writer is None:
+        return
+    writer.close()
+    html_path = _path(config, "--results-html")
+    if html_path is not None:
+        from tests.report.render import render_html
+
+        render_html(writer.path, html_path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    writer = config.stash.get(_writer_key, None)
+    if writer is None:
+        return
+    terminalreporter.write_sep("-", f"results stream: {writer.path} ({writer.written} tests)")
+    html_path = _path(config, "--results-html")
+    if html_path is not None:
+        terminalreporter.write_sep("-", f"results report: {html_path}")
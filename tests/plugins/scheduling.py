@@ -0,0 +1,107 @@
+"""
+Pytest plugin: order tests using their durations from earlier runs.
+
+Every run stores per-test durations (setup + call + teardown, smoothed across
+runs) in the pytest cache under "scheduling/durations" for the next run to use.
+
+Under pytest-xdist (`-n N`, `--dist load` or `worksteal`) tests are sent
+longest-first, so workers pull the slow, fixture-heavy contact tests early and
+finish with short ones instead of one worker ending on a long tail.
+
+Serial runs keep collection order: pytest already keeps tests that share a
+module- or class-scoped fixture together, session fixtures are set up once
+whatever the order, and function fixtures are rebuilt for every test, so
+reordering there would not save any setup.
+
+    pytest -n 4                   # default: longest-first on the workers
+    pytest -n 4 --schedule=off    # keep collection order (durations are still recorded)
+
+Tests without history are treated as taking the average known duration.
+`pytest --cache-clear` forgets the history.
+"""
+from typing import Dict, Iterable, List, Sequence
+
+import pytest
+
+DURATIONS_KEY = "scheduling/durations"
+# Weight of the latest run in the stored duration (the rest is history)
+SMOOTHING = 0.5
+
+
+def estimate(nodeids: Iterable[str], history: Dict[str, float]) -> Dict[str, float]:
+    """Expected duration per test; tests without history get the mean known duration (or 1s)."""
+    nodeids = list(nodeids)
+    known = [history[n] for n in nodeids if n in history]
+    default = sum(known) / len(known) if known else 1.0
+    return {n: history.get(n, default) for n in nodeids}
+
+
+def longest_first(nodeids: Sequence[str], expected: Dict[str, float]) -> List[str]:
+    """Longest expected duration first; ties keep collection order (so every xdist worker agrees)."""
+    return [n for _, n in sorted(enumerate(nodeids), key=lambda p: (-expected[p[1]], p[0]))]
+
+
+def _cache(config):
+    """The pytest cache, or None when the cacheprovider plugin is disabled (-p no:cacheprovider)."""
+    return getattr(config, "cache", None)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--schedule",
+        choices=("auto", "off"),
+        default="auto",
+        help="auto: under pytest-xdist, send tests longest-first by recorded durations; "
+        "off: keep collection order. Serial runs always keep collection order.",
+    )
+
+
+def pytest_configure(config):
+    if _cache(config) is not None:
+        config.pluginmanager.register(DurationRecorder(config), "scheduling-durations")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    cache = _cache(config)
+    if config.getoption("--schedule") == "off" or cache is None or len(items) < 2:
+        return
+    if not hasattr(config, "workerinput"):
+        return  # serial run: collection order already sets every scoped fixture up once
+    history = cache.get(DURATIONS_KEY, {})
+    if not history:
+        return
+
+    by_id = {item.nodeid: item for item in items}
+    order = longest_first([item.nodeid for item in items], estimate(by_id, history))
+    items[:] = [by_id[n] for n in order]
+
+
+class DurationRecorder:
+    """
+    Sums each test's phase durations and merges them into the cache at session end.
+    Under xdist the controller receives every worker's reports, so only it saves.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.runs: Dict[str, float] = {}
+        self.skipped = set()
+
+    def pytest_runtest_logreport(self, report):
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+        self.runs[report.nodeid] = self.runs.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        cache = _cache(self.config)
+        if hasattr(self.config, "workerinput") or cache is None:
+            return  # the xdist controller saves the merged durations
+        history = cache.get(DURATIONS_KEY, {})
+        for nodeid, seconds in self.runs.items():
+            if nodeid in self.skipped:
+                continue  # a skip says nothing about how long the test takes
+            previous = history.get(nodeid)
+            history[nodeid] = seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+        cache.set(DURATIONS_KEY, {k: round(v, 4) for k, v in sorted(history.items())})
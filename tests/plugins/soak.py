@@ -0,0 +1,93 @@
+"""
+Pytest plugin: memory tracking for soak runs.
+
+    pytest --soak-every=500                       # sample memory every 500 requests
+    pytest --soak-every=500 --soak-json=reports/soak.json
+
+With --soak-every=N the API clients built by the fixtures report to a MemorySampler
+(tests/tests_api/helpers/memory.py): every N requests it records this process's
+RSS, the RSS of the Playwright driver and the heap traced by tracemalloc, and
+attributes the growth to the endpoints called since the previous sample. The
+terminal summary shows the growth per 1,000 requests per endpoint and the source
+lines that grew most; the samples are written to --soak-json. Under xdist every
+worker samples its own process and writes its own file (soak-gw0.json, ...).
+tracemalloc slows allocation-heavy code down, so this is off by default.
+"""
+import json
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from tests.tests_api.helpers.memory import MemorySampler
+
+_sampler_key = pytest.StashKey[MemorySampler]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--soak-every",
+        type=int,
+        default=0,
+        help="Sample RSS and tracemalloc every N API requests and report growth per endpoint (0 = off). Default: 0",
+    )
+    group.addoption(
+        "--soak-json",
+        default="reports/soak.json",
+        help="Where --soak-every writes its samples (one file per xdist worker). Default: reports/soak.json",
+    )
+
+
+def _json_path(config) -> Path:
+    path = Path(config.getoption("--soak-json"))
+    if not path.is_absolute():
+        path = Path(config.rootpath) / path
+    worker = getattr(config, "workerinput", {}).get("workerid")
+    return path.with_name(f"{path.stem}-{worker}{path.suffix}") if worker else path
+
+
+def pytest_configure(config):
+    every = config.getoption("--soak-every")
+    if every > 0:
+        config.stash[_sampler_key] = MemorySampler(every=every).start()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    # the last sample is taken before session fixtures stop the Playwright drivers
+    sampler = item.config.stash.get(_sampler_key, None)
+    if sampler is not None and nextitem is None:
+        sampler.stop()
+
+
+def pytest_sessionfinish(session):
+    sampler = session.config.stash.get(_sampler_key, None)
+    if sampler is None:
+        return
+    sampler.stop()
+    if not sampler.endpoint_growth():
+        return  # e.g. the xdist controller, which makes no requests
+    path = _json_path(session.config)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(sampler.to_json(), indent=2), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    sampler = config.stash.get(_sampler_key, None)
+    if sampler is None:
+        return
+    tr = terminalreporter
+    tr.section("memory (soak)")
+    if sampler.endpoint_growth():
+        tr.write_line(sampler.format_table())
+        tr.write_line(f"samples: {_json_path(config)}")
+    else:
+        path = _json_path(config)
+        tr.write_line(f"no requests sampled in this process; workers write {path.stem}-<worker>{path.suffix} next to {path}")
+
+
+@pytest.fixture(scope="session")
+def memory_sampler(pytestconfig) -> Optional[MemorySampler]:
+    """The session's MemorySampler (None unless --soak-every is set); add it to API client hooks."""
+    return pytestconfig.stash.get(_sampler_key, None)
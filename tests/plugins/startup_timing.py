@@ -0,0 +1,65 @@
+"""
+Pytest plugin: show where start-up time goes.
+
+    pytest --startup-timings
+
+Reports, in the terminal summary, the time from pytest_configure to the end of
+collection and the slowest fixture setups. Setup times include the fixtures they
+pull in; session-scoped ones such as the Playwright driver, the local API or the
+contact pool dominate a short run.
+"""
+import time
+from collections import defaultdict
+
+import pytest
+
+_timings_key = pytest.StashKey["StartupTimings"]()
+
+TOP_FIXTURES = 10
+
+
+class StartupTimings:
+    def __init__(self):
+        self.configured = time.perf_counter()
+        self.collected = None
+        self.fixtures = defaultdict(lambda: [0, 0.0])  # "scope name" -> [setups, seconds]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        started = time.perf_counter()
+        yield
+        entry = self.fixtures[f"{fixturedef.scope} {fixturedef.argname}"]
+        entry[0] += 1
+        entry[1] += time.perf_counter() - started
+
+    def pytest_collection_finish(self, session):
+        self.collected = time.perf_counter()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        tr = terminalreporter
+        tr.section("start-up timings")
+        if self.collected is not None:
+            tr.write_line(f"configure -> collection finished: {(self.collected - self.configured) * 1000:.0f} ms")
+        slowest = sorted(self.fixtures.items(), key=lambda kv: kv[1][1], reverse=True)[:TOP_FIXTURES]
+        if not slowest:
+            return
+        tr.write_line(f"slowest fixture setups (top {len(slowest)}):")
+        for name, (count, seconds) in slowest:
+            tr.write_line(f"  {seconds * 1000:9.1f} ms  {name}" + (f" (x{count})" if count > 1 else ""))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api")
+    group.addoption(
+        "--startup-timings",
+        action="store_true",
+        default=False,
+        help="Report collection time and the slowest fixture setups in the terminal summary.",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--startup-timings"):
+        timings = StartupTimings()
+        config.stash[_timings_key] = timings
+        config.pluginmanager.register(timings, "startup-timings")
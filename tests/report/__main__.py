@@ -0,0 +1,5 @@
+import sys
+
+from tests.report.render import main
+
+sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Render the HTML report from a results stream (see tests/plugins/results_stream.py).
+
+    python -m tests.report reports/results.jsonl -o reports/report.html
+
+The JSONL file is read twice, one line at a time: once for the summary counts and
+once to write the rows, so memory does not grow with the number of tests. The
+first pass also folds every test's HTTP requests into constant-size per-endpoint
+aggregates for the "HTTP request timings" section (percentiles and a latency
+histogram per endpoint). Each test is one table row; failures expand to their
+traceback, captured output and HTTP requests, and passing tests that made
+requests expand to their request table. Lines that cannot be parsed (e.g. a run
+killed mid-write) are skipped.
+"""
+import argparse
+import html
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, TextIO
+
+from tests.plugins.request_timing import requests_table, timings_summary
+from tests.stats import LatencySummary
+
+OUTCOME_COLOURS = {
+    "passed": "#2e7d32",
+    "failed": "#c62828",
+    "error": "#c62828",
+    "skipped": "#757575",
+    "xfailed": "#757575",
+    "xpassed": "#ef6c00",
+    "interrupted": "#ef6c00",
+}
+
+_STYLE = (
+    "body{font-family:sans-serif;font-size:13px}table{border-collapse:collapse;width:100%}"
+    "td,th{border:1px solid #ddd;padding:2px 6px;text-align:left;vertical-align:top}"
+    "pre{white-space:pre-wrap;margin:4px 0;max-height:40em;overflow:auto;background:#f7f7f7}"
+)
+
+
+def iter_results(path) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            try:
+                yield json.loads(raw)
+            except ValueError:
+                continue
+
+
+def _row(result: Dict[str, Any]) -> str:
+    outcome = result.get("outcome", "?")
+    requests = result.get("requests") or []
+    http_ms = sum(r["duration_ms"] for r in requests)
+    name = html.escape(result.get("nodeid", "?"))
+    details = ""
+    if outcome in ("failed", "error", "xpassed", "interrupted") or result.get("captured"):
+        parts = [f"<pre>{html.escape(result[k])}</pre>" for k in ("longrepr", "captured") if result.get(k)]
+        if requests:
+            parts.append(requests_table(requests))
+        if parts:
+            details = f"<details><summary>{name}</summary>{''.join(parts)}</details>"
+    elif result.get("skip_reason"):
+        details = f"{name}<br><small>{html.escape(result['skip_reason'])}</small>"
+    elif requests:
+        details = f"<details><summary>{name}</summary>{requests_table(requests)}</details>"
+    colour = OUTCOME_COLOURS.get(outcome, "#000")
+    return (
+        f"<tr><td style='color:{colour}'>{html.escape(outcome)}</td><td>{details or name}</td>"
+        f"<td>{result.get('duration_s', 0):.3f}</td><td>{len(requests)}</td><td>{http_ms:.1f}</td>"
+        f"<td>{html.escape(result.get('worker', ''))}</td></tr>\n"
+    )
+
+
+def _write_summary(out: TextIO, source: Path, counts: Counter, total_s: float) -> None:
+    cells = ", ".join(
+        f"<span style='color:{OUTCOME_COLOURS.get(k, '#000')}'>{n} {html.escape(k)}</span>" for k, n in sorted(counts.items())
+    )
+    out.write(
+        f"<h1>Test results</h1><p>{sum(counts.values())} tests, {total_s:.2f} s in tests: {cells or 'none'}</p>"
+        f"<p><small>from {html.escape(str(source))}</small></p>\n"
+    )
+
+
+def render_html(source, target) -> int:
+    """Write the HTML report for the results stream `source` to `target`; returns the number of tests."""
+    source, target = Path(source), Path(target)
+    counts: Counter = Counter()
+    total_s = 0.0
+    endpoints: Dict[str, LatencySummary] = {}
+    for result in iter_results(source):
+        counts[result.get("outcome", "?")] += 1
+        total_s += result.get("duration_s", 0.0)
+        for r in result.get("requests") or ():
+            endpoint = f"{r['method']} {r['path']}"
+            if endpoint not in endpoints:
+                endpoints[endpoint] = LatencySummary()
+            endpoints[endpoint].add(r["duration_ms"])
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "w", encoding="utf-8") as out:
+        out.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test results</title><style>{_STYLE}</style></head><body>\n")
+        _write_summary(out, source, counts, total_s)
+        if endpoints:
+            out.write(timings_summary({e: s.to_dict() for e, s in sorted(endpoints.items())}) + "\n")
+        out.write("<table><tr><th>outcome</th><th>test</th><th>s</th><th>requests</th><th>HTTP ms</th><th>worker</th></tr>\n")
+        for result in iter_results(source):
+            out.write(_row(result))
+        out.write("</table></body></html>\n")
+    return sum(counts.values())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.report", description="Render HTML from a results stream.")
+    parser.add_argument("source", nargs="?", default="reports/results.jsonl", help="results stream (default: reports/results.jsonl)")
+    parser.add_argument("-o", "--output", default="reports/report.html", help="HTML file to write (default: reports/report.html)")
+    args = parser.parse_args(argv)
+    n = render_html(args.source, args.output)
+    print(f"{n} tests -> {args.output}")
+    return 0
@@ -0,0 +1,67 @@
+"""
+Latency statistics shared by the pytest plugins, the HTML report and the load runner.
+"""
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+HISTOGRAM_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted sequence (None when empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def bucket_index(duration_ms: float) -> int:
+    """Index into HISTOGRAM_BUCKETS_MS of the first bucket above `duration_ms` (the overflow bucket last)."""
+    for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+        if duration_ms < bound:
+            return i
+    return len(HISTOGRAM_BUCKETS_MS)
+
+
+class LatencySummary:
+    """
+    Constant-memory latency aggregate: count, total, max and a histogram are exact;
+    percentiles come from a uniform reservoir of at most `reservoir` durations
+    (exact until that many have been added). Not thread-safe; callers lock.
+    """
+
+    def __init__(self, reservoir: int = 2000, seed: Optional[int] = 0):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms: Optional[float] = None
+        self.histogram: List[int] = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self._size = reservoir
+        self._sample: List[float] = []
+        self._random = random.Random(seed)
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = duration_ms if self.max_ms is None else max(self.max_ms, duration_ms)
+        self.histogram[bucket_index(duration_ms)] += 1
+        if len(self._sample) < self._size:
+            self._sample.append(duration_ms)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self._size:
+                self._sample[slot] = duration_ms
+
+    def percentile(self, pct: float) -> Optional[float]:
+        return percentile(sorted(self._sample), pct)
+
+    def to_dict(self) -> Dict[str, Any]:
+        values = sorted(self._sample)
+        return {
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "max_ms": self.max_ms,
+            "histogram": list(self.histogram),
+        }
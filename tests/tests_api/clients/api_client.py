@@ -1,16 +1,59 @@
-import json as _json
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from . import codec
+from .capture import RequestCapture
+from .concurrency import AdaptiveConcurrency
+from .http_cache import ResponseCache
+from .instrumentation import HookList, RequestHook, body_size, make_record
+from .response import ApiResponse
+
+_VALIDATOR_HEADERS = ("if-none-match", "if-modified-since")
 
 
 class ApiClient:
     """
     Wrapper around Playwright's APIRequestContext.
-    Accepts `json=` in methods (like requests) and converts it to a JSON body
-    suitable for Playwright's request methods that expect `data=` / raw body.
+    Accepts `json=` in methods (like requests) and serializes it once to UTF-8 bytes
+    with the configured codec (see codec.py); bytes are sent as already-serialized JSON.
+
+    Every call is timed and reported to the request hooks (see instrumentation.py).
+    With `concurrency=AdaptiveConcurrency(...)` calls are admitted by the shared AIMD
+    limiter and throttled idempotent requests are retried (see concurrency.py).
+    With `cache=ResponseCache(...)` GETs are revalidated with ETag/Last-Modified and
+    304s are answered from the cache; writes invalidate the affected paths (see http_cache.py).
+    GETs that already carry If-None-Match / If-Modified-Since bypass the cache.
+    With `capture=RequestCapture(...)` the last exchanges are kept, unformatted, for failure reports.
+    With `auth=TokenRefresher(...)` a 401 for a tracked session token triggers one new login and
+    the call is sent again with the new token (see helpers/token_cache.py).
+    Responses are returned as ApiResponse objects, which read and parse the body at most once.
+    With `release_bodies=True` every response is released on return: the body is buffered and
+    the Playwright response disposed, so the driver does not hold it for the rest of the session.
+    `release=True/False` on a call overrides the client default.
     """
 
-    def __init__(self, request_context):
+    def __init__(
+        self,
+        request_context,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        cache: Optional[ResponseCache] = None,
+        capture: Optional[RequestCapture] = None,
+        release_bodies: bool = False,
+        auth=None,
+    ):
         self._ctx = request_context
+        self.hooks = HookList(hooks)
+        # optional AIMD limiter (see concurrency.py): caps in-flight requests and retries throttled idempotent calls
+        self.concurrency = concurrency
+        # optional conditional-GET cache (see http_cache.py)
+        self.cache = cache
+        # optional ring buffer of recent exchanges, dumped when a test fails (see capture.py)
+        self.capture = capture
+        # buffer bodies and dispose Playwright responses as soon as they are returned (see ApiResponse.release)
+        self.release_bodies = release_bodies
+        # optional TokenRefresher (see helpers/token_cache.py): logs in again when a session token gets a 401
+        self.auth = auth
 
     def _auth_headers(self, token: Optional[str]) -> Dict[str, str]:
         return {"Authorization": f"Bearer {token}"} if token else {}
@@ -21,68 +64,157 @@ class ApiClient:
         headers.setdefault("Content-Type", "application/json")
         return headers
 
+    def _send(self, method: str, path: str, token: Optional[str], json: Any = None, data: Any = None, **kwargs):
+        base_headers = dict(kwargs.pop("headers", None) or {})
+        retry = kwargs.pop("retry", None)  # override the idempotent-methods-only retry rule
+        release = kwargs.pop("release", self.release_bodies)
+
+        if json is not None:
+            base_headers = self._prepare_headers_for_json(base_headers)
+            data = codec.dumps(json)  # bytes pass through unchanged
+        if data is not None:
+            kwargs["data"] = data
+        if token and self.auth is not None:
+            token = self.auth.current(token)
+
+        refreshed = False
+        while True:
+            headers = dict(base_headers)
+            headers.update(self._auth_headers(token))
+            try:
+                resp = self._exchange(method, path, headers, kwargs, retry)
+            except Exception as e:
+                if self.capture is not None:
+                    self.capture.add(method, path, headers, kwargs, error=e)
+                raise
+            if refreshed or resp.status != 401 or not token or self.auth is None:
+                break
+            fresh = self.auth.refresh(token)
+            if fresh is None:
+                break
+            # the session token was revoked: keep the 401 in the capture and send again with the new one
+            if self.capture is not None:
+                self.capture.add(method, path, headers, kwargs, resp)
+            resp.release()
+            token, refreshed = fresh, True
+
+        if release:
+            resp.release()
+        if self.capture is not None:
+            self.capture.add(method, path, headers, kwargs, resp)
+        return resp
+
+    def _exchange(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any], retry: Optional[bool]):
+        if self.cache is None:
+            return ApiResponse(self._dispatch(method, path, headers, kwargs, retry))
+        if method != "GET":
+            try:
+                return ApiResponse(self._dispatch(method, path, headers, kwargs, retry))
+            finally:
+                self.cache.invalidate(path)
+
+        if any(name.lower() in _VALIDATOR_HEADERS for name in headers):
+            # the caller revalidates on its own: send its validators and hand back whatever comes
+            return ApiResponse(self._dispatch(method, path, headers, kwargs, retry))
+
+        key = self.cache.key(path, kwargs.get("params"), headers.get("Authorization"))
+        validators = self.cache.conditional_headers(key)
+        headers.update(validators)
+        raw = self._dispatch(method, path, headers, kwargs, retry)
+        if raw.status == 304 and validators:
+            cached = self.cache.not_modified(key)
+            if hasattr(raw, "dispose"):
+                raw.dispose()  # the empty 304 is not returned
+            if cached is not None:
+                return ApiResponse(cached)
+            # the entry was evicted while the request was out: ask again, unconditionally
+            for name in validators:
+                del headers[name]
+            raw = self._dispatch(method, path, headers, kwargs, retry)
+        resp = ApiResponse(raw)
+        self.cache.store(key, resp)
+        return resp
+
+    def _dispatch(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any], retry: Optional[bool]):
+        if self.concurrency is None:
+            return self._fetch(method, path, headers, kwargs)
+        return self._fetch_limited(method, path, headers, kwargs, retry)
+
+    def _fetch(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any]):
+        if not self.hooks:
+            return self._ctx.fetch(path, method=method, headers=headers, **kwargs)
+
+        data = kwargs.get("data")
+        started = time.time()
+        t0 = time.perf_counter()
+        try:
+            resp = self._ctx.fetch(path, method=method, headers=headers, **kwargs)
+        except Exception as e:
+            self.hooks.emit(make_record(method, path, started, (time.perf_counter() - t0) * 1000.0, body_size(data), error=e))
+            raise
+        self.hooks.emit(make_record(method, path, started, (time.perf_counter() - t0) * 1000.0, body_size(data), resp=resp))
+        return resp
+
+    def _fetch_limited(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any], retry: Optional[bool]):
+        limiter = self.concurrency
+        attempt = 0
+        while True:
+            slot = limiter.acquire()
+            try:
+                resp = self._fetch(method, path, headers, kwargs)
+            except Exception:
+                limiter.release(slot, None)
+                raise
+            limiter.release(slot, resp.status, resp.headers)
+            delay = None if retry is False else limiter.retry_delay(method, resp.status, resp.headers, attempt, force=bool(retry))
+            if delay is None:
+                return resp
+            if hasattr(resp, "dispose"):
+                resp.dispose()
+            attempt += 1
+            time.sleep(delay)
+
     def get(self, path: str, token: Optional[str] = None, params: Dict[str, Any] = None, **kwargs):
-        headers = kwargs.pop("headers", {})
-        headers.update(self._auth_headers(token))
-        return self._ctx.get(path, params=params, headers=headers, **kwargs)
+        return self._send("GET", path, token, params=params, **kwargs)
 
     def post(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs):
         """
-        If `json` is provided, it will be serialized and sent as the request body
-        with Content-Type: application/json. Otherwise `data` is forwarded as-is.
+        If `json` is provided, it will be serialized (bytes are sent unchanged) as the
+        request body with Content-Type: application/json. Otherwise `data` is forwarded as-is.
         """
-        headers = kwargs.pop("headers", {})
-        headers.update(self._auth_headers(token))
-
-        if json is not None:
-            headers = self._prepare_headers_for_json(headers)
-            body = _json.dumps(json)
-            return self._ctx.post(path, data=body, headers=headers, **kwargs)
-        else:
-            return self._ctx.post(path, data=data, headers=headers, **kwargs)
+        return self._send("POST", path, token, json=json, data=data, **kwargs)
 
     def put(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs):
-        headers = kwargs.pop("headers", {})
-        headers.update(self._auth_headers(token))
-
-        if json is not None:
-            headers = self._prepare_headers_for_json(headers)
-            body = _json.dumps(json)
-            return self._ctx.put(path, data=body, headers=headers, **kwargs)
-        else:
-            return self._ctx.put(path, data=data, headers=headers, **kwargs)
+        return self._send("PUT", path, token, json=json, data=data, **kwargs)
 
     def patch(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs):
-        headers = kwargs.pop("headers", {})
-        headers.update(self._auth_headers(token))
-
-        if json is not None:
-            headers = self._prepare_headers_for_json(headers)
-            body = _json.dumps(json)
-            return self._ctx.patch(path, data=body, headers=headers, **kwargs)
-        else:
-            return self._ctx.patch(path, data=data, headers=headers, **kwargs)
+        return self._send("PATCH", path, token, json=json, data=data, **kwargs)
 
     def delete(self, path: str, token: Optional[str] = None, **kwargs):
-        headers = kwargs.pop("headers", {})
-        headers.update(self._auth_headers(token))
-        return self._ctx.delete(path, headers=headers, **kwargs)
+        return self._send("DELETE", path, token, **kwargs)
 
     # ---- Helper methods for user auth ----
-    def register_user(self, token: str, email: str, password: str):
+    def register_user(self, token: str, email: str, password: str, first_name: str = None, last_name: str = None):
         """
         Register a new user. Requires token because API needs auth for creation.
-        Returns the Playwright Response object.
+        `first_name` / `last_name` are sent when given (the API requires them for new users).
+        Returns an ApiResponse.
         """
         if not token:
             raise ValueError("register_user requires an authorization token (pass token=<str>).")
-        return self.post("/users", token=token, json={"email": email, "password": password})
+        body = {"email": email, "password": password}
+        if first_name is not None:
+            body["firstName"] = first_name
+        if last_name is not None:
+            body["lastName"] = last_name
+        return self.post("/users", token=token, json=body)
 
     def login_user(self, email: str, password: str) -> Optional[str]:
         """
         Login and return the token string (if present) or None.
         """
-        resp = self.post("/users/login", json={"email": email, "password": password})
+        # logging in has no side effects, so it may be retried like an idempotent call
+        resp = self.post("/users/login", json={"email": email, "password": password}, retry=True)
         try:
             body = resp.json()
         except Exception:
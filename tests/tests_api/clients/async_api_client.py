@@ -0,0 +1,240 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import codec
+from .concurrency import AdaptiveConcurrency
+from .instrumentation import HookList, RequestHook, body_size, make_record
+from .response import AsyncReleasedResponse
+
+
+class AsyncApiClient:
+    """
+    Async counterpart of ApiClient, wrapping Playwright's async APIRequestContext.
+    Exposes the same get/post/put/patch/delete/login_user/register_user surface
+    (as coroutines) plus batch helpers that fan requests out concurrently.
+
+    All requests go through a semaphore so at most `max_concurrency` calls are
+    in flight at any time. Calls are reported to request hooks like ApiClient's;
+    the measured duration excludes time spent waiting for the semaphore.
+    With `concurrency=AdaptiveConcurrency(...)` the AIMD limiter further adapts the
+    number of in-flight calls to server pushback and retries throttled idempotent calls.
+    With `release_bodies=True` (or `release=True` on a call) the body is read and the Playwright
+    response disposed before the call returns; an AsyncReleasedResponse is returned instead.
+    """
+
+    def __init__(
+        self,
+        request_context,
+        max_concurrency: int = 8,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        release_bodies: bool = False,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._ctx = request_context
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.hooks = HookList(hooks)
+        self.concurrency = concurrency
+        self.release_bodies = release_bodies
+
+    def _auth_headers(self, token: Optional[str]) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    def _prepare_headers_for_json(self, headers: Dict[str, str]) -> Dict[str, str]:
+        # ensure we don't overwrite a pre-existing Content-Type
+        headers = dict(headers or {})
+        headers.setdefault("Content-Type", "application/json")
+        return headers
+
+    async def _send(self, method: str, path: str, token: Optional[str], json: Any = None, data: Any = None, **kwargs):
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.update(self._auth_headers(token))
+        retry = kwargs.pop("retry", None)  # override the idempotent-methods-only retry rule
+        release = kwargs.pop("release", self.release_bodies)
+
+        if json is not None:
+            headers = self._prepare_headers_for_json(headers)
+            data = codec.dumps(json)  # bytes pass through unchanged
+        if data is not None:
+            kwargs["data"] = data
+
+        async with self._semaphore:
+            if self.concurrency is None:
+                resp = await self._fetch(method, path, headers, kwargs)
+            else:
+                resp = await self._fetch_limited(method, path, headers, kwargs, retry)
+        return await self._release(resp) if release else resp
+
+    @staticmethod
+    async def _release(resp):
+        try:
+            body = await resp.body()
+        except Exception:
+            return resp  # unreadable body: hand the response back as if release was off
+        await resp.dispose()
+        return AsyncReleasedResponse(resp, body)
+
+    async def _fetch(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any]):
+        if not self.hooks:
+            return await self._ctx.fetch(path, method=method, headers=headers, **kwargs)
+
+        data = kwargs.get("data")
+        started = time.time()
+        t0 = time.perf_counter()
+        try:
+            resp = await self._ctx.fetch(path, method=method, headers=headers, **kwargs)
+        except Exception as e:
+            self.hooks.emit(make_record(method, path, started, (time.perf_counter() - t0) * 1000.0, body_size(data), error=e))
+            raise
+        self.hooks.emit(make_record(method, path, started, (time.perf_counter() - t0) * 1000.0, body_size(data), resp=resp))
+        return resp
+
+    async def _fetch_limited(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any], retry: Optional[bool]):
+        limiter = self.concurrency
+        attempt = 0
+        while True:
+            slot = await limiter.acquire_async()
+            try:
+                resp = await self._fetch(method, path, headers, kwargs)
+            except Exception:
+                limiter.release(slot, None)
+                raise
+            limiter.release(slot, resp.status, resp.headers)
+            delay = None if retry is False else limiter.retry_delay(method, resp.status, resp.headers, attempt, force=bool(retry))
+            if delay is None:
+                return resp
+            await resp.dispose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, path: str, token: Optional[str] = None, params: Dict[str, Any] = None, **kwargs):
+        return await self._send("GET", path, token, params=params, **kwargs)
+
+    async def post(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs):
+        """
+        If `json` is provided, it will be serialized and sent as the request body
+        with Content-Type: application/json. Otherwise `data` is forwarded as-is.
+        """
+        return await self._send("POST", path, token, json=json, data=data, **kwargs)
+
+    async def put(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs):
+        return await self._send("PUT", path, token, json=json, data=data, **kwargs)
+
+    async def patch(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs):
+        return await self._send("PATCH", path, token, json=json, data=data, **kwargs)
+
+    async def delete(self, path: str, token: Optional[str] = None, **kwargs):
+        return await self._send("DELETE", path, token, **kwargs)
+
+    # ---- Helper methods for user auth ----
+    async def register_user(self, token: str, email: str, password: str, first_name: str = None, last_name: str = None):
+        """
+        Register a new user. Requires token because API needs auth for creation.
+        `first_name` / `last_name` are sent when given (the API requires them for new users).
+        Returns the Playwright APIResponse object (an AsyncReleasedResponse when released).
+        """
+        if not token:
+            raise ValueError("register_user requires an authorization token (pass token=<str>).")
+        body = {"email": email, "password": password}
+        if first_name is not None:
+            body["firstName"] = first_name
+        if last_name is not None:
+            body["lastName"] = last_name
+        return await self.post("/users", token=token, json=body)
+
+    async def login_user(self, email: str, password: str) -> Optional[str]:
+        """
+        Login and return the token string (if present) or None.
+        """
+        # logging in has no side effects, so it may be retried like an idempotent call
+        resp = await self.post("/users/login", json={"email": email, "password": password}, retry=True)
+        try:
+            body = await resp.json()
+        except Exception:
+            body = {}
+
+        for key in ("token", "accessToken", "access_token", "auth_token"):
+            if key in body:
+                return body[key]
+
+        if isinstance(body.get("user"), dict):
+            for key in ("token", "accessToken", "access_token", "auth_token"):
+                if key in body["user"]:
+                    return body["user"][key]
+
+        return None
+
+    # ---- Batch helpers (bounded by the client's semaphore) ----
+    async def gather(self, calls: Iterable[Awaitable], return_exceptions: bool = False) -> List[Any]:
+        """
+        Await many client calls concurrently and return results in input order.
+        Concurrency is already bounded by the semaphore inside each call.
+        """
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def create_contacts(self, token: str, payloads: Iterable[Union[Dict[str, Any], bytes]], return_exceptions: bool = False):
+        """
+        POST /contacts for every payload (dicts, or bytes from generate_contact_payloads(as_bytes=True)).
+        Returns the responses in payload order.
+        """
+        return await self.gather(
+            (self.post("/contacts", token=token, json=p) for p in payloads),
+            return_exceptions=return_exceptions,
+        )
+
+    async def get_contacts(self, token: str, ids: Iterable[str], return_exceptions: bool = False):
+        """GET /contacts/{id} for every id. Returns the responses in id order."""
+        return await self.gather(
+            (self.get(f"/contacts/{cid}", token=token) for cid in ids),
+            return_exceptions=return_exceptions,
+        )
+
+    async def delete_contacts(self, token: str, ids: Iterable[str], return_exceptions: bool = True):
+        """
+        DELETE /contacts/{id} for every id. Exceptions are returned in place of
+        responses by default so that one failed delete does not abort the rest.
+        """
+        return await self.gather(
+            (self.delete(f"/contacts/{cid}", token=token) for cid in ids),
+            return_exceptions=return_exceptions,
+        )
+
+
+class LazyAsyncRequestContext:
+    """
+    Async request context that is only opened on the first fetch().
+
+    `open_context` is a coroutine function returning (context, close coroutine function),
+    e.g. one starting async_playwright and a new APIRequestContext. Until a request is
+    made nothing is started, and dispose() is then a no-op.
+    """
+
+    def __init__(self, open_context: Callable[[], Awaitable[Tuple[Any, Callable[[], Awaitable[None]]]]]):
+        self._open = open_context
+        self._ctx = None
+        self._close = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def opened(self) -> bool:
+        return self._ctx is not None
+
+    async def _context(self):
+        if self._ctx is None:
+            async with self._lock:
+                if self._ctx is None:
+                    self._ctx, self._close = await self._open()
+        return self._ctx
+
+    async def fetch(self, path: str, **kwargs):
+        return await (await self._context()).fetch(path, **kwargs)
+
+    async def dispose(self) -> None:
+        async with self._lock:
+            if self._ctx is None:
+                return
+            close, self._ctx, self._close = self._close, None, None
+            await close()
@@ -0,0 +1,112 @@
+"""
+Ring buffer of the most recent request/response exchanges made through ApiClient.
+
+Each exchange is stored as-is: request headers, the raw body bytes and a reference
+to the response object. Nothing is decoded, pretty-printed or copied while tests
+pass; format() renders the buffer when a test fails (see tests/plugins/request_capture.py),
+so a failure shows the whole request history leading up to it, not only the last
+response. The Authorization header is redacted when formatting.
+
+    capture = RequestCapture(size=20)
+    client = ApiClient(request_context, capture=capture)
+    capture.clear()                # at the start of every test
+    ...
+    print(capture.format())
+"""
+import json as _json
+import time
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from . import codec
+
+REDACTED_HEADERS = ("authorization", "cookie", "set-cookie")
+
+
+class Exchange(NamedTuple):
+    started: float
+    method: str
+    path: str
+    params: Any
+    headers: Dict[str, str]
+    body: Any
+    response: Any = None
+    error: Optional[BaseException] = None
+
+
+def _redact(headers: Dict[str, str]) -> Dict[str, str]:
+    return {k: "<redacted>" if k.lower() in REDACTED_HEADERS else v for k, v in headers.items()}
+
+
+def _render_body(body: Any, limit: int) -> str:
+    if body is None or body == b"" or body == "":
+        return "<empty>"
+    if isinstance(body, (bytes, bytearray, memoryview, str)):
+        try:
+            text = _json.dumps(codec.loads(body), indent=2, ensure_ascii=False)
+        except (ValueError, TypeError):
+            text = body if isinstance(body, str) else bytes(body).decode("utf-8", errors="replace")
+    else:
+        text = repr(body)
+    if len(text) > limit:
+        return text[:limit] + f"\n...({len(text) - limit} more characters truncated)"
+    return text
+
+
+def _indent(text: str) -> str:
+    return "\n".join("    " + line for line in text.splitlines())
+
+
+class RequestCapture:
+    """Keeps the last `size` exchanges. Appends are lock-free (deque), so pooled threads may share it (`seen` is approximate then)."""
+
+    def __init__(self, size: int = 20, body_limit: int = 4000):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.body_limit = body_limit
+        self._buffer: deque = deque(maxlen=size)
+        self.seen = 0
+
+    def add(self, method: str, path: str, headers: Dict[str, str], kwargs: Dict[str, Any], response=None, error=None) -> None:
+        self._buffer.append(
+            Exchange(time.time(), method, path, kwargs.get("params"), headers, kwargs.get("data"), response, error)
+        )
+        self.seen += 1
+
+    def clear(self) -> None:
+        self._buffer.clear()
+        self.seen = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def exchanges(self) -> List[Exchange]:
+        return list(self._buffer)
+
+    def format(self) -> str:
+        """Human-readable dump of the buffered exchanges, oldest first."""
+        entries = self.exchanges()
+        dropped = self.seen - len(entries)
+        lines = [f"({dropped} earlier request(s) not kept)"] if dropped > 0 else []
+        for n, ex in enumerate(entries, 1):
+            stamp = time.strftime("%H:%M:%S", time.localtime(ex.started)) + f".{int(ex.started % 1 * 1000):03d}"
+            query = f" params={ex.params}" if ex.params else ""
+            lines.append(f"[{n}] {stamp} {ex.method} {ex.path}{query}")
+            lines.append(f"  request headers: {_json.dumps(_redact(ex.headers), ensure_ascii=False)}")
+            if ex.body is not None:
+                lines.append("  request body:\n" + _indent(_render_body(ex.body, self.body_limit)))
+            if ex.error is not None:
+                lines.append(f"  error: {ex.error!r}")
+                continue
+            resp = ex.response
+            lines.append(f"  -> {resp.status} {resp.status_text} {resp.url}")
+            lines.append(f"  response headers: {_json.dumps(_redact(dict(resp.headers)), ensure_ascii=False)}")
+            try:
+                body = resp.body()
+            except Exception as e:  # disposed or the context is gone
+                lines.append(f"  response body: <unavailable: {e!r}>")
+                continue
+            lines.append("  response body:\n" + _indent(_render_body(body, self.body_limit)))
+        return "\n".join(lines)
+
@@ -0,0 +1,309 @@
+"""
+Record/replay "cassettes" for API traffic.
+
+A cassette is an append-only binary file of request/response records plus a
+sidecar JSON index (<file>.idx) mapping each request key to record offsets.
+Replay memory-maps the file, so a lookup is a dict access plus one slice of the
+mapped file; nothing else is read into memory.
+
+Request key: "<METHOD> <path>?<sorted query> #<sha1 of body>". Ids in paths come
+from earlier (replayed) responses, so they match the recording. Repeated
+requests with the same key are replayed in recording order.
+
+The recording/replay contexts are drop-in replacements for Playwright's
+APIRequestContext (sync and async), so ApiClient / AsyncApiClient work unchanged:
+
+    cassette = Cassette("reports/api.cassette", mode="record")
+    client = ApiClient(RecordingContext(request_context, cassette))
+    ...
+    cassette = Cassette("reports/api.cassette", mode="replay")
+    client = ApiClient(ReplayContext(cassette))
+"""
+import hashlib
+import json as _json
+import mmap
+import os
+import struct
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlencode
+
+from . import codec
+
+MAGIC = b"APICAS01"
+_FRAME = struct.Struct("<II")  # meta length, body length
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request has no (remaining) recorded response."""
+
+
+def _canonical_json(obj: Any) -> bytes:
+    return _json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_body(data: Any) -> bytes:
+    if data is None:
+        return b""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if not isinstance(data, bytes):
+        return _canonical_json(data)
+    if data[:1] in (b"{", b"["):
+        # JSON bodies are keyed in one canonical spelling (sorted keys, compact), so
+        # cassettes depend neither on the codec nor on how the body was passed
+        try:
+            return _canonical_json(_json.loads(data))
+        except ValueError:
+            pass
+    return data
+
+
+def request_key(method: str, path: str, params: Any = None, data: Any = None) -> str:
+    """Stable key for a request; query params are sorted, the body is hashed."""
+    path, _, inline_query = path.partition("?")
+    if isinstance(params, str):
+        query = params
+    else:
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    query = "&".join(q for q in (inline_query, query) if q)
+    body_hash = hashlib.sha1(_encode_body(data)).hexdigest()[:16]
+    return f"{method.upper()} {path}?{query} #{body_hash}"
+
+
+class Cassette:
+    """
+    One cassette file opened for recording or replay.
+
+    - mode="record": truncates the file, then appends one record per request
+    - mode="replay": loads (or rebuilds) the index and serves records in order per key
+    """
+
+    def __init__(self, path, mode: str):
+        if mode not in ("record", "replay"):
+            raise ValueError("Cassette mode must be 'record' or 'replay'")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[Tuple[int, int, int, int]]] = defaultdict(list)
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self.misses: List[str] = []
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "wb")
+            self._fh.write(MAGIC)
+            self._offset = len(MAGIC)
+            self._mm = None
+        else:
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette {self.path} does not exist; record it first")
+            self._fh = open(self.path, "rb")
+            size = os.fstat(self._fh.fileno()).st_size
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            if self._mm[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a cassette file")
+            self._load_index(size)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    # ---- index ----
+    def _index_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".idx")
+
+    def _load_index(self, size: int) -> None:
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                saved = _json.load(f)
+            if saved.get("size") == size:
+                for key, entries in saved["entries"].items():
+                    self._index[key] = [tuple(e) for e in entries]
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+        self._scan(size)
+
+    def _scan(self, size: int) -> None:
+        """Rebuild the index by walking the record frames (bodies are skipped, not read)."""
+        offset = len(MAGIC)
+        while offset + _FRAME.size <= size:
+            meta_len, body_len = _FRAME.unpack_from(self._mm, offset)
+            meta_off = offset + _FRAME.size
+            body_off = meta_off + meta_len
+            if body_off + body_len > size:
+                break  # truncated tail from an interrupted recording
+            key = _json.loads(self._mm[meta_off:body_off])["key"]
+            self._index[key].append((meta_off, meta_len, body_off, body_len))
+            offset = body_off + body_len
+
+    # ---- record ----
+    def record(self, key: str, resp_meta: Dict[str, Any], body: bytes) -> None:
+        meta = _json.dumps({"key": key, **resp_meta}, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self._fh.write(_FRAME.pack(len(meta), len(body)))
+            meta_off = self._offset + _FRAME.size
+            self._fh.write(meta)
+            self._fh.write(body)
+            self._index[key].append((meta_off, len(meta), meta_off + len(meta), len(body)))
+            self._offset = meta_off + len(meta) + len(body)
+
+    # ---- replay ----
+    def lookup(self, key: str, description: str) -> Tuple[Dict[str, Any], bytes]:
+        """Return (meta, body) of the next unplayed record for `key` or raise CassetteMiss."""
+        with self._lock:
+            entries = self._index.get(key, [])
+            n = self._cursor[key]
+            if n >= len(entries):
+                reason = "no recording" if not entries else f"only {len(entries)} recorded, request #{n + 1}"
+                self.misses.append(f"{description} ({reason})")
+                raise CassetteMiss(f"Cassette {self.path.name} has no response for {description}: {reason}")
+            self._cursor[key] = n + 1
+        meta_off, meta_len, body_off, body_len = entries[n]
+        meta = _json.loads(self._mm[meta_off:meta_off + meta_len])
+        return meta, self._mm[body_off:body_off + body_len]
+
+    def unplayed(self) -> Dict[str, int]:
+        """Keys with recorded responses that were never replayed (and how many)."""
+        with self._lock:
+            return {k: len(v) - self._cursor[k] for k, v in self._index.items() if len(v) > self._cursor[k]}
+
+    def mismatch_report(self) -> str:
+        lines = []
+        if self.misses:
+            lines.append(f"{len(self.misses)} request(s) had no recorded response:")
+            lines += [f"  - {m}" for m in self.misses]
+        unplayed = self.unplayed()
+        if unplayed:
+            lines.append(f"{sum(unplayed.values())} recorded response(s) were never requested:")
+            lines += [f"  - {k} (x{n})" for k, n in sorted(unplayed.items())]
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        with self._lock:
+            if self.recording:
+                self._fh.flush()
+                index = {"size": self._offset, "entries": self._index}
+                with open(self._index_path(), "w", encoding="utf-8") as f:
+                    _json.dump(index, f)
+            elif isinstance(self._mm, mmap.mmap):
+                self._mm.close()
+            self._fh.close()
+
+
+def _describe(method: str, path: str, params: Any) -> str:
+    return f"{method.upper()} {path}" + (f" params={params}" if params else "")
+
+
+def _response_meta(resp) -> Dict[str, Any]:
+    return {"status": resp.status, "status_text": resp.status_text, "url": resp.url, "headers": dict(resp.headers)}
+
+
+class CassetteResponse:
+    """Replayed response exposing the parts of Playwright's APIResponse the framework uses."""
+
+    def __init__(self, meta: Dict[str, Any], body: bytes):
+        self.status = meta["status"]
+        self.status_text = meta.get("status_text", "")
+        self.url = meta.get("url", "")
+        self.headers = meta.get("headers", {})
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self.body().decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return codec.loads(self.body())
+
+    def dispose(self) -> None:
+        self._body = b""
+
+
+class AsyncCassetteResponse(CassetteResponse):
+    """Async flavour: body()/text()/json()/dispose() are coroutines, as in playwright.async_api."""
+
+    async def body(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return (await self.body()).decode("utf-8", errors="replace")
+
+    async def json(self) -> Any:
+        return codec.loads(await self.body())
+
+    async def dispose(self) -> None:
+        self._body = b""
+
+
+class RecordingContext:
+    """Wraps a sync APIRequestContext and records every fetch() into a cassette."""
+
+    def __init__(self, request_context, cassette: Cassette):
+        self._ctx = request_context
+        self._cassette = cassette
+
+    def fetch(self, path: str, method: str = "GET", params: Any = None, data: Any = None, **kwargs):
+        resp = self._ctx.fetch(path, method=method, params=params, data=data, **kwargs)
+        self._cassette.record(request_key(method, path, params, data), _response_meta(resp), resp.body())
+        return resp
+
+    def dispose(self) -> None:
+        self._ctx.dispose()
+
+
+class ReplayContext:
+    """Sync APIRequestContext stand-in that answers fetch() from a cassette."""
+
+    def __init__(self, cassette: Cassette):
+        self._cassette = cassette
+
+    def fetch(self, path: str, method: str = "GET", params: Any = None, data: Any = None, **kwargs):
+        meta, body = self._cassette.lookup(request_key(method, path, params, data), _describe(method, path, params))
+        return CassetteResponse(meta, body)
+
+    def dispose(self) -> None:
+        pass
+
+
+class AsyncRecordingContext:
+    """Async counterpart of RecordingContext."""
+
+    def __init__(self, request_context, cassette: Cassette):
+        self._ctx = request_context
+        self._cassette = cassette
+
+    async def fetch(self, path: str, method: str = "GET", params: Any = None, data: Any = None, **kwargs):
+        resp = await self._ctx.fetch(path, method=method, params=params, data=data, **kwargs)
+        self._cassette.record(request_key(method, path, params, data), _response_meta(resp), await resp.body())
+        return resp
+
+    async def dispose(self) -> None:
+        await self._ctx.dispose()
+
+
+class AsyncReplayContext:
+    """Async counterpart of ReplayContext."""
+
+    def __init__(self, cassette: Cassette):
+        self._cassette = cassette
+
+    async def fetch(self, path: str, method: str = "GET", params: Any = None, data: Any = None, **kwargs):
+        meta, body = self._cassette.lookup(request_key(method, path, params, data), _describe(method, path, params))
+        return AsyncCassetteResponse(meta, body)
+
+    async def dispose(self) -> None:
+        pass
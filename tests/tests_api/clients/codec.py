@@ -0,0 +1,82 @@
+"""
+JSON codec used by the clients for request bodies and response parsing.
+
+orjson is used when it is installed (it is not a requirement); otherwise the
+stdlib json module. Both encode to UTF-8 bytes, which Playwright sends as-is,
+so a body is serialized exactly once and never round-trips through str.
+
+Request bodies that are already bytes (e.g. generate_contact_payloads(as_bytes=True))
+are passed through untouched:
+
+    client.post("/contacts", token=token, json=body_bytes)
+
+Force a codec with use_codec("json") / use_codec("orjson"), or API_JSON_CODEC in .env.
+"""
+import json as _json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speed-up
+    _orjson = None
+
+Raw = Union[bytes, bytearray, memoryview]
+
+
+class JsonCodec:
+    """A named pair of dumps (object -> UTF-8 bytes) and loads (bytes/str -> object)."""
+
+    __slots__ = ("name", "dumps", "loads")
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[Any], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return _json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+STDLIB = JsonCodec("json", _stdlib_dumps, _json.loads)
+# orjson errors are ValueError subclasses, like json.JSONDecodeError
+ORJSON = JsonCodec("orjson", _orjson.dumps, _orjson.loads) if _orjson is not None else None
+
+_codec: JsonCodec = ORJSON or STDLIB
+
+
+def use_codec(name: Optional[str] = "auto") -> JsonCodec:
+    """Select the process-wide codec: "auto" (orjson if installed), "orjson" or "json"."""
+    global _codec
+    name = (name or "auto").lower()
+    if name == "auto":
+        _codec = ORJSON or STDLIB
+    elif name == "json":
+        _codec = STDLIB
+    elif name == "orjson":
+        if ORJSON is None:
+            raise ValueError("API_JSON_CODEC=orjson but orjson is not installed (pip install orjson)")
+        _codec = ORJSON
+    else:
+        raise ValueError(f"Unknown JSON codec {name!r} (expected auto, orjson or json)")
+    return _codec
+
+
+def get_codec() -> JsonCodec:
+    return _codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a request body; bytes-like values are taken as already serialized."""
+    if isinstance(obj, bytes):
+        return obj
+    if isinstance(obj, (bytearray, memoryview)):
+        return bytes(obj)
+    return _codec.dumps(obj)
+
+
+def loads(data: Union[Raw, str]) -> Any:
+    return _codec.loads(data)
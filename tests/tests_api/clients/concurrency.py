@@ -0,0 +1,249 @@
+"""
+Adaptive concurrency control (AIMD) for ApiClient, AsyncApiClient and PooledApiClient.
+
+An AdaptiveConcurrency instance sits in front of the clients sharing it and
+decides how many requests may be in flight:
+
+- every successful response raises the limit additively (about +1 per full window)
+- a throttled response (429/502/503/504), a transport error or, with
+  `latency_target_ms`, a slow moving-average latency cuts it multiplicatively;
+  at most one cut per window, so a burst of 429s halves the limit once, not N times
+- a Retry-After header pauses *all* new requests until it has passed
+
+Throttled idempotent requests (GET/HEAD/OPTIONS/PUT/DELETE) are retried by the
+clients, after Retry-After when present or exponential backoff with full jitter.
+POST/PATCH are only retried when a call passes `retry=True` (e.g. the login);
+`retry=False` turns retries off for one call.
+
+    limiter = AdaptiveConcurrency(initial=4, max_limit=32)
+    client = AsyncApiClient(ctx, max_concurrency=32, concurrency=limiter)
+    ...
+    limiter.metrics()  # {"limit": 17, "throttled": 3, "retries": 3, ...}
+
+The same instance can be shared by sync threads and asyncio tasks.
+"""
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+THROTTLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def retry_after_seconds(headers: Optional[Dict[str, str]]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date); None if absent/invalid."""
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrency:
+    """
+    Thread-safe AIMD concurrency limiter with Retry-After aware backoff.
+
+    - initial / min_limit / max_limit: starting, lowest and highest allowed in-flight count
+    - increase: additive step per full window of successful responses
+    - decrease: multiplicative factor applied on pushback (0 < decrease < 1)
+    - latency_target_ms: optional; an EWMA latency above it counts as pushback
+    - max_retries, backoff_base, backoff_max: retry policy for throttled idempotent requests
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target_ms: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.25,
+        backoff_max: float = 10.0,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        throttle_statuses: Iterable[int] = THROTTLE_STATUSES,
+        seed: Optional[int] = None,
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("AdaptiveConcurrency needs 1 <= min_limit <= initial <= max_limit")
+        if not 0.0 < decrease < 1.0:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target_ms = latency_target_ms
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.throttle_statuses = frozenset(throttle_statuses)
+        self._random = random.Random(seed)
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._resume_at = 0.0  # monotonic time before which no request may start (Retry-After)
+        self._last_cut = 0.0  # monotonic time of the last decrease
+        self._ewma_ms: Optional[float] = None
+
+        self._requests = 0
+        self._peak_in_flight = 0
+        self._throttled = 0
+        self._errors = 0
+        self._cuts = 0
+        self._retries = 0
+        self._wait_ms = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    # ---- admission (call with the lock held) ----
+    def _wait_time(self, now: float) -> Optional[float]:
+        """0 if a request may start now, seconds until the Retry-After pause ends, or None (window full)."""
+        if now < self._resume_at:
+            return self._resume_at - now
+        return 0.0 if self._in_flight < int(self._limit) else None
+
+    def _start(self, now: float, queued_at: float) -> float:
+        self._in_flight += 1
+        self._requests += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        self._wait_ms += (now - queued_at) * 1000.0
+        return now
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """Block until a request may start; returns the slot to pass to release()."""
+        queued_at = time.monotonic()
+        deadline = None if timeout is None else queued_at + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_time(now)
+                if wait == 0.0:
+                    return self._start(now, queued_at)
+                if deadline is not None:
+                    if now >= deadline:
+                        raise TimeoutError(f"No request slot within {timeout}s (limit {self.limit})")
+                    wait = deadline - now if wait is None else min(wait, deadline - now)
+                self._cond.wait(wait)
+
+    async def acquire_async(self) -> float:
+        """Async acquire(): waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        queued_at = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_time(now)
+                if wait == 0.0:
+                    return self._start(now, queued_at)
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await asyncio.wait([waiter], timeout=wait)
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def _wake(self) -> None:
+        self._cond.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+    # ---- feedback ----
+    def release(self, slot: float, status: Optional[int], headers: Optional[Dict[str, str]] = None) -> None:
+        """
+        Return a slot and feed the outcome back: `status` is the HTTP status,
+        or None when the request raised (counted as pushback).
+        """
+        now = time.monotonic()
+        latency_ms = (now - slot) * 1000.0
+        with self._lock:
+            self._in_flight -= 1
+            self._ewma_ms = latency_ms if self._ewma_ms is None else 0.8 * self._ewma_ms + 0.2 * latency_ms
+
+            if status is None or status in self.throttle_statuses:
+                if status is None:
+                    self._errors += 1
+                else:
+                    self._throttled += 1
+                self._cut(slot, now)
+                pause = retry_after_seconds(headers) if status is not None else None
+                if pause:
+                    self._resume_at = max(self._resume_at, now + min(pause, self.backoff_max))
+            elif self.latency_target_ms is not None and self._ewma_ms > self.latency_target_ms:
+                self._cut(slot, now)
+            else:
+                self._limit = min(float(self.max_limit), self._limit + self.increase / max(self._limit, 1.0))
+            self._wake()
+
+    def _cut(self, slot: float, now: float) -> None:
+        # requests started before the last cut were sent under the old limit: don't cut again for them
+        if slot < self._last_cut:
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        self._last_cut = now
+        self._cuts += 1
+
+    def retry_delay(
+        self, method: str, status: Optional[int], headers: Optional[Dict[str, str]], attempt: int, force: bool = False
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying attempt number `attempt` (0-based), or None when the
+        response must be returned as-is (success, non-idempotent method, retries exhausted).
+        `force=True` retries any method (for calls known to be safe, such as a login).
+        """
+        if status not in self.throttle_statuses or not (force or method.upper() in self.retry_methods):
+            return None
+        if attempt >= self.max_retries:
+            return None
+        with self._lock:
+            self._retries += 1
+            delay = retry_after_seconds(headers)
+            if delay is None:
+                delay = self._random.uniform(0.0, self.backoff_base * (2 ** attempt))
+        return min(delay, self.backoff_max)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "errors": self._errors,
+                "limit_cuts": self._cuts,
+                "retries": self._retries,
+                "ewma_latency_ms": round(self._ewma_ms, 2) if self._ewma_ms is not None else None,
+                "queue_wait_ms": round(self._wait_ms, 2),
+            }
+
+    def __repr__(self) -> str:
+        return f"<AdaptiveConcurrency limit={self.limit} in_flight={self._in_flight}>"
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
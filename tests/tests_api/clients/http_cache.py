@@ -0,0 +1,183 @@
+"""
+Client-side HTTP cache for ApiClient GETs (opt-in).
+
+Successful GET responses that carry a validator (ETag and/or Last-Modified) are
+stored with their body. The next GET of the same URL, for the same Authorization
+header, is sent as a conditional request (If-None-Match / If-Modified-Since); a
+304 answer is served from the cache, so the body is neither produced by the
+server nor transferred again. Nothing is ever served without asking the server.
+If the entry is evicted before the 304 arrives, the GET is sent again without
+validators. GETs that set their own If-None-Match / If-Modified-Since headers
+bypass the cache, so the caller sees the server's answer, 304s included.
+
+Memory is bounded: entries are evicted least-recently-used first once their
+bodies exceed `max_bytes` in total. Any write through the client (POST/PUT/
+PATCH/DELETE) drops the entries for that path, the paths below it and the
+collections above it ("/contacts/{id}" also drops every "/contacts?..." page).
+
+    cache = ResponseCache(max_bytes=8 * 1024 * 1024)
+    client = ApiClient(request_context, cache=cache)
+    cache.stats()  # {"hits": 12, "misses": 30, "bytes_saved": 48213, ...}
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from . import codec
+
+CacheKey = Tuple[str, str, str]  # (path, sorted query, authorization)
+
+
+class CachedResponse:
+    """A stored response, replayed for a 304. Quacks like Playwright's APIResponse."""
+
+    __slots__ = ("status", "status_text", "url", "headers", "_body")
+
+    def __init__(self, status: int, status_text: str, url: str, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.status_text = status_text
+        self.url = url
+        self.headers = headers
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return codec.loads(self._body)
+
+    def dispose(self) -> None:
+        pass
+
+
+class ResponseCache:
+    """Thread-safe LRU of validated GET responses, bounded by total body bytes."""
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def key(path: str, params: Any = None, authorization: Optional[str] = None) -> CacheKey:
+        path, _, inline_query = path.partition("?")
+        if isinstance(params, str):
+            query = params
+        else:
+            query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        query = "&".join(sorted(q for q in (inline_query, query) if q))
+        return path.rstrip("/") or "/", query, authorization or ""
+
+    def conditional_headers(self, key: CacheKey) -> Dict[str, str]:
+        """Validators to send for `key` (empty if nothing is cached)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            headers = {}
+            if entry.headers.get("etag"):
+                headers["If-None-Match"] = entry.headers["etag"]
+            if entry.headers.get("last-modified"):
+                headers["If-Modified-Since"] = entry.headers["last-modified"]
+            return headers
+
+    def not_modified(self, key: CacheKey) -> Optional[CachedResponse]:
+        """The cached response for a 304 answer (None if it was evicted meanwhile)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += len(entry.body())
+            return entry
+
+    def store(self, key: CacheKey, resp) -> None:
+        """Cache a 200 response if it has a validator and fits in the budget."""
+        with self._lock:
+            self.misses += 1
+        headers = {k.lower(): v for k, v in resp.headers.items()}
+        if resp.status != 200 or not (headers.get("etag") or headers.get("last-modified")):
+            return
+        if "no-store" in headers.get("cache-control", ""):
+            return
+        body = resp.body()
+        if len(body) > self.max_bytes:
+            return
+        entry = CachedResponse(resp.status, resp.status_text, resp.url, headers, body)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = entry
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body())
+                self.evictions += 1
+
+    def _drop(self, key: CacheKey) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= len(entry.body())
+        return True
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Drop the entries a write to `path` can make stale: the path itself, anything below
+        it and every collection above it, for all queries and users. Without a `path`,
+        drop every entry. Returns the number of entries dropped.
+        """
+        with self._lock:
+            if path is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                self.invalidations += dropped
+                return dropped
+
+            target = self.key(path)[0]
+            segments = target.split("/")
+            ancestors = {"/".join(segments[:i]) or "/" for i in range(2, len(segments))}
+            stale = [
+                k for k in self._entries if k[0] == target or k[0].startswith(target + "/") or k[0] in ancestors
+            ]
+            for k in stale:
+                self._drop(k)
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "bytes_saved": self.bytes_saved,
+            }
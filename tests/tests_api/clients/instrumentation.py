@@ -0,0 +1,83 @@
+"""
+Request instrumentation shared by ApiClient and AsyncApiClient.
+
+A hook is any callable taking one request record (a dict):
+    {
+        "method": "GET",
+        "path": "/contacts/{id}",        # templated path
+        "raw_path": "/contacts/65f0...",
+        "status": 200,                    # None if the call raised
+        "error": None,                    # exception class name if the call raised
+        "duration_ms": 12.3,
+        "request_bytes": 0,
+        "response_bytes": 345,            # from Content-Length, None if unknown
+        "started": 1700000000.0,          # epoch seconds
+    }
+"""
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+RequestHook = Callable[[Dict[str, Any]], None]
+
+# Mongo ObjectIds, UUIDs and plain integers are treated as resource ids
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F]{24}|[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}|\d+)$")
+
+
+def template_path(path: str) -> str:
+    """Replace id-like path segments with {id}: "/contacts/65f0c0ffee..." -> "/contacts/{id}"."""
+    path = path.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+def body_size(data: Any) -> int:
+    """Size in bytes of a request body as it will be sent."""
+    if data is None:
+        return 0
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    return 0
+
+
+def response_size(resp) -> Optional[int]:
+    """Response size from Content-Length (None if the header is absent)."""
+    try:
+        length = resp.headers.get("content-length")
+    except Exception:
+        return None
+    return int(length) if length and length.isdigit() else None
+
+
+def make_record(method: str, path: str, started: float, duration_ms: float, request_bytes: int, resp=None, error=None):
+    return {
+        "method": method,
+        "path": template_path(path),
+        "raw_path": path,
+        "status": getattr(resp, "status", None),
+        "error": type(error).__name__ if error is not None else None,
+        "duration_ms": duration_ms,
+        "request_bytes": request_bytes,
+        "response_bytes": response_size(resp) if resp is not None else None,
+        "started": started,
+    }
+
+
+class HookList:
+    """Ordered collection of request hooks, called for every recorded request."""
+
+    def __init__(self, hooks: Optional[Iterable[RequestHook]] = None):
+        self._hooks: List[RequestHook] = list(hooks or ())
+
+    def add(self, hook: RequestHook) -> None:
+        self._hooks.append(hook)
+
+    def remove(self, hook: RequestHook) -> None:
+        self._hooks.remove(hook)
+
+    def __bool__(self):
+        return bool(self._hooks)
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        for hook in self._hooks:
+            hook(record)
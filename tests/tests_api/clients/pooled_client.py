@@ -0,0 +1,169 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from .api_client import ApiClient
+from .capture import RequestCapture
+from .concurrency import AdaptiveConcurrency
+from .http_cache import ResponseCache
+from .instrumentation import RequestHook
+from .response import ApiResponse
+
+# Creates a request context inside a pool thread; returns (context, cleanup callable)
+ContextFactory = Callable[[], Tuple[Any, Callable[[], None]]]
+
+_STOP = object()
+
+
+def playwright_context_factory(base_url: str, extra_http_headers: Optional[dict] = None) -> ContextFactory:
+    """
+    Factory starting a private sync Playwright driver and one long-lived APIRequestContext
+    (so keep-alive connections are reused by every call made on that thread).
+    """
+
+    def factory():
+        from playwright.sync_api import sync_playwright
+
+        pw = sync_playwright().start()
+        ctx = pw.request.new_context(base_url=base_url, extra_http_headers=extra_http_headers or {})
+
+        def cleanup():
+            ctx.dispose()
+            pw.stop()
+
+        return ctx, cleanup
+
+    return factory
+
+
+class PooledApiClient:
+    """
+    Thread-safe ApiClient facade backed by a pool of request contexts.
+
+    Playwright's sync API is bound to the thread that created it, so each of the
+    `size` pool threads owns its own driver, APIRequestContext and ApiClient.
+    Calls from any thread are queued and picked up by the next free pool thread;
+    every method returns a concurrent.futures.Future.
+
+    Response bodies are read on the pool thread before the future completes, so the
+    returned ApiResponse objects can be used (json()/text()) from any thread.
+    An optional AdaptiveConcurrency limiter, ResponseCache and RequestCapture are shared by all pool threads.
+    With `release_bodies=True` the Playwright responses are also disposed there (see ApiResponse.release).
+
+    Usage:
+        with PooledApiClient(playwright_context_factory(base_url), size=8) as pool:
+            futures = [pool.delete(f"/contacts/{cid}", token=token) for cid in ids]
+            statuses = [f.result().status for f in futures]
+    """
+
+    def __init__(
+        self,
+        context_factory: ContextFactory,
+        size: int = 4,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        cache: Optional[ResponseCache] = None,
+        capture: Optional[RequestCapture] = None,
+        release_bodies: bool = False,
+    ):
+        if size < 1:
+            raise ValueError("PooledApiClient size must be >= 1")
+        self.size = size
+        self._hooks = list(hooks or ())
+        self.concurrency = concurrency
+        self.cache = cache
+        self.capture = capture
+        self.release_bodies = release_bodies
+        self._queue: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+        ready = [threading.Event() for _ in range(size)]
+        errors: List[BaseException] = []
+        for i in range(size):
+            t = threading.Thread(
+                target=self._serve, args=(context_factory, ready[i], errors), name=f"api-pool-{i}", daemon=True
+            )
+            t.start()
+            self._threads.append(t)
+        for event in ready:
+            event.wait()
+        if errors:
+            self.close()
+            raise errors[0]
+
+    def _serve(self, context_factory: ContextFactory, ready: threading.Event, errors: List[BaseException]):
+        try:
+            ctx, cleanup = context_factory()
+        except BaseException as e:
+            errors.append(e)
+            ready.set()
+            return
+        client = ApiClient(
+            ctx, hooks=self._hooks, concurrency=self.concurrency, cache=self.cache, capture=self.capture,
+            release_bodies=self.release_bodies,
+        )
+        ready.set()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    return
+                method, args, kwargs, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = getattr(client, method)(*args, **kwargs)
+                    if isinstance(result, ApiResponse):
+                        result.body()  # read now, while we are on the owning thread
+                    future.set_result(result)
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            cleanup()
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """Queue `ApiClient.<method>(*args, **kwargs)` and return its future."""
+        if self._closed:
+            raise RuntimeError("PooledApiClient is closed")
+        future: Future = Future()
+        self._queue.put((method, args, kwargs, future))
+        return future
+
+    def get(self, path: str, token: Optional[str] = None, params=None, **kwargs) -> Future:
+        return self.submit("get", path, token=token, params=params, **kwargs)
+
+    def post(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs) -> Future:
+        return self.submit("post", path, token=token, json=json, data=data, **kwargs)
+
+    def put(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs) -> Future:
+        return self.submit("put", path, token=token, json=json, data=data, **kwargs)
+
+    def patch(self, path: str, token: Optional[str] = None, json: Any = None, data: Any = None, **kwargs) -> Future:
+        return self.submit("patch", path, token=token, json=json, data=data, **kwargs)
+
+    def delete(self, path: str, token: Optional[str] = None, **kwargs) -> Future:
+        return self.submit("delete", path, token=token, **kwargs)
+
+    def register_user(self, token: str, email: str, password: str, first_name: str = None, last_name: str = None) -> Future:
+        return self.submit("register_user", token, email, password, first_name=first_name, last_name=last_name)
+
+    def login_user(self, email: str, password: str) -> Future:
+        return self.submit("login_user", email, password)
+
+    def close(self) -> None:
+        """Finish queued calls, then stop the pool threads and dispose their contexts."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for t in self._threads:
+            t.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,122 @@
+from typing import Any, Dict, Optional
+
+from . import codec
+
+_UNSET = object()
+
+
+class ApiResponse:
+    """
+    Thin, parse-once wrapper around a Playwright APIResponse (sync API).
+
+    Status, status text, URL and headers are copied eagerly. The body is fetched
+    from the driver on first use of body()/text()/json() and cached, as are the
+    decoded text and the parsed JSON (or the parse error, which is re-raised on
+    every later json() call). Behaves like the Playwright response for the
+    attributes the framework uses, so tests/utils.py helpers work unchanged.
+
+    release() buffers the body and disposes the Playwright response, so the driver
+    frees its copy right away; body()/text()/json() keep working from the buffer.
+    """
+
+    __slots__ = ("status", "status_text", "url", "headers", "_raw", "_body", "_text", "_json", "_json_error", "_released")
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.status: int = raw.status
+        self.status_text: str = raw.status_text
+        self.url: str = raw.url
+        self.headers: Dict[str, str] = raw.headers
+        self._body: Optional[bytes] = None
+        self._text: Optional[str] = None
+        self._json: Any = _UNSET
+        self._json_error: Optional[Exception] = None
+        self._released = False
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    @property
+    def raw(self):
+        """The underlying Playwright APIResponse."""
+        return self._raw
+
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = self._raw.body()
+        return self._body
+
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.body().decode("utf-8", errors="replace")
+        return self._text
+
+    def json(self) -> Any:
+        if self._json is _UNSET and self._json_error is None:
+            try:
+                self._json = codec.loads(self.body())
+            except ValueError as e:
+                self._json_error = e
+        if self._json_error is not None:
+            raise self._json_error
+        return self._json
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def release(self) -> None:
+        """Buffer the body, then dispose the Playwright response (idempotent)."""
+        if self._released:
+            return
+        try:
+            self.body()
+        except Exception:
+            pass  # unreadable body: dispose anyway; a later body() raises
+        self.dispose()
+
+    def dispose(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._raw.dispose()
+
+    def __repr__(self) -> str:
+        return f"<ApiResponse {self.status} {self.url}>"
+
+
+class AsyncReleasedResponse:
+    """
+    What AsyncApiClient returns for a released response: status, status text, URL,
+    headers and the body, copied before the Playwright response was disposed.
+    body()/text()/json() are coroutines, as in playwright.async_api.
+    """
+
+    __slots__ = ("status", "status_text", "url", "headers", "_body")
+
+    def __init__(self, raw, body: bytes):
+        self.status: int = raw.status
+        self.status_text: str = raw.status_text
+        self.url: str = raw.url
+        self.headers: Dict[str, str] = raw.headers
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    async def body(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode("utf-8", errors="replace")
+
+    async def json(self) -> Any:
+        return codec.loads(self._body)
+
+    async def dispose(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return f"<AsyncReleasedResponse {self.status} {self.url}>"
@@ -1,76 +1,431 @@
 # tests/tests_api/conftest.py
-import os
-from pathlib import Path
+# Settings come from tests/config.py (single, cached .env load). Playwright is only
+# imported and started by the fixtures that need it, so runs where every test skips
+# or replays from a cassette never start a driver.
 import pytest
-from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
-
-# Load root .env
-ROOT = Path(__file__).resolve().parents[2]
-load_dotenv(ROOT / ".env")
-
-API_BASE_URL = os.getenv("API_BASE_URL", "https://thinking-tester-contact-list.herokuapp.com")
-TEST_USER_EMAIL = os.getenv("TEST_USER_EMAIL")
-TEST_USER_PASS = os.getenv("TEST_USER_PASS")
 
 # Relative import for ApiClient
 from .clients.api_client import ApiClient
+from .clients.async_api_client import AsyncApiClient, LazyAsyncRequestContext
+from .clients.concurrency import AdaptiveConcurrency
+from .clients.http_cache import ResponseCache
+from .clients.pooled_client import PooledApiClient, playwright_context_factory
+from .clients.cassette import AsyncRecordingContext, AsyncReplayContext, RecordingContext, ReplayContext
+from .helpers.async_loop import LoopThread
+from .helpers.cleanup import CleanupQueue, PendingStore
+from .helpers.contacts_index import ContactsIndex
+from .helpers.token_cache import TokenCache, TokenRefresher
+from .stub.local_api import LocalContactListApi
+from tests import config
+from tests.config import get_settings
+
+_controller_key = pytest.StashKey[AdaptiveConcurrency]()
+_http_cache_key = pytest.StashKey[ResponseCache]()
+
+NO_CREDENTIALS_REASON = (
+    "TEST_USER_EMAIL and TEST_USER_PASS are not set in .env — "
+    "tests requiring authentication will be skipped. Add credentials to run authenticated tests."
+)
+
+
+def _use_local_api(pytestconfig) -> bool:
+    return pytestconfig.getoption("--local-api") or get_settings().LOCAL_API
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests that need credentials up front when none are configured, so their
+    fixtures (and the Playwright driver) are never set up.
+    """
+    if _use_local_api(config) or get_settings().has_credentials:
+        return
+    skip = pytest.mark.skip(reason=NO_CREDENTIALS_REASON)
+    for item in items:
+        if {"auth_token", "test_user_credentials"} & set(getattr(item, "fixturenames", ())):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def local_api(pytestconfig):
+    """
+    The in-process Contact List API stand-in, or None when running against API_BASE_URL.
+    Enabled with `pytest --local-api` or LOCAL_API=1 in .env.
+    """
+    if not _use_local_api(pytestconfig):
+        yield None
+        return
+
+    settings = get_settings()
+    server = LocalContactListApi(
+        latency_ms=settings.LOCAL_API_LATENCY_MS,
+        jitter_ms=settings.LOCAL_API_JITTER_MS,
+        error_rate=settings.LOCAL_API_ERROR_RATE,
+        seed=settings.LOCAL_API_SEED,
+    ).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def api_base_url(local_api):
+    """Base URL every request context points at."""
+    return local_api.url if local_api is not None else get_settings().API_BASE_URL
+
+
+@pytest.fixture(scope="session")
+def primary_user_credentials(local_api):
+    """
+    (email, password) of the configured test user, or (None, None) when not configured.
+    Against the local API the user is provisioned on the fly (using .env credentials when set).
+    """
+    settings = get_settings()
+    if local_api is not None:
+        email = settings.TEST_USER_EMAIL or settings.LOCAL_USER_EMAIL
+        pwd = settings.TEST_USER_PASS or settings.LOCAL_USER_PASS
+        local_api.add_user(email, pwd)
+        return email, pwd
+    return settings.TEST_USER_EMAIL, settings.TEST_USER_PASS
+
+
+@pytest.fixture(scope="session")
+def worker_id():
+    """pytest-xdist worker name ("gw0", ...) or "master" for non-parallel runs."""
+    return config.worker_id()
+
+
+def _login(client, token_cache, base_url, email, pwd):
+    if token_cache is not None:
+        # trusted until its `exp`; a token revoked earlier is replaced by token_refresher on its first 401
+        return token_cache.get_token(email, base_url, lambda: client.login_user(email, pwd))
+    return client.login_user(email, pwd)
+
+
+@pytest.fixture(scope="session")
+def test_user_credentials(
+    request, pytestconfig, primary_user_credentials, worker_id, api_base_url, token_cache, request_timing, concurrency_controller
+):
+    """
+    (email, password) of the user this process runs as, or (None, None) when not configured.
+
+    With --per-worker-users (or PER_WORKER_USERS=1) under pytest-xdist, every worker runs as
+    its own user (<local>+<worker>@<domain>, same password), registered through the primary
+    user on first use, so workers never see each other's contacts.
+    """
+    email, pwd = primary_user_credentials
+    per_worker = pytestconfig.getoption("--per-worker-users") or get_settings().PER_WORKER_USERS
+    if not email or not pwd or not per_worker or worker_id == "master":
+        return email, pwd
+
+    worker_email = config.worker_user_email(email, worker_id)
+    client = ApiClient(
+        request.getfixturevalue("api_request_context"), hooks=[request_timing], concurrency=concurrency_controller
+    )
+    if _login(client, token_cache, api_base_url, worker_email, pwd):
+        return worker_email, pwd
+
+    primary_token = _login(client, token_cache, api_base_url, email, pwd)
+    if primary_token:
+        resp = client.register_user(primary_token, worker_email, pwd, first_name="Worker", last_name=worker_id)
+        if resp.status in (200, 201):
+            return worker_email, pwd
+        print(f"Warning: could not register worker user {worker_email} (HTTP {resp.status}); using the primary user")
+    return email, pwd
 
 
 @pytest.fixture(scope="session")
 def playwright_instance():
     """Start sync_playwright once per session."""
+    from playwright.sync_api import sync_playwright
+
     pw = sync_playwright().start()
     yield pw
     pw.stop()
 
 
 @pytest.fixture(scope="session")
-def api_request_context(playwright_instance):
+def api_request_context(request, api_base_url, worker_id, cassette):
     """
     Provide a Playwright APIRequestContext for tests.
-    Session-scoped for speed; change to function-scope for strict isolation.
+    Session-scoped for speed (one per xdist worker); change to function-scope for strict isolation.
+    With --cassette-mode=replay no Playwright driver is started at all.
     """
+    if cassette is not None and cassette.replaying:
+        yield ReplayContext(cassette)
+        return
+
+    playwright_instance = request.getfixturevalue("playwright_instance")
     ctx = playwright_instance.request.new_context(
-        base_url=API_BASE_URL,
+        base_url=api_base_url,
         extra_http_headers={
             "Accept": "application/json",
+            # Lets server-side logs tell parallel workers apart
+            "X-Test-Worker": worker_id,
             # We typically set Content-Type per-request when sending json
         }
     )
+    if cassette is not None:
+        ctx = RecordingContext(ctx, cassette)
     yield ctx
     ctx.dispose()
 
 
+@pytest.fixture(scope="session")
+def concurrency_controller(request, pytestconfig, cassette):
+    """
+    Shared AIMD limiter for api_client, pooled_api_client and async_api_client, or None.
+    Enabled with --adaptive-concurrency (or API_ADAPTIVE_CONCURRENCY=1); never while
+    replaying a cassette. Its metrics are printed at the end of the session.
+    """
+    settings = get_settings()
+    enabled = pytestconfig.getoption("--adaptive-concurrency") or settings.API_ADAPTIVE_CONCURRENCY
+    if not enabled or (cassette is not None and cassette.replaying):
+        return None
+
+    controller = AdaptiveConcurrency(
+        initial=min(4, settings.API_MAX_CONCURRENCY),
+        max_limit=settings.API_MAX_CONCURRENCY,
+        max_retries=settings.API_MAX_RETRIES,
+    )
+    request.config.stash[_controller_key] = controller
+    return controller
+
+
+@pytest.fixture(scope="session")
+def http_cache(request, pytestconfig):
+    """
+    Session-wide conditional-GET cache (clients/http_cache.py) for api_client and
+    pooled_api_client, or None. Enabled with --http-cache (or API_HTTP_CACHE=1),
+    bounded by API_HTTP_CACHE_MB; its hit/miss counters are printed at the end.
+    """
+    settings = get_settings()
+    if not (pytestconfig.getoption("--http-cache") or settings.API_HTTP_CACHE):
+        return None
+    cache = ResponseCache(max_bytes=int(settings.API_HTTP_CACHE_MB * 1024 * 1024))
+    request.config.stash[_http_cache_key] = cache
+    return cache
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    controller = config.stash.get(_controller_key, None)
+    if controller is not None:
+        terminalreporter.write_line("adaptive concurrency: " + ", ".join(f"{k}={v}" for k, v in controller.metrics().items()))
+    cache = config.stash.get(_http_cache_key, None)
+    if cache is not None:
+        terminalreporter.write_line("http cache: " + ", ".join(f"{k}={v}" for k, v in cache.stats().items()))
+
+
+@pytest.fixture(scope="session")
+def contacts_index():
+    """
+    Session-wide ContactsIndex (helpers/contacts_index.py): the contacts list scanned once,
+    then kept current from the writes api_client / pooled_api_client / async_api_client make.
+
+        found = contacts_index.find(async_api_client, auth_token, contact_id=cid, async_loop=async_loop)
+    """
+    return ContactsIndex()
+
+
+@pytest.fixture(scope="session")
+def client_hooks(request_timing, contacts_index, memory_sampler):
+    """Request hooks shared by api_client / pooled_api_client / async_api_client (the sampler only with --soak-every)."""
+    return [hook for hook in (request_timing, contacts_index, memory_sampler) if hook is not None]
+
+
 @pytest.fixture
-def api_client(api_request_context):
+def api_client(api_request_context, client_hooks, concurrency_controller, http_cache, request_capture, token_refresher):
     """
     Provide a thin ApiClient wrapper around Playwright's APIRequestContext.
-    Function-scoped by default for safety/isolation.
+    Function-scoped by default for safety/isolation. Response bodies are buffered and
+    released in the driver as calls return, unless API_RELEASE_BODIES=0.
+    """
+    return ApiClient(
+        api_request_context,
+        hooks=client_hooks,
+        concurrency=concurrency_controller,
+        cache=http_cache,
+        capture=request_capture,
+        release_bodies=get_settings().API_RELEASE_BODIES,
+        auth=token_refresher,
+    )
+
+
+@pytest.fixture(scope="session")
+def pooled_api_client(api_base_url, worker_id, cassette, client_hooks, concurrency_controller, http_cache, request_capture):
+    """
+    Thread-safe ApiClient facade over API_CONTEXT_POOL_SIZE request contexts (default 4),
+    each owned by its own thread. Methods return futures, e.g. for threaded bulk work:
+
+        futures = [pooled_api_client.delete(f"/contacts/{cid}", token=auth_token) for cid in ids]
+        statuses = [f.result().status for f in futures]
+    """
+    if cassette is not None and cassette.replaying:
+        def factory():
+            return ReplayContext(cassette), lambda: None
+    else:
+        base_factory = playwright_context_factory(
+            api_base_url, {"Accept": "application/json", "X-Test-Worker": worker_id}
+        )
+        if cassette is None:
+            factory = base_factory
+        else:
+            def factory():
+                ctx, cleanup = base_factory()
+                return RecordingContext(ctx, cassette), cleanup
+
+    pool = PooledApiClient(
+        factory,
+        size=get_settings().API_CONTEXT_POOL_SIZE,
+        hooks=client_hooks,
+        concurrency=concurrency_controller,
+        cache=http_cache,
+        capture=request_capture,
+        release_bodies=get_settings().API_RELEASE_BODIES,
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    """
+    Background event loop shared by the async fixtures.
+    Sync tests submit coroutines with `async_loop.run(coro)`.
+    """
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+@pytest.fixture(scope="session")
+def async_api_request_context(async_loop, api_base_url, worker_id, cassette):
+    """
+    Async counterpart of api_request_context, owned by the background loop.
+    Opened on the first request, so the async Playwright driver only starts once a batch
+    or background delete is actually submitted.
     """
-    return ApiClient(api_request_context)
+    if cassette is not None and cassette.replaying:
+        yield AsyncReplayContext(cassette)
+        return
+
+    async def open_context():
+        from playwright.async_api import async_playwright
+
+        pw = await async_playwright().start()
+        ctx = await pw.request.new_context(
+            base_url=api_base_url,
+            extra_http_headers={"Accept": "application/json", "X-Test-Worker": worker_id},
+        )
+
+        async def close():
+            await ctx.dispose()
+            await pw.stop()
+
+        return ctx, close
+
+    ctx = LazyAsyncRequestContext(open_context)
+    if cassette is not None:
+        ctx = AsyncRecordingContext(ctx, cassette)
+    yield ctx
+    async_loop.run(ctx.dispose())
 
 
 @pytest.fixture(scope="session")
-def auth_token(api_request_context):
+def async_api_client(async_api_request_context, client_hooks, concurrency_controller):
+    """
+    Provide an AsyncApiClient for concurrent/batch calls.
+    Session-scoped so the concurrency limit is shared by every test in the run.
+
+    Example:
+        responses = async_loop.run(async_api_client.create_contacts(auth_token, payloads))
+    """
+    return AsyncApiClient(
+        async_api_request_context,
+        max_concurrency=get_settings().API_MAX_CONCURRENCY,
+        hooks=client_hooks,
+        concurrency=concurrency_controller,
+        release_bodies=get_settings().API_RELEASE_BODIES,
+    )
+
+
+@pytest.fixture(scope="session")
+def cleanup_queue(pytestconfig, async_loop, async_api_client, auth_token, api_base_url, test_user_credentials, worker_id, local_api, cassette):
+    """
+    Session-wide CleanupQueue: register created contacts, release them when done (deleted
+    in the background) and everything left is deleted in one concurrent batch at session end.
+
+    Pending ids are kept in the pytest cache dir, and on start-up contacts left behind by
+    crashed or older runs are swept (disable with --no-orphan-sweep / ORPHAN_SWEEP=0).
+    Neither applies to the local API, cassette runs or runs without the cache plugin.
+    """
+    settings = get_settings()
+    store = None
+    cache = getattr(pytestconfig, "cache", None)  # None under -p no:cacheprovider
+    if local_api is None and cassette is None and cache is not None:
+        store = PendingStore(
+            cache.mkdir("cleanup"), account=f"{api_base_url} {test_user_credentials[0]}", worker=worker_id
+        )
+    queue = CleanupQueue(async_loop, async_api_client, auth_token, store=store)
+
+    sweep = store is not None and settings.ORPHAN_SWEEP and not pytestconfig.getoption("--no-orphan-sweep")
+    if sweep:
+        # every worker scans its own user's list; with a shared user only the first worker does
+        per_worker = pytestconfig.getoption("--per-worker-users") or settings.PER_WORKER_USERS
+        queue.sweep(
+            scan=per_worker or worker_id in ("master", "gw0"),
+            min_age_s=settings.ORPHAN_MIN_AGE_MIN * 60,
+            max_pages=settings.ORPHAN_SWEEP_MAX_PAGES,
+        )
+
+    yield queue
+    failures = queue.drain()
+    if failures:
+        print(f"Warning: cleanup failed for {failures} contact(s); the next run will retry")
+
+
+@pytest.fixture(scope="session")
+def token_cache(pytestconfig, local_api, cassette):
+    """
+    Persistent token cache in the pytest cache dir, or None when disabled.
+    Disabled with --no-token-cache, for the local API (its tokens die with the process),
+    while recording/replaying a cassette (the login must be part of the recording) and
+    when the cache plugin is off.
+    """
+    cache = getattr(pytestconfig, "cache", None)  # None under -p no:cacheprovider
+    if pytestconfig.getoption("--no-token-cache") or local_api is not None or cassette is not None or cache is None:
+        return None
+    return TokenCache(cache.mkdir("auth_tokens"))
+
+
+@pytest.fixture(scope="session")
+def token_refresher(token_cache):
+    """
+    Logs in again when a request made with the session token gets a 401 (logout, server
+    restart) and switches api_client to the new token. Only tokens from `auth_token` are refreshed.
+    """
+    return TokenRefresher(token_cache)
+
+
+@pytest.fixture(scope="session")
+def auth_token(request, api_base_url, test_user_credentials, token_cache, token_refresher, request_timing, concurrency_controller):
     """
     Session-scoped fixture that logs in using TEST_USER_EMAIL/TEST_USER_PASS and
     returns a bearer token string for use in authenticated requests.
 
+    - Tokens are reused across sessions and workers via `token_cache` until shortly before they expire.
+    - A token the API rejects with 401 is replaced through `token_refresher` (api_client only).
     - If TEST_USER_EMAIL / TEST_USER_PASS are not set, this fixture will skip tests that require auth.
     - If login fails (no token returned), the fixture will fail the session (pytest.fail).
     """
-    email = TEST_USER_EMAIL
-    pwd = TEST_USER_PASS
+    email, pwd = test_user_credentials
 
     if not email or not pwd:
-        pytest.skip(
-            "TEST_USER_EMAIL and TEST_USER_PASS are not set in .env — "
-            "tests requiring authentication will be skipped. Add credentials to run authenticated tests."
-        )
+        pytest.skip(NO_CREDENTIALS_REASON)
 
-    client = ApiClient(api_request_context)
-    token = client.login_user(email, pwd)
+    # requested only now, so skipped tests never start Playwright
+    client = ApiClient(
+        request.getfixturevalue("api_request_context"), hooks=[request_timing], concurrency=concurrency_controller
+    )
+    token = _login(client, token_cache, api_base_url, email, pwd)
 
     if not token:
         pytest.fail(
@@ -78,6 +433,7 @@ def auth_token(api_request_context):
             "or verify the API's /users/login endpoint is available."
         )
 
+    token_refresher.track(token, email, api_base_url, lambda: client.login_user(email, pwd))
     return token
 
 
@@ -0,0 +1,47 @@
+"""
+Run an asyncio event loop in a background thread so that sync tests can drive
+async code (e.g. AsyncApiClient) without an asyncio pytest plugin.
+
+Usage:
+    loop = LoopThread()
+    result = loop.run(some_coroutine())
+    loop.stop()
+"""
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Optional
+
+
+class LoopThread:
+    """
+    Owns a dedicated thread running an asyncio event loop.
+    Coroutines are submitted with run(), which blocks until they complete.
+    Keeping the loop off the main thread avoids clashing with the sync Playwright API.
+    """
+
+    def __init__(self, name: str = "api-async-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Submit a coroutine to the loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout)
+
+    def submit(self, coro: Awaitable) -> "concurrent.futures.Future":
+        """Schedule a coroutine on the loop without waiting; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Stop the loop and join the thread. Safe to call more than once."""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -0,0 +1,262 @@
+"""
+Deferred, concurrent cleanup of contacts created by tests, plus an orphan sweeper.
+
+CleanupQueue is session-wide. Tests (and the contact pool) register every contact
+they create; nothing is deleted inline:
+
+- release(id): the test is done with it; the delete runs in the background on the
+  async loop while the next test starts
+- drain(): at session end, waits for background deletes and deletes everything
+  still registered in one concurrent batch
+
+Registered ids are also written to a PendingStore file in the pytest cache dir.
+If a run crashes before drain(), the next run's sweep() deletes them. The sweep
+also scans the contact list for generated contacts tagged by earlier runs
+(see tests/factories.py run_tag) that are old enough to be abandoned.
+
+Successful background deletes leave the queue as they finish, and the file is
+rewritten at most once per `persist_interval` seconds, so its size and the
+number of rewrites stay bounded on long runs. Ids created in the last interval
+before a crash may miss the file; their run tag still lets the list scan find them.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tests.factories import current_run_id, parse_run_tag, run_started_at
+from tests.tests_api.helpers.list_search import iter_contacts
+
+log = logging.getLogger(__name__)
+
+# Delete results that mean "the contact is gone"
+DELETED_STATUSES = (200, 204, 400, 404)
+
+
+class PendingStore:
+    """
+    Ids still to be deleted, persisted as pending-<run id>-<worker>.json in `directory`
+    (one file per run and xdist worker, so workers never write the same file).
+    `account` (base URL + user) keeps ids apart when several users share the cache dir.
+    """
+
+    def __init__(self, directory, account: str, run_id: Optional[str] = None, worker: str = "master"):
+        self.directory = Path(directory)
+        self.account = account
+        self.run_id = run_id or current_run_id()
+        self.path = self.directory / f"pending-{self.run_id}-{worker}.json"
+
+    def save(self, ids: Iterable[str]) -> None:
+        ids = list(ids)
+        if not ids:
+            self.clear()
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"account": self.account, "run_id": self.run_id, "ids": ids}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def claim_stale(self) -> Tuple[List[str], List[Path]]:
+        """
+        Take over the pending files other runs left behind for this account.
+        A file is claimed by renaming it, so concurrent sweepers never get the same ids.
+        Returns (ids, claimed files); remove the files with release_claims() once the ids are deleted.
+        """
+        ids: List[str] = []
+        claimed: List[Path] = []
+        for path in sorted(self.directory.glob("pending-*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if data.get("account") != self.account or data.get("run_id") == self.run_id:
+                continue
+            target = path.with_name(f"{path.name}.claimed-{self.run_id}-{os.getpid()}")
+            try:
+                os.replace(path, target)
+            except OSError:
+                continue  # claimed by another sweeper
+            ids.extend(data.get("ids") or ())
+            claimed.append(target)
+        return ids, claimed
+
+    @staticmethod
+    def release_claims(claimed: Iterable[Path]) -> None:
+        for path in claimed:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class CleanupQueue:
+    """
+    Session-scoped queue of contacts to delete, owned by one user token.
+    Deletes go through an AsyncApiClient on a LoopThread, so they run concurrently
+    and never block the calling test.
+    """
+
+    def __init__(
+        self, async_loop, async_client, token: str, store: Optional[PendingStore] = None, persist_interval: float = 1.0
+    ):
+        self._loop = async_loop
+        self._client = async_client
+        self._token = token
+        self._store = store
+        self.persist_interval = persist_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, None] = {}  # insertion-ordered set
+        self._in_flight: Dict[str, Future] = {}  # running deletes, and failed ones until drain() reports them
+        self._dirty = False
+        self._persisted_at = float("-inf")
+        self.deleted = 0
+
+    @property
+    def pending_ids(self) -> List[str]:
+        """Ids registered and not yet released (deleted at drain())."""
+        with self._lock:
+            return list(self._pending)
+
+    def _persist(self, force: bool = False) -> None:
+        # called with the lock held; writes at most once per persist_interval unless forced
+        if self._store is None:
+            return
+        self._dirty = True
+        now = time.monotonic()
+        if force or now - self._persisted_at >= self.persist_interval:
+            self._store.save(list(self._pending) + list(self._in_flight))
+            self._dirty = False
+            self._persisted_at = now
+
+    def flush(self) -> None:
+        """Write the pending store now if it has unsaved changes."""
+        with self._lock:
+            if self._dirty:
+                self._persist(force=True)
+
+    def register(self, contact_id: str) -> None:
+        """Track a created contact; it is deleted at drain() at the latest."""
+        with self._lock:
+            self._pending[contact_id] = None
+            self._persist()
+
+    def release(self, contact_id: str) -> None:
+        """The contact is no longer needed: start deleting it in the background."""
+        with self._lock:
+            self._pending.pop(contact_id, None)
+            if contact_id in self._in_flight:
+                return
+            future = self._loop.submit(self._client.delete(f"/contacts/{contact_id}", token=self._token))
+            self._in_flight[contact_id] = future
+        # outside the lock: the callback runs right away if the delete already finished
+        future.add_done_callback(lambda f: self._settle(contact_id, f))
+
+    def _settle(self, contact_id: str, future: Future) -> None:
+        """Done-callback of a background delete: a successful one leaves the queue (failures wait for drain())."""
+        try:
+            ok = future.result().status in DELETED_STATUSES
+        except BaseException:
+            ok = False
+        if not ok:
+            return
+        with self._lock:
+            if self._in_flight.get(contact_id) is not future:
+                return  # drain() took it over
+            del self._in_flight[contact_id]
+            self.deleted += 1
+            self._persist()
+
+    def _failed(self, contact_id: str, result: Any) -> bool:
+        if isinstance(result, BaseException):
+            log.warning("Cleanup: exception while deleting contact %s: %r", contact_id, result)
+            return True
+        if result.status not in DELETED_STATUSES:
+            log.warning("Cleanup: delete returned %s for contact %s", result.status, contact_id)
+            return True
+        return False
+
+    def delete_now(self, ids: List[str]) -> List[str]:
+        """Delete `ids` in one concurrent batch; returns the ids that could not be deleted."""
+        if not ids:
+            return []
+        responses = self._loop.run(self._client.delete_contacts(self._token, ids))
+        failed = [cid for cid, resp in zip(ids, responses) if self._failed(cid, resp)]
+        self.deleted += len(ids) - len(failed)
+        return failed
+
+    def drain(self) -> int:
+        """
+        Wait for background deletes, then delete every registered contact concurrently.
+        Returns the number of contacts that could not be deleted; their ids stay in the
+        pending store so the next run's sweep retries them.
+        """
+        with self._lock:
+            in_flight, self._in_flight = self._in_flight, {}
+            ids, self._pending = list(self._pending), {}
+
+        failed = []
+        for cid, future in in_flight.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                result = e
+            if self._failed(cid, result):
+                failed.append(cid)
+            else:
+                self.deleted += 1
+        failed += self.delete_now(ids)
+
+        with self._lock:
+            if self._store is not None:
+                self._store.save(failed + list(self._pending) + list(self._in_flight))
+                self._dirty = False
+        return len(failed)
+
+    def sweep(self, scan: bool = True, min_age_s: float = 7200.0, max_pages: int = 10) -> int:
+        """
+        Delete contacts abandoned by earlier runs:
+        - ids other runs left in the pending store (crashed before drain())
+        - with `scan`, listed contacts whose run tag names another run started more than
+          `min_age_s` ago (younger runs may still be in progress on the same account)
+        Returns the number of contacts deleted.
+        """
+        ids: List[str] = []
+        claimed: List[Path] = []
+        if self._store is not None:
+            ids, claimed = self._store.claim_stale()
+
+        if scan:
+            current = current_run_id()
+            cutoff = time.time() - min_age_s
+            known = set(ids)
+            for item in iter_contacts(self._client, self._token, max_pages=max_pages, prefetch=4, async_loop=self._loop):
+                run_id = parse_run_tag(item.get("street2"))
+                if run_id is None or run_id == current:
+                    continue
+                started = run_started_at(run_id)
+                if started is not None and started < cutoff and item.get("_id") not in known:
+                    ids.append(item["_id"])
+                    known.add(item["_id"])
+
+        before = self.deleted
+        failed = self.delete_now(ids)
+        if self._store is not None:
+            PendingStore.release_claims(claimed)
+            if failed:
+                # keep them on this run's list so the next sweep tries again
+                with self._lock:
+                    self._pending.update(dict.fromkeys(failed))
+                    self._persist(force=True)
+        swept = self.deleted - before
+        if ids:
+            log.info("Cleanup: swept %d orphaned contact(s) from earlier runs", swept)
+        return swept
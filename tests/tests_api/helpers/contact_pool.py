@@ -0,0 +1,122 @@
+"""
+Session-wide pool of pre-provisioned contacts.
+
+Contacts are created in bulk (concurrently, through AsyncApiClient) the first
+time the pool is filled. Read-only tests lease a shared contact from the pool.
+Every created contact is registered with a CleanupQueue (see cleanup.py), which
+deletes it in the background or in one concurrent batch at session end.
+"""
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from tests.factories import generate_contact_payloads
+from tests.tests_api.helpers.cleanup import CleanupQueue
+
+log = logging.getLogger(__name__)
+
+
+class ContactPoolError(RuntimeError):
+    """Raised when the pool cannot provide a contact (e.g. bulk creation failed)."""
+
+
+class ContactPool:
+    """
+    Pool of contacts owned by one user token.
+
+    - fill(): bulk-create `size` contacts (idempotent)
+    - lease(): return a shared {"id", "payload"} resource, round-robin
+    - register(id): track a contact created elsewhere so it is cleaned up with the pool
+    - drain(): delete every tracked contact concurrently
+
+    Pass the session's `cleanup` queue to share it; by default the pool owns a private one.
+    """
+
+    def __init__(
+        self,
+        async_loop,
+        async_client,
+        token: str,
+        size: int = 4,
+        payloads_factory: Callable[[int], List[Dict[str, Any]]] = generate_contact_payloads,
+        cleanup: Optional[CleanupQueue] = None,
+    ):
+        if size < 1:
+            raise ValueError("ContactPool size must be >= 1")
+        self._loop = async_loop
+        self._client = async_client
+        self._token = token
+        self.size = size
+        self._payloads_factory = payloads_factory
+        self.cleanup = cleanup or CleanupQueue(async_loop, async_client, token)
+
+        self._shared: List[Dict[str, Any]] = []
+        self._cycle = None
+        self._filled = False
+        self._lock = threading.Lock()
+
+    @property
+    def owned_ids(self) -> List[str]:
+        """Ids of every contact the pool will delete on drain()."""
+        return self.cleanup.pending_ids
+
+    def fill(self) -> None:
+        """Create the shared contacts in one concurrent batch. Safe to call repeatedly."""
+        with self._lock:
+            if self._filled:
+                return
+            self._filled = True
+
+            payloads = self._payloads_factory(self.size)
+            responses = self._loop.run(
+                self._client.create_contacts(self._token, payloads, return_exceptions=True)
+            )
+            for payload, resp in zip(payloads, responses):
+                created_id = self._created_id(resp)
+                if created_id:
+                    self._shared.append({"id": created_id, "payload": payload})
+                    self.cleanup.register(created_id)
+
+            if self._shared:
+                self._cycle = itertools.cycle(self._shared)
+            log.info("ContactPool: created %d/%d shared contacts", len(self._shared), self.size)
+
+    def _created_id(self, resp) -> Optional[str]:
+        if isinstance(resp, BaseException):
+            log.warning("ContactPool: create raised %r", resp)
+            return None
+        if resp.status not in (200, 201):
+            log.warning("ContactPool: create returned %s", resp.status)
+            return None
+        try:
+            body = self._loop.run(resp.json())
+        except Exception:
+            log.warning("ContactPool: create response was not JSON")
+            return None
+        return body.get("_id") if isinstance(body, dict) else None
+
+    def lease(self) -> Dict[str, Any]:
+        """
+        Return a shared contact for read-only use.
+        The returned payload must not be mutated by the caller.
+        """
+        self.fill()
+        if self._cycle is None:
+            raise ContactPoolError("Contact pool is empty: bulk creation of contacts failed")
+        with self._lock:
+            return next(self._cycle)
+
+    def register(self, contact_id: str) -> None:
+        """Track a contact created outside the pool so drain() deletes it too."""
+        self.cleanup.register(contact_id)
+
+    def drain(self) -> int:
+        """
+        Forget the shared contacts and delete every tracked contact concurrently (best-effort).
+        Returns the number of deletes that did not succeed; already-deleted
+        contacts (404/400) count as success.
+        """
+        with self._lock:
+            self._shared, self._cycle = [], None
+        return self.cleanup.drain()
@@ -0,0 +1,214 @@
+"""
+Session-level index of the /contacts list, keyed by _id and by email.
+
+The index is built from one full scan of GET /contacts on first lookup and then
+kept up to date from the writes the framework's clients make: ContactsIndex is a
+request hook (see clients/instrumentation.py), so every POST/PUT/PATCH/DELETE on
+/contacts made through a hooked client is observed.
+
+- DELETE /contacts/{id}: the entry is dropped
+- PUT/PATCH /contacts/{id}: the entry is marked stale and re-fetched with
+  GET /contacts/{id} the next time a lookup could depend on it
+- POST /contacts: the new id is unknown to the hook, so the next lookup miss
+  re-scans the list. A miss is never answered with GET /contacts/{id}: that
+  would show the contact exists, not that it is listed
+
+Writes made outside hooked clients are not seen; use invalidate() after them,
+or `verify=True` to check a lookup against a fresh scan.
+
+    index.find(async_api_client, auth_token, contact_id=cid, async_loop=async_loop)
+"""
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from tests.tests_api.helpers.list_search import find_in_contacts_list, iter_contacts
+
+_CONTACT_PATH = re.compile(r"^/contacts(?:/(?P<id>[^/?]+))?/?(?:\?.*)?$")
+_WRITES = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class ContactsIndex:
+    """
+    Lazily built map of the current user's contacts. Thread-safe.
+
+    Lookups take the client and token to use for (re-)fetches; pass `async_loop`
+    together with an AsyncApiClient to scan with concurrent page prefetch.
+    """
+
+    def __init__(self, page_size: int = 100, max_pages: int = 10, prefetch: int = 4):
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_email: Dict[str, str] = {}
+        self._stale: set = set()
+        self._loaded = False
+        self._complete = False
+        self._unseen_creates = 0
+        self.scans = 0
+        self.fetches = 0
+
+    # ---- request hook ----
+    def __call__(self, record: Dict[str, Any]) -> None:
+        method = record["method"].upper()
+        status = record.get("status")
+        if method not in _WRITES or status is None or not 200 <= status <= 299:
+            return
+        match = _CONTACT_PATH.match(record["raw_path"])
+        if match is None:
+            return
+        cid = match.group("id")
+        with self._lock:
+            if method == "POST" and cid is None:
+                self._unseen_creates += 1
+            elif method == "DELETE" and cid is not None:
+                self._drop(cid)
+            elif cid is not None:
+                self._stale.add(cid)
+
+    # ---- maintenance ----
+    def _drop(self, cid: str) -> None:
+        contact = self._by_id.pop(cid, None)
+        self._stale.discard(cid)
+        if contact is not None and self._by_email.get(contact.get("email")) == cid:
+            del self._by_email[contact["email"]]
+
+    def _put(self, contact: Dict[str, Any]) -> None:
+        cid = contact.get("_id")
+        if not cid:
+            return
+        self._drop(cid)
+        self._by_id[cid] = contact
+        if contact.get("email"):
+            self._by_email[contact["email"]] = cid
+
+    def invalidate(self, contact_id: Optional[str] = None) -> None:
+        """Forget one contact (re-fetched on next lookup) or, without an id, the whole index."""
+        with self._lock:
+            if contact_id is not None:
+                self._drop(contact_id)
+                self._stale.add(contact_id)
+                return
+            self._by_id.clear()
+            self._by_email.clear()
+            self._stale.clear()
+            self._loaded = self._complete = False
+            self._unseen_creates = 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    # ---- fetching ----
+    def _scan(self, client, token: str, async_loop) -> None:
+        with self._lock:
+            self._unseen_creates = 0  # creates observed from now on may be missed by the scan
+            self._stale.clear()
+        contacts = {}
+        count = 0
+        for item in iter_contacts(
+            client, token, page_size=self.page_size, max_pages=self.max_pages, prefetch=self.prefetch, async_loop=async_loop
+        ):
+            count += 1
+            if item.get("_id"):
+                contacts[item["_id"]] = item
+        with self._lock:
+            self._by_id.clear()
+            self._by_email.clear()
+            for contact in contacts.values():
+                self._put(contact)
+            self._loaded = True
+            self._complete = count < self.page_size * self.max_pages
+            self.scans += 1
+
+    def _fetch_one(self, client, token: str, cid: str, async_loop) -> Optional[Dict[str, Any]]:
+        """GET /contacts/{id}; updates the index and returns the contact (None if it is gone)."""
+        if async_loop is not None:
+            resp = async_loop.run(client.get(f"/contacts/{cid}", token=token))
+            body = async_loop.run(resp.json()) if resp.status == 200 else None
+        else:
+            resp = client.get(f"/contacts/{cid}", token=token)
+            body = resp.json() if resp.status == 200 else None
+        with self._lock:
+            self.fetches += 1
+            self._stale.discard(cid)
+            if isinstance(body, dict) and body.get("_id"):
+                self._put(body)
+                return dict(body)
+            self._drop(cid)
+            return None
+
+    def _refresh_stale(self, client, token: str, async_loop) -> None:
+        with self._lock:
+            stale = list(self._stale)
+        for cid in stale:
+            self._fetch_one(client, token, cid, async_loop)
+
+    # ---- lookups ----
+    def find(
+        self,
+        client,
+        token: str,
+        contact_id: Optional[str] = None,
+        email: Optional[str] = None,
+        async_loop=None,
+        verify: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the contact matching `contact_id` (preferred) or `email`, or None.
+        `verify=True` ignores the index, searches the live list and stores what it finds.
+        """
+        if not contact_id and not email:
+            return None
+        if verify:
+            return self._verify(client, token, contact_id, email, async_loop)
+
+        if not self._loaded:
+            self._scan(client, token, async_loop)
+        self._refresh_stale(client, token, async_loop)
+
+        found, unseen = self._lookup(contact_id, email)
+        if found is not None:
+            return found
+        if unseen:
+            # a create we could not attribute may be the one asked for
+            self._scan(client, token, async_loop)
+            return self._lookup(contact_id, email)[0]
+        return None
+
+    def _lookup(self, contact_id: Optional[str], email: Optional[str]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """(contact or None, creates were observed since the last scan)"""
+        with self._lock:
+            cid = contact_id if contact_id in self._by_id else self._by_email.get(email) if email else None
+            found = dict(self._by_id[cid]) if cid in self._by_id else None
+            return found, self._unseen_creates > 0
+
+    def _verify(self, client, token, contact_id, email, async_loop) -> Optional[Dict[str, Any]]:
+        found = find_in_contacts_list(
+            client,
+            token,
+            created_id=contact_id,
+            email=email,
+            page_size=self.page_size,
+            max_pages=self.max_pages,
+            prefetch=self.prefetch,
+            async_loop=async_loop,
+        )
+        with self._lock:
+            if found is not None:
+                self._put(found)
+            elif contact_id:
+                self._drop(contact_id)
+        return dict(found) if found is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "contacts": len(self._by_id),
+                "complete": self._complete,
+                "scans": self.scans,
+                "fetches": self.fetches,
+                "stale": len(self._stale),
+                "unseen_creates": self._unseen_creates,
+            }
@@ -1,8 +1,172 @@
 """
 Helpers to search the /contacts list safely (bounded pagination).
+
+Each page is parsed once through the response's json() (the framework codec, and
+ApiResponse's parse-once cache for the sync client) and its items are yielded one
+by one, so a search stops at the first match instead of scanning the rest of the
+list. With an AsyncApiClient and a background loop, the next `prefetch` pages are
+fetched concurrently and outstanding fetches are cancelled once the search is done.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+_ID_KEYS = ("_id", "id", "contactId")
+
+
+def _page_params(params: Optional[Dict[str, Any]], page_param: str, limit_param: str, page_size: int, page: int):
+    page_params = dict(params or {})
+    page_params.update({limit_param: page_size, page_param: page})
+    return page_params
+
+
+def _iter_pages_sync(api_client, auth_token, params, page_param, limit_param, page_size, max_pages) -> Iterator[Tuple[int, Any]]:
+    """Fetch pages one after another, yielding (status, parsed body or None)."""
+    for page in range(1, max_pages + 1):
+        resp = api_client.get(
+            "/contacts", token=auth_token, params=_page_params(params, page_param, limit_param, page_size, page)
+        )
+        if resp is None:
+            return
+        try:
+            body = resp.json()
+        except Exception:
+            body = None
+        yield resp.status, body
+
+
+async def _aiter_pages(async_client, auth_token, params, page_param, limit_param, page_size, max_pages, prefetch):
+    """
+    Keep up to `prefetch` page fetches in flight and yield (status, parsed body or None) in page order.
+    Any fetch still outstanding when the consumer stops is cancelled.
+    """
+
+    async def fetch(page: int):
+        resp = await async_client.get(
+            "/contacts", token=auth_token, params=_page_params(params, page_param, limit_param, page_size, page)
+        )
+        try:
+            body = await resp.json()
+        except Exception:
+            body = None
+        return resp.status, body
+
+    pending = deque()
+    next_page = 1
+    try:
+        while True:
+            while len(pending) < prefetch and next_page <= max_pages:
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _iter_pages_concurrent(async_loop, async_client, auth_token, params, page_param, limit_param, page_size, max_pages, prefetch):
+    """Sync bridge over _aiter_pages running on `async_loop` (a LoopThread)."""
+    agen = _aiter_pages(async_client, auth_token, params, page_param, limit_param, page_size, max_pages, prefetch)
+    try:
+        while True:
+            try:
+                yield async_loop.run(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        async_loop.run(agen.aclose())
+
+
+def iter_contacts(
+    api_client,
+    auth_token: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_param: str = "page",
+    limit_param: str = "limit",
+    page_size: int = 100,
+    max_pages: int = 10,
+    prefetch: int = 1,
+    async_loop=None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield contacts from GET /contacts page by page, one item at a time.
+
+    - api_client: an ApiClient, or an AsyncApiClient when `async_loop` is given
+    - async_loop: a LoopThread (the `async_loop` fixture); enables concurrent prefetching
+    - prefetch: number of pages kept in flight when `async_loop` is given
+
+    Iteration stops on the first non-200 page, non-JSON/non-list body, short page or after `max_pages`.
+    Closing the generator early cancels outstanding page fetches.
+    """
+    if async_loop is not None:
+        pages = _iter_pages_concurrent(
+            async_loop, api_client, auth_token, params, page_param, limit_param, page_size, max_pages, max(1, prefetch)
+        )
+    else:
+        pages = _iter_pages_sync(api_client, auth_token, params, page_param, limit_param, page_size, max_pages)
+
+    try:
+        for status, items in pages:
+            # stop searching on server error
+            if status != 200:
+                return
+            # Response was not a JSON list: nothing to do
+            if not isinstance(items, list):
+                return
+
+            for item in items:
+                if isinstance(item, dict):
+                    yield item
+
+            # If this page returned fewer items than requested, assume last page => stop early
+            if len(items) < page_size:
+                return
+    finally:
+        pages.close()
+
+
+def find_many_in_contacts_list(
+    api_client,
+    auth_token: str,
+    ids: Optional[Iterable[str]] = None,
+    emails: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up several contacts in a single pass over GET /contacts.
+
+    Returns a dict mapping every id / email that was found to its contact dict.
+    Scanning stops as soon as all requested keys are found. Accepts the same
+    keyword arguments as iter_contacts (params, page_size, max_pages, prefetch, async_loop, ...).
+    """
+    wanted_ids = set(ids or ())
+    wanted_emails = set(emails or ())
+    found: Dict[str, Dict[str, Any]] = {}
+    if not wanted_ids and not wanted_emails:
+        return found
+
+    items = iter_contacts(api_client, auth_token, **kwargs)
+    try:
+        for item in items:
+            for key in _ID_KEYS:
+                value = item.get(key)
+                if value in wanted_ids:
+                    wanted_ids.discard(value)
+                    found[value] = item
+            email = item.get("email")
+            if email in wanted_emails:
+                wanted_emails.discard(email)
+                found[email] = item
+            if not wanted_ids and not wanted_emails:
+                break
+    finally:
+        items.close()
+    return found
 
 
 def find_in_contacts_list(
@@ -15,11 +179,13 @@ def find_in_contacts_list(
     limit_param: str = "limit",
     page_size: int = 100,
     max_pages: int = 10,
+    prefetch: int = 1,
+    async_loop=None,
 ) -> Optional[Dict[str, Any]]:
     """
     Try to find a contact in GET /contacts using safe pagination.
 
-    - api_client: your ApiClient instance fixture
+    - api_client: your ApiClient instance fixture (or AsyncApiClient together with `async_loop`)
     - auth_token: bearer token string
     - created_id: if provided, match by _id / id / contactId
     - email: if provided, match by email
@@ -27,45 +193,31 @@ def find_in_contacts_list(
     - page_param / limit_param: query param names used by the API for paging
     - page_size: number of items per page to request
     - max_pages: maximum pages to check (to avoid scanning thousands of items)
+    - prefetch / async_loop: see iter_contacts
 
-    Returns the matching contact dict if found, otherwise None.
+    Returns the first contact matching either the id or the email, otherwise None.
     """
-    params = dict(params or {})
-
-    for page in range(1, max_pages + 1):
-        # Update paging params for this iteration
-        params.update({limit_param: page_size, page_param: page})
-
-        resp = api_client.get("/contacts", token=auth_token, params=params)
-        if resp is None:
-            return None
+    if not created_id and not email:
+        return None
 
-        # stop searching on server error
-        if resp.status != 200:
-            return None
-
-        try:
-            items = resp.json()
-        except Exception:
-            # Response was not JSON: nothing to do
-            return None
-
-        if not isinstance(items, list):
-            return None
-
-        # scan this page
+    items = iter_contacts(
+        api_client,
+        auth_token,
+        params=params,
+        page_param=page_param,
+        limit_param=limit_param,
+        page_size=page_size,
+        max_pages=max_pages,
+        prefetch=prefetch,
+        async_loop=async_loop,
+    )
+    try:
         for item in items:
-            if created_id and (
-                item.get("_id") == created_id
-                or item.get("id") == created_id
-                or item.get("contactId") == created_id
-            ):
+            if created_id and any(item.get(key) == created_id for key in _ID_KEYS):
                 return item
             if email and item.get("email") == email:
                 return item
-
-        # If this page returned fewer items than requested, assume last page => stop early
-        if len(items) < page_size:
-            break
+    finally:
+        items.close()
 
     return None
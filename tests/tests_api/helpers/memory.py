@@ -0,0 +1,196 @@
+"""
+Memory sampling for soak runs.
+
+MemorySampler is a request hook (see clients/instrumentation.py). Every `every`
+requests it samples:
+  - the RSS of this process
+  - the RSS of its child processes; the Playwright driver, which holds response
+    bodies until they are disposed, is one of them
+  - the Python heap traced by tracemalloc
+
+The first `every` requests are a warm-up (driver start-up, imports, caches
+filling) and are not attributed. After that, the growth between two samples is
+attributed to the endpoints called in that window, in proportion to their request counts. A leak therefore shows up on the
+endpoints that cause it, as growth per 1,000 requests. The first and last
+tracemalloc snapshots are also compared to list the source lines that grew most.
+RSS figures come from /proc and are None on platforms without it.
+
+    sampler = MemorySampler(every=500).start()
+    client = ApiClient(request_context, hooks=[sampler])
+    ...
+    sampler.stop()                 # before the request context and driver are closed
+    print(sampler.format_table())
+
+Requests made after stop() are not counted.
+"""
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+METRICS = ("rss", "children_rss", "traced")
+TOP_ALLOCATIONS = 10
+
+
+def rss_bytes(pid: Any = "self") -> Optional[int]:
+    """Resident set size of a process from /proc/<pid>/statm (None if unavailable)."""
+    try:
+        return int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def child_pids(pid: Optional[int] = None) -> List[int]:
+    """Direct children of `pid` (default: this process), from /proc/<pid>/task/*/children."""
+    pid = pid or os.getpid()
+    children: List[int] = []
+    for task in Path(f"/proc/{pid}/task").glob("*"):
+        try:
+            children.extend(int(c) for c in (task / "children").read_text().split())
+        except (OSError, ValueError):
+            continue
+    return children
+
+
+def children_rss_bytes() -> Optional[int]:
+    """Total RSS of this process's children and their children (the Playwright driver and its helpers)."""
+    if not Path("/proc/self/statm").exists():
+        return None
+    total = 0
+    pending = child_pids()
+    while pending:
+        pid = pending.pop()
+        total += rss_bytes(pid) or 0
+        pending.extend(child_pids(pid))
+    return total
+
+
+class MemorySampler:
+    """Request hook sampling memory every `every` requests; thread-safe."""
+
+    def __init__(self, every: int = 500, trace: bool = True):
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        self.every = every
+        self.trace = trace
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._window: Dict[str, int] = defaultdict(int)
+        self._totals: Dict[str, int] = defaultdict(int)
+        self._growth: Dict[str, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(METRICS, 0.0))
+        self.samples: List[Dict[str, Any]] = []
+        self._first_snapshot = self._last_snapshot = None
+        self._started_tracing = False
+        self._stopped = False
+
+    # ---- lifecycle ----
+    def start(self) -> "MemorySampler":
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def stop(self) -> None:
+        """Take the last sample; call it while the Playwright driver is still running. Idempotent."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            if self._window and self.samples:
+                self._sample()
+        if self.trace and tracemalloc.is_tracing():
+            self._last_snapshot = tracemalloc.take_snapshot()
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    # ---- request hook ----
+    def __call__(self, record: Dict[str, Any]) -> None:
+        endpoint = f"{record['method']} {record['path']}"
+        with self._lock:
+            if self._stopped:
+                return
+            self._requests += 1
+            self._window[endpoint] += 1
+            if self._requests % self.every == 0:
+                self._sample()
+                if len(self.samples) == 1 and self.trace and tracemalloc.is_tracing():
+                    self._first_snapshot = tracemalloc.take_snapshot()
+
+    def _sample(self) -> None:
+        # called with the lock held
+        sample = {
+            "requests": self._requests,
+            "time": round(time.time(), 3),
+            "rss": rss_bytes(),
+            "children_rss": children_rss_bytes(),
+            "traced": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        }
+        if self.samples and self._window:  # the window before the first sample is the warm-up
+            previous = self.samples[-1]
+            calls = sum(self._window.values())
+            for endpoint, n in self._window.items():
+                self._totals[endpoint] += n
+            for metric in METRICS:
+                if sample[metric] is None or previous[metric] is None:
+                    continue
+                delta = sample[metric] - previous[metric]
+                for endpoint, n in self._window.items():
+                    self._growth[endpoint][metric] += delta * n / calls
+        self._window.clear()
+        self.samples.append(sample)
+
+    # ---- results ----
+    def endpoint_growth(self) -> Dict[str, Dict[str, Any]]:
+        """Per endpoint: requests, attributed growth in bytes and growth per 1,000 requests."""
+        with self._lock:
+            out = {}
+            for endpoint, n in sorted(self._totals.items()):
+                growth = {m: round(v) for m, v in self._growth[endpoint].items()}
+                out[endpoint] = {
+                    "requests": n,
+                    "growth_bytes": growth,
+                    "growth_per_1k_requests": {m: round(v * 1000 / n) for m, v in growth.items()},
+                }
+            return out
+
+    def top_allocations(self, limit: int = TOP_ALLOCATIONS) -> List[str]:
+        """Source lines whose traced memory grew most between the first and last snapshot."""
+        if self._first_snapshot is None or self._last_snapshot is None:
+            return []
+        stats = self._last_snapshot.compare_to(self._first_snapshot, "lineno")
+        return [str(stat) for stat in stats[:limit] if stat.size_diff > 0]
+
+    def to_json(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = list(self.samples)
+        return {
+            "every": self.every,
+            "samples": samples,
+            "endpoints": self.endpoint_growth(),
+            "top_allocations": self.top_allocations(),
+        }
+
+    def format_table(self) -> str:
+        def kib(value) -> str:
+            return "-" if value is None else f"{value / 1024:+.0f}"
+
+        lines = []
+        if len(self.samples) >= 2:
+            first, last = self.samples[0], self.samples[-1]
+            total = {m: None if first[m] is None or last[m] is None else last[m] - first[m] for m in METRICS}
+            lines.append(
+                f"{last['requests']} requests, {len(self.samples)} samples; growth (KiB): "
+                + ", ".join(f"{m} {kib(total[m])}" for m in METRICS)
+            )
+        lines.append(f"{'endpoint':<32}{'requests':>10}" + "".join(f"{m + ' KiB/1k':>20}" for m in METRICS))
+        for endpoint, e in self.endpoint_growth().items():
+            per_1k = e["growth_per_1k_requests"]
+            lines.append(f"{endpoint:<32}{e['requests']:>10}" + "".join(f"{kib(per_1k[m]):>20}" for m in METRICS))
+        for stat in self.top_allocations(5):
+            lines.append("  " + stat)
+        return "\n".join(lines)
@@ -0,0 +1,103 @@
+"""
+Registry of the JSON schemas under tests/tests_api/schemas/.
+
+Every schema file is read, checked and compiled into a validator once per
+process (with format checking enabled). Schemas may `$ref` each other by file
+name, e.g. {"$ref": "contact_schema.json"}.
+
+Usage:
+    validate_response("login", body)          # raises SchemaValidationError
+    errors = get_schema_registry().errors("contact_list", body)
+
+Schema names are file names without the "_schema.json" suffix
+("login_schema.json" -> "login"); the full file name is accepted too.
+
+jsonschema is imported when the registry is first built, not at import time, so
+collecting tests that never validate a schema does not pay for it.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCHEMAS_DIR = Path(__file__).resolve().parents[1] / "schemas"
+
+
+class SchemaValidationError(AssertionError):
+    """A response body does not match its schema. Carries the first jsonschema error's details."""
+
+    def __init__(self, schema_name: str, error):
+        self.schema_name = schema_name
+        self.message = error.message
+        self.path = list(error.absolute_path)
+        self.schema_path = list(error.absolute_schema_path)
+        self.error = error
+        super().__init__(f"{schema_name}: {self.message} (at {'/'.join(map(str, self.path)) or '<root>'})")
+
+
+class SchemaRegistry:
+    """Loads and compiles every *.json schema in a directory once."""
+
+    def __init__(self, schemas_dir: Path = SCHEMAS_DIR):
+        from jsonschema import FormatChecker
+        from jsonschema.validators import validator_for
+        from referencing import Registry, Resource
+        from referencing.jsonschema import DRAFT7
+
+        self.schemas_dir = Path(schemas_dir)
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, str] = {}
+
+        resources = []
+        for path in sorted(self.schemas_dir.glob("*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                schema = json.load(f)
+            self._schemas[path.name] = schema
+            self._aliases[path.name] = path.name
+            self._aliases[path.name[: -len("_schema.json")] if path.name.endswith("_schema.json") else path.stem] = path.name
+            resources.append((path.name, Resource.from_contents(schema, default_specification=DRAFT7)))
+
+        registry = Registry().with_resources(resources)
+        format_checker = FormatChecker()
+        self._validators = {}
+        for file_name, schema in self._schemas.items():
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            self._validators[file_name] = cls(schema, registry=registry, format_checker=format_checker)
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(k for k, v in self._aliases.items() if k != v)
+
+    def _file_name(self, name: str) -> str:
+        try:
+            return self._aliases[name]
+        except KeyError:
+            raise KeyError(f"Unknown schema {name!r}; known schemas: {self.names}") from None
+
+    def schema(self, name: str) -> Dict[str, Any]:
+        return self._schemas[self._file_name(name)]
+
+    def validate(self, name: str, body: Any) -> None:
+        """Raise SchemaValidationError for the first problem found in `body`."""
+        from jsonschema import ValidationError
+
+        try:
+            self._validators[self._file_name(name)].validate(body)
+        except ValidationError as e:
+            raise SchemaValidationError(name, e) from None
+
+    def errors(self, name: str, body: Any) -> List["ValidationError"]:
+        """Return every validation error for `body` (empty list when valid)."""
+        return list(self._validators[self._file_name(name)].iter_errors(body))
+
+
+@lru_cache(maxsize=None)
+def get_schema_registry() -> SchemaRegistry:
+    """Process-wide registry, built on first use."""
+    return SchemaRegistry()
+
+
+def validate_response(name: str, body: Any) -> None:
+    """Validate a parsed response body against a named schema (raises SchemaValidationError)."""
+    get_schema_registry().validate(name, body)
@@ -0,0 +1,176 @@
+"""
+Persistent auth token cache shared across pytest sessions and worker processes.
+
+Tokens are stored as small JSON files (one per user + base URL) in a directory
+inside the pytest cache. A token is reused until `refresh_margin` seconds
+before its JWT `exp` claim; tokens without `exp` are kept for `default_ttl`.
+Reads and refreshes take an exclusive file lock, so parallel workers log in at
+most once between them.
+
+A cached token is trusted until its `exp`; nothing is sent to check it. A token
+can still be revoked before it expires (logout, server restart): TokenRefresher
+logs in again once a real request is answered with 401.
+
+Usage:
+    cache = TokenCache(request.config.cache.mkdir("auth_tokens"))
+    token = cache.get_token(email, base_url, lambda: client.login_user(email, pwd))
+"""
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """Return the `exp` claim of a JWT (epoch seconds) or None if absent/unparseable."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        exp = claims.get("exp")
+        return float(exp) if exp is not None else None
+    except Exception:
+        return None
+
+
+@contextlib.contextmanager
+def _locked(path: Path):
+    """Hold an exclusive lock on `path` (created if missing) for the duration of the block."""
+    with open(path, "a+b") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class TokenCache:
+    """File-backed, expiry-aware token cache keyed by (email, base_url)."""
+
+    def __init__(self, cache_dir, refresh_margin: float = 300.0, default_ttl: float = 1800.0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+
+    def _entry_path(self, email: str, base_url: str) -> Path:
+        key = hashlib.sha256(f"{email}\n{base_url.rstrip('/')}".encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _fresh(self, entry: Optional[dict]) -> bool:
+        return bool(entry and entry.get("token") and entry.get("expires_at", 0) - self.refresh_margin > time.time())
+
+    def get_token(
+        self,
+        email: str,
+        base_url: str,
+        login: Callable[[], Optional[str]],
+        rejected: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Return a cached, not-about-to-expire token, or call `login()` and cache its result.
+        `rejected` is a token the API answered with 401: it is never returned, so the
+        caller gets the token another worker already logged in for, or one new login.
+        Returns None (and caches nothing) when login does not produce a token.
+        """
+        path = self._entry_path(email, base_url)
+        entry = self._read(path)
+        if self._fresh(entry) and entry["token"] != rejected:
+            return entry["token"]
+
+        with _locked(path.with_suffix(".lock")):
+            # another worker may have refreshed the token while we waited for the lock
+            entry = self._read(path)
+            if self._fresh(entry) and entry["token"] != rejected:
+                return entry["token"]
+            if rejected is not None and entry and entry.get("token") == rejected:
+                self.invalidate(email, base_url)
+
+            token = login()
+            if not token:
+                return None
+            expires_at = jwt_expiry(token) or time.time() + self.default_ttl
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"email": email, "base_url": base_url, "token": token, "expires_at": expires_at}, f)
+            os.replace(tmp, path)
+            return token
+
+    def invalidate(self, email: str, base_url: str) -> None:
+        """Forget the cached token (e.g. after the API rejected it)."""
+        with contextlib.suppress(FileNotFoundError):
+            self._entry_path(email, base_url).unlink()
+
+
+class TokenRefresher:
+    """
+    Replaces session tokens the API rejects with 401.
+
+    `auth_token` registers the token it hands out with `track()`. When a client gets a
+    401 for a tracked token it calls `refresh(token)`: the user logs in once (through the
+    TokenCache, when there is one, so parallel workers share the new token) and later
+    calls still made with the old token are sent with the new one (`current()`).
+    Untracked tokens are never refreshed, so tests that expect a 401 still get it.
+    """
+
+    def __init__(self, cache: Optional[TokenCache] = None):
+        self.cache = cache
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self._logins: Dict[str, Tuple[str, str, Callable[[], Optional[str]]]] = {}
+        self._replaced: Dict[str, str] = {}
+
+    def track(self, token: str, email: str, base_url: str, login: Callable[[], Optional[str]]) -> None:
+        with self._lock:
+            self._logins[token] = (email, base_url, login)
+
+    def current(self, token: str) -> str:
+        """The token to send in place of `token` (itself unless it was replaced)."""
+        with self._lock:
+            while token in self._replaced:
+                token = self._replaced[token]
+            return token
+
+    def refresh(self, token: str) -> Optional[str]:
+        """Log in again for a tracked `token` the API rejected; returns the new token or None."""
+        with self._lock:
+            if token in self._replaced:
+                return self._replaced[token]  # another thread already refreshed it
+            if token not in self._logins:
+                return None
+            email, base_url, login = self._logins[token]
+            if self.cache is not None:
+                fresh = self.cache.get_token(email, base_url, login, rejected=token)
+            else:
+                fresh = login()
+            if not fresh or fresh == token:
+                return None
+            self.refreshes += 1
+            self._replaced[token] = fresh
+            self._logins[fresh] = (email, base_url, login)
+            return fresh
@@ -0,0 +1,381 @@
+"""
+In-process stand-in for the Contact List API.
+
+Implements /users, /users/login, /users/me, /users/logout and /contacts CRUD
+(with page/limit pagination) closely enough to run the API tests without
+network access. Latency, jitter and error rates can be injected to benchmark
+and regression-test the framework's own throughput.
+
+Usage:
+    server = LocalContactListApi(latency_ms=20, jitter_ms=5, error_rate=0.01, seed=1)
+    server.start()
+    server.add_user("me@example.com", "secret123")
+    ... point API_BASE_URL / base_url at server.url ...
+    server.stop()
+"""
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_OBJECT_ID = re.compile(r"^[0-9a-f]{24}$")
+_CONTACT_FIELDS = (
+    "firstName",
+    "lastName",
+    "birthdate",
+    "email",
+    "phone",
+    "street1",
+    "street2",
+    "city",
+    "stateProvince",
+    "postalCode",
+    "country",
+)
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, body: Any = None):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+
+
+class LocalContactListApi:
+    """
+    Thread-backed HTTP server holding users and contacts in memory.
+
+    - latency_ms / jitter_ms: delay added to every request (uniform jitter of +/- jitter_ms)
+    - error_rate: probability (0..1) that a request fails with `error_status` before being handled
+    - seed: makes latency, injected errors and generated ids reproducible
+    - token_ttl: lifetime (seconds) of issued JWT tokens
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+        token_ttl: int = 3600,
+    ):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_ttl = token_ttl
+
+        self._random = random.Random(seed)
+        self._secret = str(seed if seed is not None else random.random()).encode()
+        self._ids = itertools.count(self._random.randrange(1 << 40))
+        self._lock = threading.Lock()
+
+        self._users: Dict[str, Dict[str, Any]] = {}  # email -> user record (incl. password)
+        self._contacts: Dict[str, Dict[str, Dict[str, Any]]] = {}  # owner id -> {contact id -> contact}
+        self._revoked = set()
+
+        self.request_count = 0
+        self.injected_errors = 0
+        self.not_modified = 0
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- lifecycle ----
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("LocalContactListApi is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalContactListApi":
+        if self._server is not None:
+            return self
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-contact-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---- data helpers ----
+    def _new_id(self) -> str:
+        return f"{next(self._ids):024x}"
+
+    def add_user(self, email: str, password: str, first_name: str = "Test", last_name: str = "User") -> Dict[str, Any]:
+        """Create (or return the existing) user directly, bypassing HTTP."""
+        with self._lock:
+            user = self._users.get(email)
+            if user is None:
+                user = {
+                    "_id": self._new_id(),
+                    "firstName": first_name,
+                    "lastName": last_name,
+                    "email": email,
+                    "password": password,
+                    "__v": 1,
+                }
+                self._users[email] = user
+                self._contacts[user["_id"]] = {}
+            return self._public_user(user)
+
+    def reset(self) -> None:
+        """Drop all users, contacts and counters."""
+        with self._lock:
+            self._users.clear()
+            self._contacts.clear()
+            self._revoked.clear()
+            self.request_count = 0
+            self.injected_errors = 0
+            self.not_modified = 0
+
+    @staticmethod
+    def _public_user(user: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in user.items() if k != "password"}
+
+    # ---- tokens (HS256 JWT, like the real API) ----
+    def issue_token(self, user_id: str) -> str:
+        now = int(time.time())
+        header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload = _b64url(json.dumps({"_id": user_id, "iat": now, "exp": now + self.token_ttl}).encode())
+        signing_input = f"{header}.{payload}".encode("ascii")
+        signature = _b64url(hmac.new(self._secret, signing_input, hashlib.sha256).digest())
+        return f"{header}.{payload}.{signature}"
+
+    def _user_for_token(self, token: str) -> Optional[Dict[str, Any]]:
+        try:
+            header, payload, signature = token.split(".")
+        except ValueError:
+            return None
+        expected = _b64url(hmac.new(self._secret, f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest())
+        if not hmac.compare_digest(expected, signature) or token in self._revoked:
+            return None
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        if claims.get("exp", 0) < time.time():
+            return None
+        for user in self._users.values():
+            if user["_id"] == claims.get("_id"):
+                return user
+        return None
+
+    # ---- fault injection ----
+    def _inject(self) -> Optional[int]:
+        """Sleep for the configured latency and decide whether this request fails."""
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency_ms + (self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+            if fail:
+                self.injected_errors += 1
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        return self.error_status if fail else None
+
+    # ---- routing ----
+    def handle(self, method: str, raw_path: str, headers, body: bytes) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Dispatch one request and return (status, body, extra_headers).
+        `body` is a JSON-serialisable object, a str (sent as text) or None (empty body).
+        """
+        injected = self._inject()
+        if injected is not None:
+            return injected, {"error": "Injected failure"}, {"Retry-After": "1"}
+
+        url = urlparse(raw_path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split("/") if p]
+
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "Invalid JSON body"}, {}
+
+        try:
+            with self._lock:
+                if parts[:1] == ["users"]:
+                    return self._route_users(method, parts[1:], headers, payload)
+                if parts[:1] == ["contacts"]:
+                    user = self._authenticate(headers)
+                    return self._route_contacts(method, parts[1:], user, query, payload)
+        except _ApiError as e:
+            return e.status, e.body, {}
+        return 404, None, {}
+
+    def _authenticate(self, headers) -> Dict[str, Any]:
+        auth = headers.get("Authorization") or ""
+        token = auth[len("Bearer "):] if auth.startswith("Bearer ") else ""
+        user = self._user_for_token(token) if token else None
+        if user is None:
+            raise _ApiError(401, {"error": "Please authenticate."})
+        return user
+
+    def _route_users(self, method, parts, headers, payload):
+        if method == "POST" and not parts:
+            email = payload.get("email")
+            password = payload.get("password")
+            if not email or not password or len(str(password)) < 7:
+                raise _ApiError(400, {"message": "User validation failed"})
+            if email in self._users:
+                raise _ApiError(400, {"message": "Email address is already in use"})
+            user = {
+                "_id": self._new_id(),
+                "firstName": payload.get("firstName", ""),
+                "lastName": payload.get("lastName", ""),
+                "email": email,
+                "password": password,
+                "__v": 1,
+            }
+            self._users[email] = user
+            self._contacts[user["_id"]] = {}
+            return 201, {"user": self._public_user(user), "token": self.issue_token(user["_id"])}, {}
+
+        if method == "POST" and parts == ["login"]:
+            user = self._users.get(payload.get("email"))
+            if user is None or user["password"] != payload.get("password"):
+                raise _ApiError(401, None)
+            return 200, {"user": self._public_user(user), "token": self.issue_token(user["_id"])}, {}
+
+        if method == "GET" and parts == ["me"]:
+            return 200, self._public_user(self._authenticate(headers)), {}
+
+        if method == "POST" and parts == ["logout"]:
+            self._authenticate(headers)
+            self._revoked.add(headers.get("Authorization")[len("Bearer "):])
+            return 200, None, {}
+
+        raise _ApiError(404, None)
+
+    def _route_contacts(self, method, parts, user, query, payload):
+        contacts = self._contacts.setdefault(user["_id"], {})
+
+        if not parts:
+            if method == "GET":
+                items = list(contacts.values())
+                if "limit" in query:
+                    try:
+                        limit = max(1, int(query["limit"]))
+                        page = max(1, int(query.get("page", 1)))
+                    except ValueError:
+                        raise _ApiError(400, {"error": "Invalid pagination parameters"})
+                    items = items[(page - 1) * limit:page * limit]
+                return 200, items, {}
+            if method == "POST":
+                contact = self._validated_contact(payload, required=True)
+                contact.update({"_id": self._new_id(), "owner": user["_id"], "__v": 0})
+                contacts[contact["_id"]] = contact
+                return 201, contact, {}
+            raise _ApiError(404, None)
+
+        contact_id = parts[0]
+        if len(parts) > 1:
+            raise _ApiError(404, None)
+        if not _OBJECT_ID.match(contact_id):
+            raise _ApiError(400, "Invalid Contact ID")
+        contact = contacts.get(contact_id)
+        if contact is None:
+            raise _ApiError(404, None)
+
+        if method == "GET":
+            return 200, contact, {}
+        if method in ("PUT", "PATCH"):
+            update = self._validated_contact(payload, required=(method == "PUT"))
+            if method == "PUT":
+                contact = {"_id": contact["_id"], "owner": contact["owner"], "__v": contact["__v"]}
+            contact.update(update)
+            contacts[contact_id] = contact
+            return 200, contact, {}
+        if method == "DELETE":
+            del contacts[contact_id]
+            return 200, "Contact deleted", {}
+        raise _ApiError(404, None)
+
+    @staticmethod
+    def _validated_contact(payload: Dict[str, Any], required: bool) -> Dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise _ApiError(400, {"message": "Contact validation failed"})
+        missing = [f for f in ("firstName", "lastName") if required and not payload.get(f)]
+        if missing:
+            raise _ApiError(
+                400,
+                {"message": "Contact validation failed: " + ", ".join(f"{f}: Path `{f}` is required." for f in missing)},
+            )
+        return {f: payload[f] for f in _CONTACT_FIELDS if f in payload}
+
+    # ---- HTTP plumbing ----
+    def _make_handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, out, extra = api.handle(self.command, self.path, self.headers, body)
+
+                if out is None:
+                    raw, ctype = b"", None
+                elif isinstance(out, str):
+                    raw, ctype = out.encode("utf-8"), "text/html; charset=utf-8"
+                else:
+                    raw, ctype = json.dumps(out).encode("utf-8"), "application/json; charset=utf-8"
+
+                if self.command == "GET" and status == 200:
+                    # weak ETag over the body (as Express sends); a matching If-None-Match gets a bodiless 304
+                    etag = f'W/"{len(raw):x}-{hashlib.sha1(raw).hexdigest()[:27]}"'
+                    extra = {**extra, "ETag": etag}
+                    if self.headers.get("If-None-Match") == etag:
+                        status, raw, ctype = 304, b"", None
+                        with api._lock:
+                            api.not_modified += 1
+
+                self.send_response(status)
+                if ctype:
+                    self.send_header("Content-Type", ctype)
+                for key, value in extra.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+        return Handler
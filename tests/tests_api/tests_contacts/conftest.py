@@ -1,23 +1,27 @@
 import pytest
+from tests.config import get_settings
 from tests.factories import generate_contact_payload
 from tests.utils import pretty_resp
+from tests.tests_api.helpers.contact_pool import ContactPool, ContactPoolError
 
 
-@pytest.fixture
-def contact_resource(api_client, auth_token, request):
+@pytest.fixture(scope="session")
+def contact_pool(async_loop, async_api_client, auth_token, cleanup_queue):
     """
-    Create a contact for a test and ensure teardown deletes it.
-
-    Yields a dict: {"id": <contact_id>, "payload": <payload_dict>}.
+    Session-wide pool of pre-created contacts.
 
-    Behavior:
-      - If creation fails, the fixture will `pytest.skip()` the test (so dependent tests are skipped rather than failing with setup noise).
-      - On teardown it attempts to DELETE the created contact; if deletion fails it logs a warning but does not swallow a preceding test failure.
+    Contacts are created in one concurrent batch on first use and registered with
+    `cleanup_queue`, which deletes them in one batch at session end.
     """
+    return ContactPool(
+        async_loop, async_api_client, auth_token, size=get_settings().CONTACT_POOL_SIZE, cleanup=cleanup_queue
+    )
+
+
+def _create_exclusive_contact(api_client, auth_token):
+    """Create a contact for one test only. Skips the test if creation fails."""
     payload = generate_contact_payload()
-    created_id = None
 
-    # Create
     try:
         resp = api_client.post("/contacts", token=auth_token, json=payload)
     except Exception as e:
@@ -39,24 +43,42 @@ def contact_resource(api_client, auth_token, request):
         pretty_resp(resp)
         pytest.skip("Create contact did not return an id; skipping test")
 
-    # Store the created id in pytest cache optionally for debugging reruns
+    return {"id": created_id, "payload": payload}
+
+
+@pytest.fixture
+def contact_resource(api_client, auth_token, contact_pool, cleanup_queue, request):
+    """
+    Provide a contact for a test.
+
+    Yields a dict: {"id": <contact_id>, "payload": <payload_dict>}.
+
+    Behavior:
+      - By default the contact is leased from the session-wide `contact_pool` and shared with
+        other tests, so the test must treat it as read-only.
+      - Tests marked `@pytest.mark.destructive` get their own freshly created contact.
+      - If creation fails, the fixture will `pytest.skip()` the test (so dependent tests are skipped rather than failing with setup noise).
+      - Cleanup is deferred: an exclusive contact is deleted in the background after the test,
+        shared ones in one batch when the session ends (see `cleanup_queue`).
+    """
+    exclusive = request.node.get_closest_marker("destructive") is not None
+    if exclusive:
+        resource = _create_exclusive_contact(api_client, auth_token)
+        cleanup_queue.register(resource["id"])
+    else:
+        try:
+            resource = contact_pool.lease()
+        except ContactPoolError as e:
+            pytest.skip(str(e))
+
+    # Store the id in pytest cache optionally for debugging reruns
     try:
-        request.config.cache.set("contact_resource/last_id", created_id)
+        request.config.cache.set("contact_resource/last_id", resource["id"])
     except Exception:
         pass
 
-    # Yield resource to the test
-    yield {"id": created_id, "payload": payload}
+    # Hand out a copy so a test cannot corrupt the shared payload
+    yield {"id": resource["id"], "payload": dict(resource["payload"])}
 
-    # Teardown (best-effort delete) — do not mask test failures
-    try:
-        del_resp = api_client.delete(f"/contacts/{created_id}", token=auth_token)
-        if del_resp.status not in (200, 204):
-            # Log a warning for visibility
-            print(f"Warning: teardown delete returned {del_resp.status} for contact {created_id}")
-            try:
-                pretty_resp(del_resp)
-            except Exception:
-                pass
-    except Exception as e:
-        print(f"Warning: exception while attempting cleanup for contact {created_id}: {e}")
\ No newline at end of file
+    if exclusive:
+        cleanup_queue.release(resource["id"])
@@ -1,5 +1,5 @@
 import pytest
-from tests.utils import safe_json, pretty_resp, assert_ok
+from tests.utils import safe_json, assert_ok
 
 @pytest.mark.usefixtures("auth_token")
 def test_add_contact(api_client, contact_resource, auth_token):
@@ -14,7 +14,6 @@ def test_add_contact(api_client, contact_resource, auth_token):
     # GET the created contact and assert full payload
     resp = api_client.get(f"/contacts/{cid}", token=auth_token)
     if resp.status != 200:
-        pretty_resp(resp)
         pytest.fail(f"Expected GET 200 for created contact, got {resp.status}")
 
     body = safe_json(resp)
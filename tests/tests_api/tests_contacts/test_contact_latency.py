@@ -0,0 +1,11 @@
+import pytest
+
+
+# Generous budget for the shared free-tier API; regressions against earlier runs
+# are tracked with --latency-max-regression (see tests/plugins/latency.py).
+@pytest.mark.latency(endpoint="/contacts/{id}", p95_ms=1000, samples=30, warmup=3)
+@pytest.mark.usefixtures("auth_token")
+def test_get_contact_latency(api_client, contact_resource, auth_token, latency_probe):
+    """GET /contacts/{id} stays within its p95 budget over repeated calls."""
+    cid = contact_resource["id"]
+    latency_probe(lambda: api_client.get(f"/contacts/{cid}", token=auth_token))
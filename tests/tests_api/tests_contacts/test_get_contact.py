@@ -1,5 +1,6 @@
 import pytest
-from tests.utils import safe_json, pretty_resp, assert_ok
+from tests.utils import safe_json, assert_ok
+from tests.tests_api.helpers.schema_registry import SchemaValidationError, validate_response
 
 
 @pytest.mark.usefixtures("auth_token")
@@ -15,12 +16,16 @@ def test_get_contact(api_client, contact_resource, auth_token):
     # GET by id
     resp = api_client.get(f"/contacts/{cid}", token=auth_token)
     if resp.status != 200:
-        pretty_resp(resp)
         pytest.fail(f"Expected GET 200, got {resp.status}")
 
     body = safe_json(resp)
     assert body is not None
 
+    try:
+        validate_response("contact", body)
+    except SchemaValidationError as e:
+        pytest.fail(f"Contact JSON does not match schema: {e.message}\nValidator path: {list(e.path)}")
+
     expected_fields = (
         "firstName",
         "lastName",
@@ -1,12 +1,13 @@
 import pytest
-from tests.utils import safe_json, pretty_resp, assert_ok
-from tests.tests_api.helpers.list_search import find_in_contacts_list
+from tests.utils import safe_json, assert_ok
 
 
 @pytest.mark.usefixtures("auth_token")
-def test_get_contact_list(api_client, contact_resource, auth_token):
+def test_get_contact_list(api_client, async_api_client, async_loop, contact_resource, contacts_index, auth_token):
     """
     GET /contacts — confirm the created contact appears in the list (bounded pagination).
+    The lookup goes through the session contacts index, so the list is scanned (with
+    concurrent page prefetch) once per session rather than once per test.
     """
     payload = contact_resource["payload"]
     cid = contact_resource["id"]
@@ -16,7 +17,7 @@ def test_get_contact_list(api_client, contact_resource, auth_token):
     assert_ok(get_resp)
 
     # Now search in list (bounded pages)
-    found = find_in_contacts_list(api_client, auth_token, created_id=cid, email=payload["email"], page_size=100, max_pages=10)
+    found = contacts_index.find(async_api_client, auth_token, contact_id=cid, email=payload["email"], async_loop=async_loop)
     assert found is not None, "Created contact not found in first pages of contacts list"
 
     # Full payload assertions for the found item
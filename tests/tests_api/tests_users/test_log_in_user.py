@@ -1,28 +1,17 @@
 # tests/tests_api/tests_users/test_log_in_user.py
-import json
-from pathlib import Path
 import pytest
-from jsonschema import validate, ValidationError
 
-from tests.config import TEST_USER_EMAIL, TEST_USER_PASS
-from tests.utils import assert_ok, safe_json, pretty_resp
+from tests.utils import assert_ok, safe_json
+from tests.tests_api.helpers.schema_registry import SchemaValidationError, validate_response
 
-SCHEMA_PATH = Path(__file__).resolve().parents[1] / "schemas" / "login_schema.json"
 
-
-def load_schema(path: Path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def test_log_in_user_schema(api_client):
+def test_log_in_user_schema(api_client, test_user_credentials):
     """
     Happy-path test for POST /users/login with JSON Schema validation.
-    - Requires TEST_USER_EMAIL and TEST_USER_PASS in .env.
+    - Requires TEST_USER_EMAIL and TEST_USER_PASS in .env (or --local-api).
     - Validates the response structure against tests/tests_api/schemas/login_schema.json.
     """
-    email = TEST_USER_EMAIL
-    password = TEST_USER_PASS
+    email, password = test_user_credentials
 
     if not email or not password:
         pytest.skip(
@@ -36,13 +25,11 @@ def test_log_in_user_schema(api_client):
     body = safe_json(resp)
     assert body is not None, "Response body is not valid JSON"
 
-    # load schema and validate
-    schema = load_schema(SCHEMA_PATH)
+    # validate against the precompiled schema
     try:
-        validate(instance=body, schema=schema)
-    except ValidationError as e:
-        # Print helpful debug output and fail the test with the schema error message
-        pretty_resp(resp)
+        validate_response("login", body)
+    except SchemaValidationError as e:
+        # the request/response history is attached to the failure report (see tests/plugins/request_capture.py)
         pytest.fail(f"Response JSON does not match schema: {e.message}\nValidator path: {list(e.path)}\nSchema path: {list(e.schema_path)}")
 
     # extra sanity checks
@@ -0,0 +1,43 @@
+import pytest
+
+from tests.tests_api.clients.response import ApiResponse
+from tests.utils import safe_json, text_or_json
+
+
+class FakeRawResponse:
+    """Minimal stand-in for Playwright's APIResponse that counts body reads."""
+
+    def __init__(self, body: bytes, status: int = 200):
+        self._body = body
+        self.status = status
+        self.status_text = "OK"
+        self.url = "http://local/contacts"
+        self.headers = {"content-type": "application/json"}
+        self.body_reads = 0
+
+    def body(self) -> bytes:
+        self.body_reads += 1
+        return self._body
+
+
+def test_body_is_read_and_parsed_once():
+    raw = FakeRawResponse(b'[{"_id": "1"}]')
+    resp = ApiResponse(raw)
+
+    first = resp.json()
+    assert resp.json() is first
+    assert safe_json(resp) is first
+    assert '"_id": "1"' in text_or_json(resp)
+    assert resp.text() == '[{"_id": "1"}]'
+    assert raw.body_reads == 1
+
+
+def test_invalid_json_error_is_cached():
+    raw = FakeRawResponse(b"Contact deleted")
+    resp = ApiResponse(raw)
+
+    with pytest.raises(ValueError):
+        resp.json()
+    assert safe_json(resp) is None
+    assert text_or_json(resp) == "Contact deleted"
+    assert raw.body_reads == 1
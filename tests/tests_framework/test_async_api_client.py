@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+
+from tests.tests_api.clients.async_api_client import AsyncApiClient, LazyAsyncRequestContext
+from tests.tests_api.helpers.async_loop import LoopThread
+
+
+class FakeResponse:
+    def __init__(self, status, url, body=b""):
+        self.status = status
+        self.status_text = ""
+        self.url = url
+        self.headers = {"content-type": "application/json"}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+    async def json(self):
+        return json.loads(self._body)
+
+
+class SlowContext:
+    """
+    Async request context stand-in: later requests answer sooner (so completion order
+    differs from submission order), "/contacts/boom" raises, and the peak number of
+    concurrent fetches is recorded.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.sent = []
+
+    async def fetch(self, path, method="GET", headers=None, data=None, **kwargs):
+        self.sent.append((method, path, headers, data))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.02 / len(self.sent))
+            if path.endswith("/boom"):
+                raise ConnectionError("connection reset")
+            return FakeResponse(201 if method == "POST" else 200, path, data or b"{}")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+def test_batches_keep_input_order_and_respect_the_concurrency_limit(loop):
+    ctx = SlowContext()
+    client = AsyncApiClient(ctx, max_concurrency=3)
+
+    responses = loop.run(client.create_contacts("t", [{"firstName": f"F{i}"} for i in range(10)]))
+    assert [loop.run(r.json())["firstName"] for r in responses] == [f"F{i}" for i in range(10)]
+    assert ctx.peak == 3
+
+    method, path, headers, _ = ctx.sent[0]
+    assert (method, path) == ("POST", "/contacts")
+    assert headers["Authorization"] == "Bearer t" and headers["Content-Type"] == "application/json"
+
+
+def test_get_batches_raise_the_first_error_by_default(loop):
+    client = AsyncApiClient(SlowContext())
+    with pytest.raises(ConnectionError):
+        loop.run(client.get_contacts("t", ["a", "boom", "c"]))
+
+    results = loop.run(client.get_contacts("t", ["a", "boom", "c"], return_exceptions=True))
+    assert [type(r).__name__ for r in results] == ["FakeResponse", "ConnectionError", "FakeResponse"]
+
+
+def test_delete_batches_return_errors_in_place(loop):
+    ctx = SlowContext()
+    results = loop.run(AsyncApiClient(ctx).delete_contacts("t", ["a", "boom", "c"]))
+
+    assert [r.url if not isinstance(r, Exception) else "error" for r in results] == ["/contacts/a", "error", "/contacts/c"]
+    assert sorted(path for _, path, _, _ in ctx.sent) == ["/contacts/a", "/contacts/boom", "/contacts/c"]  # one failure does not stop the rest
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncApiClient(SlowContext(), max_concurrency=0)
+
+
+def test_lazy_context_opens_once_on_the_first_request(loop):
+    opened, closed = [], []
+
+    async def open_context():
+        opened.append(1)
+        await asyncio.sleep(0.01)  # concurrent first requests must not open a second context
+
+        async def close():
+            closed.append(1)
+
+        return SlowContext(), close
+
+    ctx = LazyAsyncRequestContext(open_context)
+    loop.run(ctx.dispose())
+    assert not ctx.opened and opened == [] and closed == []  # never used: nothing started
+
+    client = AsyncApiClient(ctx)
+    assert [r.status for r in loop.run(client.get_contacts("t", ["a", "b", "c"]))] == [200, 200, 200]
+    assert ctx.opened and opened == [1]
+
+    loop.run(ctx.dispose())
+    loop.run(ctx.dispose())
+    assert not ctx.opened and closed == [1]
@@ -0,0 +1,23 @@
+from tests.bench.suite import BENCHMARKS, compare, load_baseline, main, run, save_baseline
+
+
+def test_every_benchmark_runs_against_the_fake_context():
+    results = run(quick=True)
+    assert set(results) == set(BENCHMARKS)
+    assert all(us > 0 for us in results.values())
+
+
+def test_regressions_are_judged_against_the_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, {"a": 10.0, "b": 10.0})
+    baseline = load_baseline(path)
+
+    assert compare({"a": 11.9, "b": 12.1, "new": 99.0}, baseline, max_regression=20) == ["b"]
+    assert load_baseline(tmp_path / "missing.json") == {}
+
+
+def test_cli_exits_non_zero_on_regression(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, {"utils.safe_json": 1e-6})
+    assert main(["-k", "safe_json", "--repeat", "1", "--baseline", str(path)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.cassette import Cassette, CassetteMiss, RecordingContext, ReplayContext, request_key
+
+
+class FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self.status_text = "OK"
+        self.url = "http://local"
+        self.headers = {"content-type": "application/json", "content-length": str(len(body))}
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeContext:
+    """Echoes the request back so every response is distinguishable."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def fetch(self, path, method="GET", params=None, data=None, **kwargs):
+        self.calls += 1
+        return FakeResponse(200, f'{{"call": {self.calls}, "path": "{path}"}}'.encode())
+
+    def dispose(self):
+        pass
+
+
+def _record(path):
+    cassette = Cassette(path, "record")
+    client = ApiClient(RecordingContext(FakeContext(), cassette))
+    client.get("/contacts", params={"page": 1, "limit": 10})
+    client.post("/contacts", json={"firstName": "A"})
+    client.get("/contacts/abc")
+    client.get("/contacts/abc")
+    cassette.close()
+
+
+@pytest.mark.parametrize("drop_index", [False, True])
+def test_replay_serves_recorded_responses_in_order(tmp_path, drop_index):
+    path = tmp_path / "api.cassette"
+    _record(path)
+    if drop_index:
+        (tmp_path / "api.cassette.idx").unlink()
+
+    cassette = Cassette(path, "replay")
+    client = ApiClient(ReplayContext(cassette))
+    # query param order does not matter
+    assert client.get("/contacts", params={"limit": 10, "page": 1}).json()["call"] == 1
+    assert client.post("/contacts", json={"firstName": "A"}).json()["call"] == 2
+    assert client.get("/contacts/abc").json()["call"] == 3
+    assert client.get("/contacts/abc").json()["call"] == 4
+    assert cassette.mismatch_report() == ""
+    cassette.close()
+
+
+def test_replay_reports_mismatches(tmp_path):
+    path = tmp_path / "api.cassette"
+    _record(path)
+
+    cassette = Cassette(path, "replay")
+    client = ApiClient(ReplayContext(cassette))
+    with pytest.raises(CassetteMiss):
+        client.post("/contacts", json={"firstName": "B"})
+
+    report = cassette.mismatch_report()
+    assert "POST /contacts" in report and "no recording" in report
+    assert "were never requested" in report
+    cassette.close()
+
+
+def test_json_bodies_get_the_same_key_however_they_are_spelled():
+    body = {"b": [1, {"d": 2, "c": None}], "a": "é"}
+    spellings = [
+        body,
+        json.dumps(body),
+        json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(),
+        b'{ "a" : "\\u00e9", "b" : [1, {"c": null, "d": 2}] }',
+    ]
+    assert len({request_key("POST", "/contacts", data=s) for s in spellings}) == 1
+    assert request_key("POST", "/contacts", data={"a": 1}) != request_key("POST", "/contacts", data={"a": 2})
+    assert request_key("POST", "/upload", data=b"{not json") == request_key("POST", "/upload", data="{not json")
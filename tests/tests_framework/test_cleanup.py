@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import pytest
+
+from tests.factories import RUN_TAG_PREFIX, current_run_id
+from tests.tests_api.helpers.async_loop import LoopThread
+from tests.tests_api.helpers.cleanup import CleanupQueue, PendingStore
+
+
+class FakeResponse:
+    def __init__(self, status, body=None):
+        self.status = status
+        self._body = body
+
+    async def json(self):
+        return self._body
+
+
+class FakeContactsClient:
+    """Async client stand-in holding contacts in a dict."""
+
+    def __init__(self, contacts=()):
+        self.contacts = {c["_id"]: c for c in contacts}
+        self.deleted = []
+
+    async def delete(self, path, token=None):
+        cid = path.rsplit("/", 1)[-1]
+        self.deleted.append(cid)
+        return FakeResponse(200 if self.contacts.pop(cid, None) else 404)
+
+    async def delete_contacts(self, token, ids):
+        return [await self.delete(f"/contacts/{cid}", token) for cid in ids]
+
+    async def get(self, path, token=None, params=None):
+        page, limit = params["page"], params["limit"]
+        items = list(self.contacts.values())[(page - 1) * limit:page * limit]
+        return FakeResponse(200, items)
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+def test_release_deletes_in_background_and_drain_deletes_the_rest(loop, tmp_path):
+    client = FakeContactsClient([{"_id": "a"}, {"_id": "b"}, {"_id": "c"}])
+    store = PendingStore(tmp_path, account="acct", run_id="run1")
+    queue = CleanupQueue(loop, client, "token", store=store)
+
+    for cid in ("a", "b", "c"):
+        queue.register(cid)
+    queue.flush()
+    assert json.loads(store.path.read_text())["ids"] == ["a", "b", "c"]
+
+    queue.release("b")
+    assert queue.pending_ids == ["a", "c"]
+    assert queue.drain() == 0
+    assert sorted(client.deleted) == ["a", "b", "c"]
+    assert not store.path.exists()
+
+
+def test_sweep_deletes_leftover_ids_and_old_tagged_contacts(loop, tmp_path):
+    current = current_run_id()
+    client = FakeContactsClient(
+        [
+            {"_id": "crashed"},
+            {"_id": "old", "street2": RUN_TAG_PREFIX + "20000101T000000-aaaaaa"},
+            {"_id": "mine", "street2": RUN_TAG_PREFIX + current},
+            {"_id": "seeded", "street2": RUN_TAG_PREFIX + "seed-1"},
+            {"_id": "user", "street2": "Apartment A"},
+        ]
+    )
+    PendingStore(tmp_path, account="acct", run_id="crashed-run").save(["crashed"])
+    PendingStore(tmp_path, account="other", run_id="crashed-run", worker="gw1").save(["not-ours"])
+
+    queue = CleanupQueue(loop, client, "token", store=PendingStore(tmp_path, account="acct"))
+    assert queue.sweep(scan=True, min_age_s=3600) == 2
+
+    assert set(client.contacts) == {"mine", "seeded", "user"}
+    remaining = [p.name for p in tmp_path.iterdir()]
+    assert remaining == ["pending-crashed-run-gw1.json"]
+
+
+class CountingStore(PendingStore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.saves = 0
+
+    def save(self, ids):
+        self.saves += 1
+        super().save(ids)
+
+
+def test_finished_deletes_leave_the_queue_and_saves_are_batched(loop, tmp_path):
+    client = FakeContactsClient([{"_id": f"c{i}"} for i in range(500)])
+    store = CountingStore(tmp_path, account="acct", run_id="run1")
+    queue = CleanupQueue(loop, client, "token", store=store, persist_interval=3600)
+
+    for i in range(500):
+        queue.register(f"c{i}")
+        queue.release(f"c{i}")
+    loop.run(asyncio.sleep(0))  # let the last done-callbacks run
+
+    assert queue._in_flight == {} and queue.deleted == 500
+    assert store.saves == 1  # only the first call inside the interval wrote
+    queue.flush()
+    assert store.saves == 2 and not store.path.exists()  # nothing left to persist
+    assert queue.drain() == 0 and queue.deleted == 500
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from tests.factories import generate_contact_payloads
+from tests.tests_api.clients import codec
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.cassette import request_key
+
+
+class FakeResponse:
+    status = 200
+    status_text = "OK"
+    url = ""
+    headers = {}
+
+    def __init__(self, body):
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class EchoContext:
+    """Request context stand-in that records what is sent and echoes the body back."""
+
+    def __init__(self):
+        self.sent = []
+
+    def fetch(self, url, method="GET", headers=None, data=None, **kwargs):
+        self.sent.append((headers, data))
+        return FakeResponse(data or b"null")
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_codec(request):
+    if request.param == "orjson" and codec.ORJSON is None:
+        pytest.skip("orjson is not installed")
+    yield codec.use_codec(request.param)
+    codec.use_codec("auto")
+
+
+def test_bodies_are_sent_as_bytes_and_parsed_back(json_codec):
+    ctx = EchoContext()
+    resp = ApiClient(ctx).post("/contacts", token="t", json={"firstName": "Zoë", "n": [1, 2]})
+
+    headers, data = ctx.sent[0]
+    assert isinstance(data, bytes) and headers["Content-Type"] == "application/json"
+    assert resp.json() == {"firstName": "Zoë", "n": [1, 2]}
+
+
+def test_pre_serialized_bodies_pass_through(json_codec):
+    ctx = EchoContext()
+    body = generate_contact_payloads(1, seed=1, as_bytes=True)[0]
+    ApiClient(ctx).put("/contacts/1", token="t", json=body)
+    assert ctx.sent[0][1] is body
+
+
+def test_cassette_keys_do_not_depend_on_the_codec():
+    payload = {"b": 1, "a": "x"}
+    keys = {request_key("POST", "/contacts", data=codec.STDLIB.dumps(payload))}
+    if codec.ORJSON is not None:
+        keys.add(request_key("POST", "/contacts", data=codec.ORJSON.dumps(payload)))
+    keys.add(request_key("POST", "/contacts", data=json.dumps(payload)))  # as recorded before the codec layer
+    assert len(keys) == 1
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        codec.use_codec("simdjson")
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.async_api_client import AsyncApiClient
+from tests.tests_api.clients.concurrency import AdaptiveConcurrency, retry_after_seconds
+from tests.tests_api.helpers.async_loop import LoopThread
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.status_text = ""
+        self.url = "http://local/contacts"
+        self.headers = headers or {}
+        self.disposed = False
+
+    def body(self):
+        return b"{}"
+
+    def dispose(self):
+        self.disposed = True
+
+
+class ScriptedContext:
+    """Answers fetch() with the given statuses in order, then 200s."""
+
+    def __init__(self, *statuses, headers=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.calls = []
+
+    def fetch(self, path, method="GET", **kwargs):
+        self.calls.append(method)
+        status = self.statuses.pop(0) if self.statuses else 200
+        return FakeResponse(status, self.headers if status >= 400 else {})
+
+
+def test_limit_grows_additively_and_halves_once_per_window():
+    limiter = AdaptiveConcurrency(initial=4, max_limit=8)
+    for _ in range(8):
+        limiter.release(limiter.acquire(), 200)
+    assert limiter.limit == 5
+
+    slots = [limiter.acquire() for _ in range(5)]
+    for slot in slots:
+        limiter.release(slot, 503)  # all sent under the same window: one cut only
+
+    metrics = limiter.metrics()
+    assert limiter.limit == 2
+    assert metrics["throttled"] == 5 and metrics["limit_cuts"] == 1
+
+
+def test_acquire_blocks_at_the_limit():
+    limiter = AdaptiveConcurrency(initial=1, max_limit=1)
+    slot = limiter.acquire()
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.05)
+
+    threading.Timer(0.05, limiter.release, args=(slot, 200)).start()
+    limiter.release(limiter.acquire(timeout=2), 200)
+    assert limiter.metrics()["peak_in_flight"] == 1
+
+
+def test_retry_after_pauses_new_requests():
+    limiter = AdaptiveConcurrency(initial=4)
+    limiter.release(limiter.acquire(), 429, {"retry-after": "1"})
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.1)
+    assert retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+
+
+def test_client_retries_only_idempotent_methods():
+    limiter = AdaptiveConcurrency(initial=2, backoff_base=0.001, seed=1)
+
+    ctx = ScriptedContext(503, 503)
+    resp = ApiClient(ctx, concurrency=limiter).get("/contacts")
+    assert resp.status == 200 and ctx.calls == ["GET", "GET", "GET"]
+
+    ctx = ScriptedContext(503)
+    resp = ApiClient(ctx, concurrency=limiter).post("/contacts", json={})
+    assert resp.status == 503 and ctx.calls == ["POST"]
+
+    assert limiter.metrics()["retries"] == 2
+    assert limiter.in_flight == 0
+
+
+def test_client_gives_up_after_max_retries():
+    limiter = AdaptiveConcurrency(initial=2, max_retries=1, backoff_base=0.001)
+    ctx = ScriptedContext(503, 503, 503)
+    assert ApiClient(ctx, concurrency=limiter).delete("/contacts/1").status == 503
+    assert len(ctx.calls) == 2
+
+
+def test_async_client_respects_the_adaptive_limit():
+    limiter = AdaptiveConcurrency(initial=2, max_limit=2)
+    peak = 0
+    in_flight = 0
+
+    class AsyncContext:
+        async def fetch(self, path, method="GET", **kwargs):
+            nonlocal peak, in_flight
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FakeResponse(200)
+
+    client = AsyncApiClient(AsyncContext(), max_concurrency=8, concurrency=limiter)
+
+    async def main():
+        started = time.perf_counter()
+        await client.gather(client.get("/contacts") for _ in range(8))
+        return time.perf_counter() - started
+
+    loop = LoopThread()  # Playwright's sync API may own this thread's event loop
+    try:
+        elapsed = loop.run(main())
+    finally:
+        loop.stop()
+    assert peak == 2
+    assert elapsed >= 0.035
+    assert limiter.metrics()["requests"] == 8
@@ -0,0 +1,45 @@
+import pytest
+
+from tests import config
+
+
+@pytest.fixture
+def fresh_settings(monkeypatch):
+    """Drop the cached settings so the next access re-reads the (patched) environment."""
+    monkeypatch.setattr(config, "ROOT", config.ROOT / "no-such-dir")  # keep the real .env out
+    config.get_settings.cache_clear()
+    yield monkeypatch
+    config.get_settings.cache_clear()
+
+
+def test_settings_are_read_once_and_cached(fresh_settings):
+    fresh_settings.setenv("API_BASE_URL", "http://first")
+    settings = config.get_settings()
+    fresh_settings.setenv("API_BASE_URL", "http://second")
+
+    assert config.get_settings() is settings and settings.API_BASE_URL == "http://first"
+
+
+def test_module_attributes_resolve_lazily_through_the_settings(fresh_settings):
+    fresh_settings.setenv("API_MAX_CONCURRENCY", "3")
+    fresh_settings.setenv("LOCAL_API", "yes")
+    from tests.config import API_MAX_CONCURRENCY, LOCAL_API
+
+    assert (API_MAX_CONCURRENCY, LOCAL_API) == (3, True)
+    assert config.API_MAX_CONCURRENCY is config.get_settings().API_MAX_CONCURRENCY
+
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING
+    with pytest.raises(AttributeError):
+        config.has_credentials  # only upper-case names are settings
+
+
+def test_clearing_the_cache_picks_up_overrides(fresh_settings):
+    fresh_settings.delenv("TEST_USER_EMAIL", raising=False)
+    assert config.TEST_USER_EMAIL is None and not config.get_settings().has_credentials
+
+    fresh_settings.setenv("TEST_USER_EMAIL", "qa@example.com")
+    fresh_settings.setenv("TEST_USER_PASS", "pw")
+    assert config.TEST_USER_EMAIL is None  # still the cached snapshot
+    config.get_settings.cache_clear()
+    assert config.TEST_USER_EMAIL == "qa@example.com" and config.get_settings().has_credentials
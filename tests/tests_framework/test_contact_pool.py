@@ -0,0 +1,77 @@
+import itertools
+
+import pytest
+
+from tests.tests_api.helpers.async_loop import LoopThread
+from tests.tests_api.helpers.contact_pool import ContactPool, ContactPoolError
+
+
+class FakeResponse:
+    def __init__(self, status, body=None):
+        self.status = status
+        self._body = body
+
+    async def json(self):
+        return self._body
+
+
+class FakeContactsClient:
+    """Async client stand-in: creates get sequential ids, deletes are recorded."""
+
+    def __init__(self, create_status=201):
+        self.create_status = create_status
+        self._ids = itertools.count(1)
+        self.create_batches = []
+        self.deleted = []
+
+    async def create_contacts(self, token, payloads, return_exceptions=False):
+        self.create_batches.append(len(payloads))
+        return [FakeResponse(self.create_status, {"_id": f"c{next(self._ids)}"}) for _ in payloads]
+
+    async def delete_contacts(self, token, ids, return_exceptions=True):
+        self.deleted.extend(ids)
+        return [FakeResponse(404 if cid == "gone" else 200) for cid in ids]
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+def test_leases_share_one_bulk_created_batch_round_robin(loop):
+    client = FakeContactsClient()
+    pool = ContactPool(loop, client, "t", size=3, payloads_factory=lambda n: [{"firstName": "A"}] * n)
+
+    leased = [pool.lease()["id"] for _ in range(5)]
+    assert leased == ["c1", "c2", "c3", "c1", "c2"]
+    assert client.create_batches == [3]  # filled once, in one batch
+
+
+def test_registered_exclusive_contacts_are_never_leased_but_are_deleted(loop):
+    client = FakeContactsClient()
+    pool = ContactPool(loop, client, "t", size=2)
+    pool.fill()
+
+    pool.register("destructive-1")
+    assert {pool.lease()["id"] for _ in range(6)} == {"c1", "c2"}
+
+    assert pool.drain() == 0
+    assert sorted(client.deleted) == ["c1", "c2", "destructive-1"]
+    assert pool.owned_ids == [] and pool.drain() == 0  # nothing is deleted twice
+
+
+def test_already_deleted_contacts_do_not_count_as_failures(loop):
+    client = FakeContactsClient()
+    pool = ContactPool(loop, client, "t", size=1)
+    pool.register("gone")
+    assert pool.drain() == 0 and client.deleted == ["gone"]
+
+
+def test_failed_bulk_creation_makes_leasing_fail(loop):
+    pool = ContactPool(loop, FakeContactsClient(create_status=500), "t", size=2)
+    with pytest.raises(ContactPoolError):
+        pool.lease()
+    with pytest.raises(ValueError):
+        ContactPool(loop, FakeContactsClient(), "t", size=0)
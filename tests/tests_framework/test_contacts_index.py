@@ -0,0 +1,92 @@
+import json
+
+from tests.tests_api.helpers.contacts_index import ContactsIndex
+
+
+class FakeResponse:
+    def __init__(self, status, body=None):
+        self.status = status
+        self._text = json.dumps(body) if body is not None else ""
+
+    def text(self):
+        return self._text
+
+    def json(self):
+        return json.loads(self._text)
+
+
+class FakeContactsApi:
+    """Sync client stand-in; counts list pages and single-contact fetches."""
+
+    def __init__(self, n):
+        self.contacts = {f"id{i}": {"_id": f"id{i}", "email": f"c{i}@example.com"} for i in range(n)}
+        self.list_calls = 0
+        self.get_calls = 0
+
+    def get(self, path, token=None, params=None):
+        if path == "/contacts":
+            self.list_calls += 1
+            page, limit = params["page"], params["limit"]
+            return FakeResponse(200, list(self.contacts.values())[(page - 1) * limit:page * limit])
+        self.get_calls += 1
+        cid = path.rsplit("/", 1)[-1]
+        return FakeResponse(200, self.contacts[cid]) if cid in self.contacts else FakeResponse(404)
+
+
+def record(method, path, status=200):
+    return {"method": method, "raw_path": path, "status": status}
+
+
+def test_lookups_share_one_scan():
+    api = FakeContactsApi(250)
+    index = ContactsIndex(page_size=100)
+
+    assert index.find(api, "t", contact_id="id5")["email"] == "c5@example.com"
+    assert index.find(api, "t", email="c249@example.com")["_id"] == "id249"
+    assert index.find(api, "t", contact_id="missing") is None
+    assert api.list_calls == 3 and api.get_calls == 0
+
+
+def test_observed_writes_refresh_incrementally():
+    api = FakeContactsApi(3)
+    index = ContactsIndex()
+    index.find(api, "t", contact_id="id0")
+
+    del api.contacts["id1"]
+    index(record("DELETE", "/contacts/id1"))
+    assert index.find(api, "t", contact_id="id1") is None
+
+    api.contacts["id2"]["email"] = "changed@example.com"
+    index(record("PATCH", "/contacts/id2"))
+    assert index.find(api, "t", email="changed@example.com")["_id"] == "id2"
+
+    assert api.list_calls == 1 and api.get_calls == 1
+
+
+def test_unseen_create_is_looked_up_in_the_list_not_by_id():
+    api = FakeContactsApi(3)
+    index = ContactsIndex()
+    index.find(api, "t", contact_id="id0")
+
+    api.contacts["new"] = {"_id": "new", "email": "new@example.com"}
+    index(record("POST", "/contacts", status=201))
+    assert index.find(api, "t", contact_id="new") is not None
+    assert api.list_calls == 2 and api.get_calls == 0  # found by re-scanning GET /contacts
+
+    index(record("POST", "/contacts", status=201))  # created, but not listed
+    assert index.find(api, "t", contact_id="unlisted") is None
+    assert api.list_calls == 3 and api.get_calls == 0
+
+
+def test_invalidate_and_verify_go_back_to_the_server():
+    api = FakeContactsApi(3)
+    index = ContactsIndex()
+    index.find(api, "t", contact_id="id0")
+
+    del api.contacts["id0"]  # removed behind the index's back
+    assert index.find(api, "t", contact_id="id0") is not None
+    assert index.find(api, "t", contact_id="id0", verify=True) is None
+
+    index.invalidate()
+    assert index.find(api, "t", contact_id="id1") is not None
+    assert index.stats()["scans"] == 2
@@ -0,0 +1,34 @@
+import json
+
+from tests.factories import generate_contact_payload, generate_contact_payloads
+
+
+def test_generate_contact_payloads_matches_single_payload_shape():
+    """Batch payloads have the same fields as generate_contact_payload()."""
+    single = generate_contact_payload()
+    batch = generate_contact_payloads(50)
+
+    assert len(batch) == 50
+    assert all(set(p) == set(single) for p in batch)
+    assert len({p["email"] for p in batch}) == 50, "Generated emails must be unique"
+
+
+def test_generate_contact_payloads_seed_is_reproducible():
+    assert generate_contact_payloads(20, seed=7) == generate_contact_payloads(20, seed=7)
+    assert generate_contact_payloads(20, seed=7) != generate_contact_payloads(20, seed=8)
+
+
+def test_generate_contact_payloads_namespaces_do_not_collide():
+    gw0 = {p["email"] for p in generate_contact_payloads(100, seed=1, namespace="gw0")}
+    gw1 = {p["email"] for p in generate_contact_payloads(100, seed=1, namespace="gw1")}
+    assert not gw0 & gw1
+
+
+def test_generate_contact_payloads_as_bytes_equals_dicts():
+    """Pre-serialized bodies decode to the same payloads, overrides included (with escaping)."""
+    overrides = {"city": 'Zürich "Altstadt"', "email": "fixed@example.com"}
+    dicts = generate_contact_payloads(10, seed=3, overrides=overrides)
+    bodies = generate_contact_payloads(10, seed=3, overrides=overrides, as_bytes=True)
+
+    assert all(isinstance(b, bytes) for b in bodies)
+    assert [json.loads(b) for b in bodies] == dicts
@@ -0,0 +1,125 @@
+import json
+
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.http_cache import ResponseCache
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"", headers=None):
+        self.status = status
+        self.status_text = ""
+        self.url = ""
+        self.headers = headers or {}
+        self._body = body
+
+    @property
+    def ok(self):
+        return 200 <= self.status <= 299
+
+    def body(self):
+        return self._body
+
+    def text(self):
+        return self._body.decode()
+
+    def json(self):
+        return json.loads(self._body)
+
+
+class FakeContext:
+    """Request context stand-in answering GETs with an ETag and honouring If-None-Match."""
+
+    def __init__(self):
+        self.docs = {}
+        self.sent = []
+
+    def fetch(self, url, method="GET", headers=None, **kwargs):
+        headers = headers or {}
+        self.sent.append((method, url, dict(headers)))
+        if method != "GET":
+            self.docs.pop(url, None)
+            return FakeResponse(200)
+        body = json.dumps(self.docs.get(url, {"url": url})).encode()
+        etag = f'"{len(body)}-{hash(body) & 0xFFFF:x}"'
+        if headers.get("If-None-Match") == etag:
+            return FakeResponse(304, headers={"etag": etag})
+        return FakeResponse(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+
+def test_repeat_get_is_revalidated_and_served_from_cache():
+    ctx = FakeContext()
+    cache = ResponseCache()
+    client = ApiClient(ctx, cache=cache)
+
+    first = client.get("/contacts/1", token="t")
+    second = client.get("/contacts/1", token="t")
+
+    assert second.status == 200 and second.json() == first.json() == {"url": "/contacts/1"}
+    assert "If-None-Match" not in ctx.sent[0][2] and "If-None-Match" in ctx.sent[1][2]
+    assert cache.stats()["hits"] == 1 and cache.stats()["bytes_saved"] == len(first.body())
+    # another user's token is a different entry
+    client.get("/contacts/1", token="other")
+    assert "If-None-Match" not in ctx.sent[2][2]
+
+
+def test_writes_invalidate_the_path_and_its_collections():
+    ctx = FakeContext()
+    cache = ResponseCache()
+    client = ApiClient(ctx, cache=cache)
+    for path in ("/contacts", "/contacts/1", "/contacts/2", "/users/me"):
+        client.get(path, token="t")
+    client.get("/contacts", token="t", params={"page": 2})
+
+    client.patch("/contacts/1", token="t", json={"firstName": "x"})
+
+    assert sorted(k[0] + ("?" + k[1] if k[1] else "") for k in cache._entries) == ["/contacts/2", "/users/me"]
+
+
+def test_lru_eviction_keeps_bodies_within_budget():
+    cache = ResponseCache(max_bytes=100)
+    for i in range(5):
+        cache.store(cache.key(f"/doc/{i}"), FakeResponse(200, b"x" * 40, {"ETag": f'"{i}"'}))
+    cache.not_modified(cache.key("/doc/3"))  # touch: 4 is now the oldest
+    cache.store(cache.key("/doc/5"), FakeResponse(200, b"x" * 40, {"ETag": '"5"'}))
+
+    assert cache.size_bytes <= 100
+    assert [k[0] for k in cache._entries] == ["/doc/3", "/doc/5"]
+    assert cache.stats()["evictions"] == 4
+    # responses without a validator are not kept
+    cache.store(cache.key("/plain"), FakeResponse(200, b"{}"))
+    assert cache.conditional_headers(cache.key("/plain")) == {}
+
+
+def test_a_304_for_an_evicted_entry_is_asked_again_without_validators():
+    ctx = FakeContext()
+    cache = ResponseCache()
+    client = ApiClient(ctx, cache=cache)
+    client.get("/contacts/1", token="t")
+
+    fetch = ctx.fetch
+
+    def evicting_fetch(url, method="GET", headers=None, **kwargs):
+        if "If-None-Match" in (headers or {}):
+            cache.invalidate()  # e.g. another thread's writes evicted it while the request was out
+        return fetch(url, method=method, headers=headers, **kwargs)
+
+    ctx.fetch = evicting_fetch
+    resp = client.get("/contacts/1", token="t")
+
+    assert resp.status == 200 and resp.json() == {"url": "/contacts/1"}
+    assert "If-None-Match" in ctx.sent[1][2] and "If-None-Match" not in ctx.sent[2][2]
+    assert len(cache) == 1  # stored again
+
+
+def test_caller_validators_are_sent_unchanged_and_bypass_the_cache():
+    ctx = FakeContext()
+    cache = ResponseCache()
+    client = ApiClient(ctx, cache=cache)
+    etag = client.get("/contacts/1", token="t").headers["ETag"]
+
+    resp = client.get("/contacts/1", token="t", headers={"If-None-Match": '"stale"'})
+    assert resp.status == 200 and ctx.sent[-1][2]["If-None-Match"] == '"stale"'
+
+    resp = client.get("/contacts/1", token="t", headers={"If-None-Match": etag})
+    assert resp.status == 304 and ctx.sent[-1][2] == {"If-None-Match": etag, "Authorization": "Bearer t"}
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,49 @@
+import pytest
+
+from tests.plugins.latency import over_budget, pytest_collection_modifyitems, summarize
+
+
+def test_summarize_uses_nearest_rank_percentiles():
+    summary = summarize([float(ms) for ms in range(100, 0, -1)])
+    assert summary["samples"] == 100
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"], summary["max_ms"]) == (50, 95, 99, 100)
+
+
+def test_over_budget_lists_only_exceeded_percentiles():
+    summary = summarize([10.0] * 18 + [400.0, 500.0])
+    assert over_budget(summary, {"p50_ms": 20, "p95_ms": 300, "p99_ms": None}) == ["p95 400.0 ms > 300 ms"]
+    assert over_budget(summary, {"p95_ms": 400}) == []
+
+
+class FakeItem:
+    def __init__(self, name, latency=False):
+        self.name = name
+        self.marker = pytest.mark.latency(endpoint="/x", p95_ms=1).mark if latency else None
+
+    def get_closest_marker(self, name):
+        return self.marker if name == "latency" else None
+
+
+class FakeConfig:
+    def __init__(self, **options):
+        self.options = {"--latency": False, "-m": "", **options}
+        self.deselected = []
+        self.hook = self
+
+    def getoption(self, name):
+        return self.options[name]
+
+    def pytest_deselected(self, items):
+        self.deselected.extend(items)
+
+
+@pytest.mark.parametrize(
+    "options, kept",
+    [({}, ["plain"]), ({"--latency": True}, ["plain", "probe"]), ({"-m": "latency"}, ["plain", "probe"])],
+)
+def test_latency_tests_only_run_when_asked_for(options, kept):
+    config = FakeConfig(**options)
+    items = [FakeItem("plain"), FakeItem("probe", latency=True)]
+    pytest_collection_modifyitems(config, items)
+    assert [item.name for item in items] == kept
+    assert len(config.deselected) == 2 - len(kept)
@@ -0,0 +1,163 @@
+import asyncio
+import inspect
+import json
+
+import pytest
+
+from tests.tests_api.helpers.async_loop import LoopThread
+from tests.tests_api.helpers.list_search import (
+    _aiter_pages,
+    find_in_contacts_list,
+    find_many_in_contacts_list,
+    iter_contacts,
+)
+
+
+class FakeResponse:
+    def __init__(self, status, text):
+        self.status = status
+        self._text = text
+
+    def json(self):
+        return json.loads(self._text)
+
+
+class FakeContactsApi:
+    """Sync client stand-in serving `n` contacts page by page; counts list requests."""
+
+    def __init__(self, n):
+        self.contacts = [{"_id": f"id{i}", "email": f"c{i}@example.com"} for i in range(n)]
+        self.requests = 0
+
+    def page(self, params):
+        self.requests += 1
+        page, limit = params["page"], params["limit"]
+        return FakeResponse(200, json.dumps(self.contacts[(page - 1) * limit:page * limit]))
+
+    def get(self, path, token=None, params=None):
+        return self.page(params)
+
+
+class AsyncFakeResponse(FakeResponse):
+    async def json(self):
+        return json.loads(self._text)
+
+
+class AsyncFakeContactsApi(FakeContactsApi):
+    """
+    Async flavour. Pages after `stall_after` never answer; the peak number of pages in
+    flight and the pages cancelled while waiting are recorded.
+    """
+
+    def __init__(self, n, stall_after=None):
+        super().__init__(n)
+        self.stall_after = stall_after
+        self.in_flight = self.peak = 0
+        self.cancelled = []
+
+    async def get(self, path, token=None, params=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if self.stall_after is not None and params["page"] > self.stall_after:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    self.cancelled.append(params["page"])
+                    raise
+            resp = self.page(params)
+            return AsyncFakeResponse(resp.status, resp._text)
+        finally:
+            self.in_flight -= 1
+
+
+def legacy_find(api_client, auth_token, created_id=None, email=None, page_size=100, max_pages=10):
+    """find_in_contacts_list before streaming: whole pages through resp.json()."""
+    for page in range(1, max_pages + 1):
+        items = api_client.get("/contacts", token=auth_token, params={"limit": page_size, "page": page}).json()
+        for item in items:
+            if created_id and created_id in (item.get("_id"), item.get("id"), item.get("contactId")):
+                return item
+            if email and item.get("email") == email:
+                return item
+        if len(items) < page_size:
+            break
+    return None
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+def test_errors_and_non_list_bodies_end_the_scan():
+    api = FakeContactsApi(50)
+    for status, text in [(500, "[]"), (200, "<html>"), (200, '{"error": "x"}')]:
+        api.page = lambda params, status=status, text=text: FakeResponse(status, text)
+        assert list(iter_contacts(api, "t")) == []
+
+
+def test_page_edges():
+    api = FakeContactsApi(200)
+    assert find_in_contacts_list(api, "t", created_id="id99")["_id"] == "id99" and api.requests == 1
+    assert find_in_contacts_list(api, "t", created_id="id100")["_id"] == "id100" and api.requests == 3
+
+    # an exactly full last page needs one more (empty) page to know the list ended
+    api.requests = 0
+    assert len(list(iter_contacts(api, "t"))) == 200 and api.requests == 3
+
+
+def test_aiter_pages_yields_pages_in_order_with_bounded_prefetch(loop):
+    api = AsyncFakeContactsApi(250)
+
+    async def collect():
+        return [
+            (status, len(items))
+            async for status, items in _aiter_pages(api, "t", None, "page", "limit", 100, 5, 3)
+        ]
+
+    assert loop.run(collect()) == [(200, 100), (200, 100), (200, 50), (200, 0), (200, 0)]
+    assert api.requests == 5 and api.peak == 3
+
+
+def test_stopping_early_cancels_prefetched_pages(loop):
+    api = AsyncFakeContactsApi(1000, stall_after=1)
+    found = find_in_contacts_list(api, "t", created_id="id5", prefetch=4, async_loop=loop)
+    assert found["_id"] == "id5"
+    assert sorted(api.cancelled) == [2, 3, 4] and api.in_flight == 0
+
+
+def test_find_many_stops_once_everything_is_found():
+    api = FakeContactsApi(500)
+    found = find_many_in_contacts_list(api, "t", ids=["id3", "id150"], emails=["c42@example.com", "nobody@example.com"])
+    assert sorted(found) == ["c42@example.com", "id150", "id3"]
+    assert api.requests == 6  # a missing key scans to the (empty) end of the list
+
+    api.requests = 0
+    assert sorted(find_many_in_contacts_list(api, "t", ids=["id3", "id150"])) == ["id150", "id3"] and api.requests == 2
+
+
+def test_find_in_contacts_list_keeps_its_signature_and_results():
+    legacy = ["api_client", "auth_token", "created_id", "email", "params", "page_param", "limit_param", "page_size", "max_pages"]
+    parameters = inspect.signature(find_in_contacts_list).parameters
+    assert list(parameters)[:len(legacy)] == legacy
+    assert {n: parameters[n].default for n in ("page_size", "max_pages", "page_param", "limit_param")} == {
+        "page_size": 100, "max_pages": 10, "page_param": "page", "limit_param": "limit",
+    }
+
+    api = FakeContactsApi(450)
+    queries = [
+        {"created_id": "id0"},
+        {"created_id": "id449"},
+        {"email": "c321@example.com"},
+        {"created_id": "missing", "email": "c200@example.com"},
+        {"created_id": "missing"},
+        {"created_id": "id449", "max_pages": 2},
+        {"email": "c60@example.com", "page_size": 25},
+        {},
+    ]
+    for query in queries:
+        assert find_in_contacts_list(api, "t", **query) == legacy_find(api, "t", **query), query
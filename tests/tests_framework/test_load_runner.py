@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import pytest
+
+from tests.load.runner import LoadRunner
+from tests.tests_api.helpers.async_loop import LoopThread
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+class StalledClient:
+    """AsyncApiClient stand-in whose requests never finish within a test."""
+
+    max_concurrency = 3
+
+    def __init__(self):
+        self.started = 0
+
+    async def _stall(self, *args, **kwargs):
+        self.started += 1
+        await asyncio.sleep(60)
+
+    get = post = patch = delete = _stall
+
+    async def delete_contacts(self, token, ids):
+        return []
+
+
+def test_open_loop_caps_outstanding_scenarios_and_ends_at_the_deadline(loop):
+    client = StalledClient()
+    runner = LoadRunner(client, "token", mix={"list": 1}, seed=1)
+
+    t0 = time.perf_counter()
+    stats = loop.run(runner.run(0.3, rate=100))
+    assert time.perf_counter() - t0 < 2.0
+
+    assert client.started == 3  # the client's max_concurrency is the default cap
+    assert stats.cancelled == 3 and stats.dropped > 20
+    total = stats.summary()["total"]
+    assert total["requests"] == 0  # cancelled scenarios are not recorded
+    assert total["dropped"] == stats.dropped and total["cancelled"] == 3
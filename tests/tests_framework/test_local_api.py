@@ -0,0 +1,122 @@
+import base64
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from tests.tests_api.stub.local_api import LocalContactListApi
+
+EMAIL, PASSWORD = "me@example.com", "secret123"
+
+
+def call(server, method, path, token=None, body=None, headers=None):
+    """One HTTP request to `server`; returns (status, headers, parsed body or text or None)."""
+    headers = dict(headers or {})
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    req = urllib.request.Request(server.url + path, data=data, method=method, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            status, resp_headers, raw = resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as e:
+        status, resp_headers, raw = e.code, e.headers, e.read()
+    if not raw:
+        return status, resp_headers, None
+    if resp_headers.get("Content-Type", "").startswith("application/json"):
+        return status, resp_headers, json.loads(raw)
+    return status, resp_headers, raw.decode()
+
+
+def login(server, email=EMAIL, password=PASSWORD):
+    status, _, body = call(server, "POST", "/users/login", body={"email": email, "password": password})
+    return body["token"] if status == 200 else None
+
+
+@pytest.fixture(scope="module")
+def running_api():
+    with LocalContactListApi(seed=1) as api:
+        yield api
+
+
+@pytest.fixture
+def server(running_api):
+    running_api.reset()
+    running_api.error_rate, running_api.token_ttl = 0.0, 3600
+    running_api.add_user(EMAIL, PASSWORD)
+    return running_api
+
+
+def test_contacts_are_paginated_by_page_and_limit(server):
+    token = login(server)
+    ids = [call(server, "POST", "/contacts", token, {"firstName": f"F{i}", "lastName": "L"})[2]["_id"] for i in range(5)]
+
+    assert [c["_id"] for c in call(server, "GET", "/contacts?page=2&limit=2", token)[2]] == ids[2:4]
+    assert [c["_id"] for c in call(server, "GET", "/contacts?page=3&limit=2", token)[2]] == ids[4:]
+    assert call(server, "GET", "/contacts?page=9&limit=2", token)[2] == []
+    assert [c["_id"] for c in call(server, "GET", "/contacts", token)[2]] == ids  # no limit: everything
+    assert call(server, "GET", "/contacts?page=x&limit=2", token)[0] == 400
+
+
+def test_login_issues_signed_expiring_jwts(server):
+    assert login(server, password="wrong-password") is None
+
+    token = login(server)
+    header, payload, signature = token.split(".")
+    claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    assert claims["exp"] - claims["iat"] == server.token_ttl
+    status, _, me = call(server, "GET", "/users/me", token)
+    assert status == 200 and me["email"] == EMAIL and "password" not in me
+
+    assert call(server, "GET", "/users/me", f"{header}.{payload}.{signature[::-1]}")[0] == 401
+    assert call(server, "GET", "/contacts")[0] == 401
+
+    assert call(server, "POST", "/users/logout", token)[0] == 200
+    assert call(server, "GET", "/users/me", token)[0] == 401  # revoked
+
+    server.token_ttl = -10
+    assert call(server, "GET", "/users/me", login(server))[0] == 401  # expired
+
+
+def test_get_sends_a_weak_etag_and_answers_a_match_with_304(server):
+    token = login(server)
+    call(server, "POST", "/contacts", token, {"firstName": "A", "lastName": "B"})
+
+    status, headers, body = call(server, "GET", "/contacts", token)
+    etag = headers["ETag"]
+    assert status == 200 and etag.startswith('W/"') and len(body) == 1
+
+    status, _, body = call(server, "GET", "/contacts", token, headers={"If-None-Match": etag})
+    assert status == 304 and body is None and server.not_modified == 1
+
+    # a change to the list changes the ETag, so the old one no longer matches
+    call(server, "POST", "/contacts", token, {"firstName": "C", "lastName": "D"})
+    status, headers, body = call(server, "GET", "/contacts", token, headers={"If-None-Match": etag})
+    assert status == 200 and headers["ETag"] != etag and len(body) == 2
+
+
+def test_error_rate_injects_failures(server):
+    server.error_rate = 1.0
+    status, headers, body = call(server, "GET", "/users/me")
+    assert status == 503 and headers["Retry-After"] == "1" and body == {"error": "Injected failure"}
+    assert server.injected_errors == 1 and server.request_count == 1
+
+    with pytest.raises(ValueError):
+        LocalContactListApi(error_rate=1.5)
+
+
+def test_seed_makes_failures_and_ids_reproducible():
+    def run(seed):
+        api = LocalContactListApi(error_rate=0.5, seed=seed)  # handle() needs no running server
+        user = api.add_user(EMAIL, PASSWORD)
+        statuses = [api.handle("GET", "/users/me", {}, b"")[0] for _ in range(20)]
+        return user["_id"], statuses
+
+    first, second, other = run(7), run(7), run(8)
+    assert first == second
+    assert set(first[1]) == {401, 503}  # some requests fail, the rest reach the (unauthenticated) handler
+    assert other != first
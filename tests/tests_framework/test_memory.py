@@ -0,0 +1,115 @@
+import pytest
+
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.async_api_client import AsyncApiClient
+from tests.tests_api.clients.response import AsyncReleasedResponse
+from tests.tests_api.helpers import memory
+from tests.tests_api.helpers.async_loop import LoopThread
+from tests.tests_api.helpers.memory import MemorySampler
+
+
+class FakeResponse:
+    status = 200
+    status_text = "OK"
+    url = "http://api/contacts"
+    headers = {"content-type": "application/json"}
+
+    def __init__(self):
+        self.reads = 0
+        self.disposed = False
+
+    def body(self):
+        if self.disposed:
+            raise RuntimeError("Response has been disposed")
+        self.reads += 1
+        return b'{"_id": "1"}'
+
+    def dispose(self):
+        self.disposed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.responses = []
+
+    def fetch(self, url, method="GET", headers=None, **kwargs):
+        self.responses.append(FakeResponse())
+        return self.responses[-1]
+
+
+class AsyncFakeResponse(FakeResponse):
+    async def body(self):
+        return FakeResponse.body(self)
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class AsyncFakeContext(FakeContext):
+    async def fetch(self, url, method="GET", headers=None, **kwargs):
+        self.responses.append(AsyncFakeResponse())
+        return self.responses[-1]
+
+
+@pytest.fixture
+def loop():
+    loop = LoopThread()
+    yield loop
+    loop.stop()
+
+
+def test_released_responses_are_disposed_and_stay_readable():
+    ctx = FakeContext()
+    client = ApiClient(ctx, release_bodies=True)
+
+    resp = client.get("/contacts")
+    assert resp.released and ctx.responses[0].disposed and ctx.responses[0].reads == 1
+    assert resp.json() == {"_id": "1"} and resp.text() == '{"_id": "1"}'
+    resp.release()
+    resp.dispose()  # both idempotent
+
+    kept = client.get("/contacts", release=False)
+    assert not kept.released and not ctx.responses[1].disposed and ctx.responses[1].reads == 0
+
+
+def test_async_client_returns_released_copies(loop):
+    ctx = AsyncFakeContext()
+    client = AsyncApiClient(ctx, release_bodies=True)
+
+    resp = loop.run(client.post("/contacts", json={"firstName": "A"}))
+    assert isinstance(resp, AsyncReleasedResponse) and resp.ok
+    assert ctx.responses[0].disposed
+    assert loop.run(resp.json()) == {"_id": "1"}
+
+    raw = loop.run(client.get("/contacts/1", release=False))
+    assert raw is ctx.responses[1] and not raw.disposed
+
+
+def _record(method, path):
+    return {"method": method, "path": path}
+
+
+def test_sampler_attributes_growth_to_the_endpoints_of_each_window(monkeypatch):
+    rss = iter([1000, 5000, 5000])
+    monkeypatch.setattr(memory, "rss_bytes", lambda pid="self": next(rss))
+    monkeypatch.setattr(memory, "children_rss_bytes", lambda: None)
+    sampler = MemorySampler(every=4, trace=False).start()
+
+    for _ in range(4):
+        sampler(_record("GET", "/contacts"))  # warm-up: not attributed
+    for _ in range(3):
+        sampler(_record("POST", "/contacts"))  # +4000 bytes in this window, 3/4 of it to POST
+    sampler(_record("GET", "/contacts"))
+    sampler(_record("GET", "/contacts"))
+    sampler(_record("GET", "/contacts"))
+    sampler.stop()  # last, partial window: no growth
+    sampler.stop()
+    sampler(_record("GET", "/contacts"))  # after stop: ignored
+
+    assert [s["requests"] for s in sampler.samples] == [4, 8, 10]
+    growth = sampler.endpoint_growth()
+    assert growth["POST /contacts"]["growth_bytes"]["rss"] == 3000
+    assert growth["GET /contacts"]["requests"] == 3
+    assert growth["GET /contacts"]["growth_per_1k_requests"]["rss"] == 333_333
+    assert growth["GET /contacts"]["growth_bytes"]["children_rss"] == 0
+    assert "POST /contacts" in sampler.format_table()
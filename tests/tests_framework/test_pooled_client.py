@@ -0,0 +1,52 @@
+import threading
+
+from tests.tests_api.clients.pooled_client import PooledApiClient
+
+
+class ThreadBoundResponse:
+    """Fails if its body is read from a thread other than the one that produced it."""
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.status = 200
+        self.status_text = "OK"
+        self.url = "http://local/contacts"
+        self.headers = {}
+
+    def body(self):
+        assert threading.current_thread() is self.owner, "body() called off the owning thread"
+        return b'{"thread": "%s"}' % self.owner.name.encode()
+
+
+class ThreadBoundContext:
+    def __init__(self):
+        self.owner = threading.current_thread()
+
+    def fetch(self, path, **kwargs):
+        assert threading.current_thread() is self.owner, "fetch() called off the owning thread"
+        return ThreadBoundResponse(self.owner)
+
+
+def test_calls_run_on_pool_threads_and_results_are_usable_anywhere():
+    disposed = []
+
+    def factory():
+        return ThreadBoundContext(), lambda: disposed.append(threading.current_thread().name)
+
+    with PooledApiClient(factory, size=3) as pool:
+        futures = [pool.get("/contacts") for _ in range(30)]
+        threads = {f.result().json()["thread"] for f in futures}
+
+    assert threads <= {"api-pool-0", "api-pool-1", "api-pool-2"}
+    assert sorted(disposed) == ["api-pool-0", "api-pool-1", "api-pool-2"]
+
+
+def test_exceptions_are_delivered_through_the_future():
+    class Boom:
+        def fetch(self, path, **kwargs):
+            raise ConnectionError("down")
+
+    with PooledApiClient(lambda: (Boom(), lambda: None), size=1) as pool:
+        error = pool.get("/contacts").exception()
+
+    assert isinstance(error, ConnectionError)
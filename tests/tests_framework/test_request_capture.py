@@ -0,0 +1,65 @@
+import pytest
+
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.clients.capture import RequestCapture
+
+
+class FakeResponse:
+    status_text = ""
+
+    def __init__(self, url, status, body):
+        self.url = url
+        self.status = status
+        self.headers = {"content-type": "application/json"}
+        self._body = body
+        self.reads = 0
+
+    def body(self):
+        self.reads += 1
+        if self._body is None:
+            raise RuntimeError("Response has been disposed")
+        return self._body
+
+
+class FakeContext:
+    def __init__(self):
+        self.responses = []
+
+    def fetch(self, url, method="GET", headers=None, **kwargs):
+        if url == "/down":
+            raise ConnectionError("connection refused")
+        resp = FakeResponse(url, 404 if url == "/missing" else 200, None if url == "/gone" else b'{"n": 1}')
+        self.responses.append(resp)
+        return resp
+
+
+def test_last_exchanges_are_kept_raw_and_formatted_on_demand():
+    ctx = FakeContext()
+    capture = RequestCapture(size=3)
+    client = ApiClient(ctx, capture=capture)
+
+    client.get("/first", token="secret-token")
+    client.post("/contacts", token="secret-token", json={"firstName": "A"})
+    client.get("/gone")
+    client.get("/missing")
+    with pytest.raises(ConnectionError):
+        client.get("/down")
+
+    assert len(capture) == 3
+    assert all(r.reads == 0 for r in ctx.responses)  # nothing read or formatted yet
+
+    text = capture.format()
+    assert "(2 earlier request(s) not kept)" in text
+    assert "/first" not in text and "secret-token" not in text
+    assert "GET /missing" in text and "-> 404" in text and '"n": 1' in text
+    assert "<unavailable: RuntimeError('Response has been disposed')>" in text
+    assert "error: ConnectionError('connection refused')" in text
+
+    capture.clear()
+    assert len(capture) == 0 and capture.format() == ""
+
+
+def test_bodies_are_truncated_when_formatted():
+    capture = RequestCapture(size=1, body_limit=10)
+    ApiClient(FakeContext(), capture=capture).post("/contacts", json={"firstName": "x" * 50})
+    assert "more characters truncated" in capture.format()
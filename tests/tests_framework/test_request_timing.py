@@ -0,0 +1,39 @@
+from tests.plugins.request_timing import RequestTimingRecorder
+from tests.stats import LatencySummary, percentile
+
+
+def _record(path, ms):
+    return {"method": "GET", "path": path, "duration_ms": ms}
+
+
+def test_latency_summary_is_exact_until_the_reservoir_fills_then_bounded():
+    summary = LatencySummary(reservoir=100)
+    for ms in range(1, 101):
+        summary.add(float(ms))
+    assert summary.to_dict()["p50_ms"] == percentile([float(ms) for ms in range(1, 101)], 50) == 50.0
+
+    for ms in range(101, 10_001):
+        summary.add(float(ms))
+    result = summary.to_dict()
+    assert len(summary._sample) == 100
+    assert result["count"] == 10_000 and result["max_ms"] == 10_000.0 and sum(result["histogram"]) == 10_000
+    assert 3_000 < result["p50_ms"] < 7_000  # sampled, roughly the middle
+
+
+def test_recorder_keeps_aggregates_and_only_the_current_tests_records():
+    recorder = RequestTimingRecorder(max_exported=3)
+    recorder.start_test("t1")
+    recorder(_record("/contacts", 5.0))
+    recorder(_record("/contacts/{id}", 30.0))
+    assert [r["path"] for r in recorder.for_test("t1")] == ["/contacts", "/contacts/{id}"]
+
+    recorder.start_test("t2")
+    recorder.phase = "call"
+    recorder(_record("/contacts", 15.0))
+    recorder(_record("/contacts", 25.0))
+    assert recorder.for_test("t1") == [] and len(recorder.for_test("t2")) == 2
+
+    exported = recorder.to_json()
+    assert exported["endpoints"]["GET /contacts"]["count"] == 3
+    assert exported["tests"] == {"t1": {"setup": 35.0}, "t2": {"call": 40.0}}
+    assert len(exported["requests"]) == 3 and exported["requests_dropped"] == 1
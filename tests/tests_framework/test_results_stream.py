@@ -0,0 +1,82 @@
+import json
+
+from tests.plugins.results_stream import ResultsWriter
+from tests.report.render import render_html
+
+
+class FakeReport:
+    def __init__(self, nodeid, when, outcome="passed", duration=0.1, longreprtext="", sections=(), **extra):
+        self.nodeid = nodeid
+        self.when = when
+        self.duration = duration
+        self.passed = outcome == "passed"
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+        self.longrepr = None
+        self.longreprtext = longreprtext
+        self.sections = list(sections)
+        self.__dict__.update(extra)
+
+
+def run_test(writer, nodeid, call_outcome="passed", **call_extra):
+    writer.add(FakeReport(nodeid, "setup"))
+    writer.add(FakeReport(nodeid, "call", call_outcome, **call_extra))
+    writer.add(FakeReport(nodeid, "teardown"))
+
+
+def test_one_line_per_test_written_at_teardown(tmp_path):
+    writer = ResultsWriter(tmp_path / "results.jsonl", capture_limit=100)
+    run_test(writer, "t.py::ok")
+    writer.add(FakeReport("t.py::bad", "setup"))
+    assert len(writer.path.read_text().splitlines()) == 1  # flushed as soon as a test finishes
+
+    request = {"phase": "call", "method": "GET", "path": "/contacts/{id}", "status": 404, "error": None, "duration_ms": 3.0}
+    writer.add(
+        FakeReport(
+            "t.py::bad", "call", "failed", longreprtext="x" * 500, sections=[("Captured stdout call", "HTTP 404")],
+            results_requests=[request],
+        )
+    )
+    writer.add(FakeReport("t.py::bad", "teardown"))
+    writer.close()
+
+    ok, bad = (json.loads(line) for line in writer.path.read_text().splitlines())
+    assert ok["outcome"] == "passed" and set(ok["phases"]) == {"setup", "call", "teardown"} and "captured" not in ok
+    assert bad["outcome"] == "failed" and bad["failed_in"] == "call" and bad["requests"] == [request]
+    assert bad["longrepr"].startswith("x" * 100) and "400 more characters truncated" in bad["longrepr"]
+    assert "HTTP 404" in bad["captured"]
+
+
+def test_html_is_rendered_from_the_stream(tmp_path):
+    writer = ResultsWriter(tmp_path / "results.jsonl")
+    run_test(writer, "t.py::ok")
+    run_test(writer, "t.py::<bad>", "failed", longreprtext="AssertionError: <boom>")
+    writer.add(FakeReport("t.py::cut", "setup"))
+    writer.close()
+    with open(writer.path, "a", encoding="utf-8") as f:
+        f.write('{"nodeid": "t.py::half-writ')  # run killed mid-line
+
+    assert render_html(writer.path, tmp_path / "report.html") == 3
+    page = (tmp_path / "report.html").read_text()
+    assert "1 failed" in page and "1 interrupted" in page and "1 passed" in page
+    assert "AssertionError: &lt;boom&gt;" in page and "t.py::&lt;bad&gt;" in page
+
+
+def test_html_shows_request_timings_per_endpoint_and_per_test(tmp_path):
+    writer = ResultsWriter(tmp_path / "results.jsonl")
+
+    def request(path, ms):
+        return {"phase": "call", "method": "GET", "path": path, "status": 200, "error": None, "duration_ms": ms,
+                "request_bytes": 0, "response_bytes": 120}
+
+    run_test(writer, "t.py::one", results_requests=[request("/contacts/{id}", 5.0), request("/contacts/{id}", 30.0)])
+    run_test(writer, "t.py::two", results_requests=[request("/contacts", 700.0)])
+    writer.close()
+
+    render_html(writer.path, tmp_path / "report.html")
+    page = (tmp_path / "report.html").read_text()
+    summary = page[page.index("<h2>HTTP request timings</h2>"):page.index("<th>outcome</th>")]
+    assert "<td>GET /contacts/{id}</td><td>2</td><td>35.0</td><td>5.0</td><td>30.0</td><td>30.0</td>" in summary
+    assert "<td>GET /contacts</td><td>1</td>" in summary
+    # passing tests expand to their own request table
+    assert page.count("<b>HTTP requests (") == 2 and "<b>HTTP requests (2, 35.0 ms)</b>" in page
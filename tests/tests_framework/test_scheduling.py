@@ -0,0 +1,48 @@
+from tests.plugins.scheduling import DURATIONS_KEY, estimate, longest_first, pytest_collection_modifyitems
+
+
+def test_unknown_tests_get_the_mean_known_duration():
+    expected = estimate(["a", "b", "c"], {"a": 1.0, "b": 3.0, "gone": 100.0})
+    assert expected == {"a": 1.0, "b": 3.0, "c": 2.0}
+
+
+def test_longest_first_is_stable_for_ties():
+    expected = {"a": 1.0, "b": 5.0, "c": 1.0, "d": 2.0}
+    assert longest_first(["a", "b", "c", "d"], expected) == ["b", "d", "a", "c"]
+
+
+class FakeCache:
+    def __init__(self, history):
+        self.history = history
+
+    def get(self, key, default):
+        return self.history if key == DURATIONS_KEY else default
+
+
+class FakeConfig:
+    def __init__(self, history, worker=False, schedule="auto"):
+        self.cache = FakeCache(history)
+        self.schedule = schedule
+        if worker:
+            self.workerinput = {"workerid": "gw0"}
+
+    def getoption(self, name):
+        return self.schedule
+
+
+class FakeItem:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+def order_of(config):
+    items = [FakeItem(n) for n in ("a.py::fast", "a.py::slow", "b.py::medium")]
+    pytest_collection_modifyitems(None, config, items)
+    return [item.nodeid for item in items]
+
+
+def test_only_xdist_workers_reorder():
+    history = {"a.py::fast": 0.1, "a.py::slow": 3.0, "b.py::medium": 1.0}
+    assert order_of(FakeConfig(history, worker=True)) == ["a.py::slow", "b.py::medium", "a.py::fast"]
+    assert order_of(FakeConfig(history, worker=True, schedule="off")) == ["a.py::fast", "a.py::slow", "b.py::medium"]
+    assert order_of(FakeConfig(history)) == ["a.py::fast", "a.py::slow", "b.py::medium"]  # serial: collection order
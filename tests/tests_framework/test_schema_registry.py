@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from tests.tests_api.helpers.schema_registry import (
+    SchemaRegistry,
+    SchemaValidationError,
+    get_schema_registry,
+    validate_response,
+)
+
+CONTACT = {"_id": "c1", "firstName": "Ada", "lastName": "Lovelace", "owner": "u1", "email": "ada@example.com"}
+
+
+def test_registry_and_validators_are_built_once_and_reused():
+    registry = get_schema_registry()
+    assert get_schema_registry() is registry
+
+    validator = registry._validators["contact_schema.json"]
+    validate_response("contact", CONTACT)
+    registry.validate("contact_schema.json", CONTACT)
+    assert registry._validators["contact_schema.json"] is validator
+
+
+def test_schemas_resolve_by_short_name_or_file_name():
+    registry = get_schema_registry()
+    assert {"contact", "contact_list", "login"} <= set(registry.names)
+    assert registry.schema("contact") is registry.schema("contact_schema.json")
+
+    with pytest.raises(KeyError, match="known schemas"):
+        registry.validate("nope", {})
+
+
+def test_refs_between_schema_files_are_followed():
+    registry = get_schema_registry()
+    registry.validate("contact_list", [CONTACT, CONTACT])
+
+    broken = dict(CONTACT)
+    del broken["owner"]
+    with pytest.raises(SchemaValidationError, match="owner") as excinfo:
+        registry.validate("contact_list", [CONTACT, broken])
+    assert excinfo.value.schema_name == "contact_list" and excinfo.value.path == [1]
+
+
+def test_formats_are_checked_and_errors_lists_every_problem():
+    registry = get_schema_registry()
+    bad = dict(CONTACT, birthdate="2020-13-45", firstName=1)
+    assert sorted(e.validator for e in registry.errors("contact", bad)) == ["format", "type"]
+    assert registry.errors("contact", CONTACT) == []
+
+
+def test_a_registry_can_be_built_from_another_directory(tmp_path):
+    (tmp_path / "item_schema.json").write_text(json.dumps({"$id": "item_schema.json", "type": "integer"}))
+    (tmp_path / "bag.json").write_text(json.dumps({"type": "array", "items": {"$ref": "item_schema.json"}}))
+
+    registry = SchemaRegistry(tmp_path)
+    assert registry.names == ["bag", "item"]
+    registry.validate("bag", [1, 2])
+    assert len(registry.errors("bag", [1, "x", "y"])) == 2
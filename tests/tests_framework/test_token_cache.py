@@ -0,0 +1,142 @@
+import base64
+import json
+import threading
+import time
+
+from tests.tests_api.clients.api_client import ApiClient
+from tests.tests_api.helpers.token_cache import TokenCache, TokenRefresher, jwt_expiry
+
+
+def make_jwt(exp=None, sub="user"):
+    claims = {"sub": sub} if exp is None else {"sub": sub, "exp": exp}
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload}.signature"
+
+
+class Logins:
+    """login() stand-in handing out new tokens and counting the calls."""
+
+    def __init__(self, ttl=3600.0, delay=0.0):
+        self.ttl = ttl
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return make_jwt(time.time() + self.ttl, sub=f"login{self.calls}")
+
+
+def test_token_is_reused_until_the_refresh_margin(tmp_path):
+    cache = TokenCache(tmp_path, refresh_margin=300)
+    long_lived = Logins(ttl=3600)
+    token = cache.get_token("a@x.io", "http://api/", long_lived)
+    assert jwt_expiry(token) is not None
+    assert cache.get_token("a@x.io", "http://api", long_lived) == token and long_lived.calls == 1
+
+    # expires inside the margin: every call logs in again
+    short_lived = Logins(ttl=200)
+    first = cache.get_token("b@x.io", "http://api", short_lived)
+    assert cache.get_token("b@x.io", "http://api", short_lived) != first and short_lived.calls == 2
+
+
+def test_parallel_callers_log_in_once(tmp_path):
+    login = Logins(delay=0.2)
+    tokens = []
+
+    def worker():
+        # one TokenCache per thread, like separate xdist workers sharing the directory
+        tokens.append(TokenCache(tmp_path).get_token("a@x.io", "http://api", login))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert login.calls == 1 and len(set(tokens)) == 1
+
+
+def test_rejected_token_is_replaced_by_one_login(tmp_path):
+    cache = TokenCache(tmp_path)
+    login = Logins()
+    revoked = cache.get_token("a@x.io", "http://api", login)
+
+    fresh = cache.get_token("a@x.io", "http://api", login, rejected=revoked)
+    assert fresh != revoked and login.calls == 2
+    # the replacement is cached; a second worker reporting the same revoked token gets it too
+    assert cache.get_token("a@x.io", "http://api", login) == fresh
+    assert TokenCache(tmp_path).get_token("a@x.io", "http://api", login, rejected=revoked) == fresh and login.calls == 2
+
+
+def test_refresher_logs_in_again_only_for_tracked_tokens(tmp_path):
+    cache = TokenCache(tmp_path)
+    login = Logins()
+    session = cache.get_token("a@x.io", "http://api", login)
+    refresher = TokenRefresher(cache)
+
+    assert refresher.refresh("someone-elses-token") is None and login.calls == 1
+    refresher.track(session, "a@x.io", "http://api", login)
+    fresh = refresher.refresh(session)
+    assert fresh and fresh != session and login.calls == 2
+    assert refresher.refresh(session) == fresh and login.calls == 2  # already replaced
+    assert refresher.current(session) == fresh and refresher.current("other") == "other"
+    assert cache.get_token("a@x.io", "http://api", login) == fresh
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+        self.status_text = ""
+        self.url = ""
+        self.headers = {}
+
+    def body(self):
+        return b""
+
+    def dispose(self):
+        pass
+
+
+class RevokingContext:
+    """Request context answering 401 for revoked tokens."""
+
+    def __init__(self, revoked):
+        self.revoked = set(revoked)
+        self.revoke_all = False
+        self.sent = []
+
+    def fetch(self, url, method="GET", headers=None, **kwargs):
+        token = (headers or {}).get("Authorization", "").removeprefix("Bearer ")
+        self.sent.append(token)
+        return FakeResponse(401 if self.revoke_all or token in self.revoked else 200)
+
+
+def test_api_client_retries_a_401_once_with_the_refreshed_token():
+    login = Logins()
+    session = login()
+    refresher = TokenRefresher()
+    refresher.track(session, "a@x.io", "http://api", login)
+    ctx = RevokingContext([session])
+    client = ApiClient(ctx, auth=refresher)
+
+    assert client.get("/contacts", token=session).status == 200
+    fresh = refresher.current(session)
+    assert ctx.sent == [session, fresh] and login.calls == 2
+    # later calls with the old token go straight out with the new one
+    assert client.get("/contacts", token=session).status == 200 and ctx.sent[-1] == fresh
+
+    # untracked tokens keep their 401
+    ctx.revoked.add("bad")
+    assert client.get("/contacts", token="bad").status == 401 and ctx.sent[-1] == "bad" and login.calls == 2
+
+    # a new token that is rejected as well: one refresh and one resend, then the 401 is returned
+    ctx.revoke_all = True
+    sent = len(ctx.sent)
+    assert client.get("/contacts", token=session).status == 401
+    assert login.calls == 3 and len(ctx.sent) == sent + 2
+
+
+def test_failed_login_caches_nothing(tmp_path):
+    cache = TokenCache(tmp_path)
+    assert cache.get_token("a@x.io", "http://api", lambda: None) is None
+    assert list(tmp_path.glob("*.json")) == []
@@ -0,0 +1,29 @@
+import pytest
+
+from tests import config
+from tests.factories import generate_contact_payload
+
+
+@pytest.mark.parametrize("env, expected", [(None, "master"), ("gw3", "gw3")])
+def test_worker_id_follows_pytest_xdist(monkeypatch, env, expected):
+    if env is None:
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    else:
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", env)
+    assert config.worker_id() == expected
+
+
+def test_worker_user_emails_are_plus_addressed():
+    assert config.worker_user_email("qa@example.com", "gw0") == "qa+gw0@example.com"
+    assert config.worker_user_email("qa@example.com", "gw1") != config.worker_user_email("qa@example.com", "gw0")
+
+
+def test_generated_contacts_carry_the_worker_namespace(monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    payload = generate_contact_payload()
+    assert payload["firstName"].startswith("Testtestgw2") and payload["email"].startswith("testgw2")
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "master")
+    assert len(generate_contact_payload()["email"].partition("@")[0]) == len("test") + 8  # no namespace
+    assert generate_contact_payload(namespace="ns")["email"].startswith("testns")
+    assert generate_contact_payload(overrides={"email": "x@example.com"}, namespace="ns")["email"] == "x@example.com"
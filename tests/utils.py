@@ -1,12 +1,19 @@
 import json
-from typing import Any, Dict, Optional
-from playwright.sync_api import Response
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+if TYPE_CHECKING:  # keep Playwright out of import time
+    from playwright.sync_api import APIResponse
+    from tests.tests_api.clients.response import ApiResponse
+
+# ApiClient returns ApiResponse (cached body/JSON); raw Playwright responses work too
+Response = Union["ApiResponse", "APIResponse"]
 
 
 def safe_json(resp: Response) -> Optional[Any]:
     """
     Try to parse the response body as JSON. On failure return None.
     Use this to avoid exceptions when the API returns HTML or empty bodies on error.
+    With an ApiResponse the body is parsed at most once, however often this is called.
     """
     try:
         return resp.json()
@@ -39,7 +46,8 @@ def text_or_json(resp: Response) -> str:
 
 def pretty_resp(resp: Response, show_headers: bool = True) -> None:
     """
-    Print a concise, helpful dump of a Playwright Response for debugging.
+    Print a concise, helpful dump of a Playwright Response for ad-hoc debugging.
+    Failing tests get the full request history without it (tests/plugins/request_capture.py).
     Example output:
       STATUS: 200
       HEADERS: {...}
@@ -62,18 +70,16 @@ def pretty_resp(resp: Response, show_headers: bool = True) -> None:
 
 def assert_status(resp: Response, expected: int) -> None:
     """
-    Assert the response status is the expected value. On failure show a helpful dump.
+    Assert the response status is the expected value. Responses from the fixture clients
+    are shown in the failure report's "HTTP requests" section (tests/plugins/request_capture.py).
     """
     if resp.status != expected:
-        # Print helpful details and raise AssertionError
-        pretty_resp(resp)
-        raise AssertionError(f"Expected status {expected}, got {resp.status}")
+        raise AssertionError(f"Expected status {expected}, got {resp.status} from {resp.url}")
 
 
 def assert_ok(resp: Response) -> None:
     """
-    Assert the response is a 2xx. On failure print helpful details.
+    Assert the response is a 2xx (see assert_status for where the details go).
     """
     if not (200 <= resp.status < 300):
-        pretty_resp(resp)
-        raise AssertionError(f"Expected 2xx response, got {resp.status}")
+        raise AssertionError(f"Expected 2xx response, got {resp.status} from {resp.url}")